@@ -0,0 +1,84 @@
+"""
+Microbenchmark: logging overhead per `BasePage.click_element` call.
+
+Compares the f-string messages BasePage used to build on every interaction with the
+structured key/value events it logs now, and with QUIET_HOT_PATH. The driver is a no-op
+stand-in, so the numbers are the page object's own cost per click. Each variant runs at
+INFO (the default, where the per-click debug event is filtered out) and at DEBUG (where
+it is rendered and handed to a null handler).
+
+Usage:
+    python -m benchmarks.bench_click_logging [--calls N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import timeit
+from typing import Any
+
+from src.config.logging_config import configure_logging
+from src.pages.base.base_page import BasePage, _quiet_logger
+from src.pages.base.locator import Locator
+
+BUTTON = Locator("#content button.added-manually")
+
+
+class _NoOpCase:
+    """Stand-in for the SeleniumBase test case: every command returns immediately."""
+
+    driver = object()
+
+    def click(self, selector: str, by: str) -> None:
+        pass
+
+
+class LegacyPage(BasePage):
+    def click_element(self, locator: Locator) -> None:
+        """`BasePage.click_element` before structured logging: the message is formatted on every call."""
+        self.invalidate_page_cache()
+        try:
+            self.driver.click(**locator)
+            self.logger.debug(f"Clicked on element with locator '{locator}'.")
+            return
+        except Exception as e:
+            self.logger.error(f"Failed to click element '{locator}': {str(e)}")
+            raise
+
+
+def _configure(level: str) -> None:
+    configure_logging(level)
+    root = logging.getLogger()
+    root.handlers.clear()  # Measure building and rendering events, not console or file I/O
+    root.addHandler(logging.NullHandler())
+
+
+def _pages() -> dict[str, BasePage]:
+    case: Any = _NoOpCase()
+    quiet = BasePage(case)
+    quiet.hot_path_logger = _quiet_logger(BasePage.__name__)
+    return {"f-string (before)": LegacyPage(case), "structured": BasePage(case), "quiet hot path": quiet}
+
+
+def measure(page: BasePage, calls: int) -> float:
+    page.click_element(BUTTON)  # Warm up (binds the lazy logger proxy)
+    best = min(timeit.repeat(lambda: page.click_element(BUTTON), number=calls, repeat=5))
+    return best / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100_000, help="click_element calls per run (default: 100000)")
+    args = parser.parse_args()
+
+    print(f"{args.calls} click_element calls per run, best of 5")
+    print(f"{'implementation':<20} {'level':<7} {'ns/call':>10}")
+    for level in ("INFO", "DEBUG"):
+        _configure(level)
+        for name, page in _pages().items():
+            print(f"{name:<20} {level:<7} {measure(page, args.calls):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Microbenchmark: legacy dict `format_locator` vs the precompiled, interned `Locator.format`.
+
+Simulates the hot loops in the page objects (row/index lookups that format the same few
+templates over and over) and reports time per call plus memory retained by the results.
+
+Usage:
+    python -m benchmarks.bench_format_locator [--calls N] [--distinct N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from selenium.webdriver.common.by import By
+
+from src.pages.base.locator import Locator
+
+EDIT_BTN_SELECTOR = "//tbody//tr['{row_num}']//a[(text()='edit')]"
+FIGURE_NAME_SELECTOR = "div.figure:nth-of-type({index}) > .figcaption > h5"
+
+
+def legacy_format_locator(locator: dict[str, str], **kwargs: Any) -> dict[str, str]:
+    """`BasePage.format_locator` before the Locator type: re-parse and rebuild on every call."""
+    formatted_selector = locator["selector"].format(**kwargs)
+    return {"selector": formatted_selector, "by": locator["by"]}
+
+
+def locator_format(locator: Locator, **kwargs: Any) -> Locator:
+    return locator.format(**kwargs)
+
+
+def _workload(distinct: int, calls: int) -> list[int]:
+    return [i % distinct + 1 for i in range(calls)]
+
+
+def _run(formatter: Callable[..., Any], edit_btn: Any, figure_name: Any, values: list[int]) -> list[Any]:
+    results = []
+    for value in values:
+        results.append(formatter(edit_btn, row_num=value))
+        results.append(formatter(figure_name, index=value))
+    return results
+
+
+def measure(
+    name: str, formatter: Callable[..., Any], edit_btn: Any, figure_name: Any, values: list[int]
+) -> dict[str, Any]:
+    _run(formatter, edit_btn, figure_name, values)  # Warm up (fills the intern cache for Locator)
+
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    results = _run(formatter, edit_btn, figure_name, values)
+    retained_bytes, _ = tracemalloc.get_traced_memory()
+    blocks_retained = sys.getallocatedblocks() - blocks_before
+    tracemalloc.stop()
+    distinct_objects = len({id(result) for result in results})
+    del results
+
+    calls = 2 * len(values)
+    repeats = 5
+    best = min(timeit.repeat(lambda: _run(formatter, edit_btn, figure_name, values), number=1, repeat=repeats))
+    return {
+        "name": name,
+        "ns_per_call": best / calls * 1e9,
+        "retained_kib": retained_bytes / 1024,
+        "blocks_retained": blocks_retained,
+        "distinct_objects": distinct_objects,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50_000, help="Iterations per template (default: 50000)")
+    parser.add_argument("--distinct", type=int, default=10, help="Distinct values cycled through (default: 10)")
+    args = parser.parse_args()
+
+    values = _workload(args.distinct, args.calls)
+    rows = [
+        measure(
+            "dict + str.format",
+            legacy_format_locator,
+            {"selector": EDIT_BTN_SELECTOR, "by": By.XPATH},
+            {"selector": FIGURE_NAME_SELECTOR, "by": By.CSS_SELECTOR},
+            values,
+        ),
+        measure(
+            "Locator.format",
+            locator_format,
+            Locator(EDIT_BTN_SELECTOR, By.XPATH),
+            Locator(FIGURE_NAME_SELECTOR),
+            values,
+        ),
+    ]
+
+    print(f"{2 * args.calls} format calls, {args.distinct} distinct values per template")
+    print(f"{'implementation':<20} {'ns/call':>10} {'retained KiB':>14} {'blocks':>10} {'objects':>10}")
+    for row in rows:
+        print(
+            f"{row['name']:<20} {row['ns_per_call']:>10.0f} {row['retained_kib']:>14.1f} "
+            f"{row['blocks_retained']:>10} {row['distinct_objects']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Startup benchmark: MainPage import and per-worker test collection, lazy vs eager page imports.
+
+Every scenario runs in a fresh interpreter (like an xdist worker starting up) and is
+timed end to end; the median of several runs is reported. "eager" imports every page
+module the registry knows before doing the same work, which is what importing MainPage
+cost before pages were resolved lazily. The baseline (UiBaseCase, i.e. SeleniumBase and
+Selenium) is imported by every UI test module either way.
+
+Usage:
+    python -m benchmarks.bench_import_time [--runs N] [--test-file PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+_BASELINE = "import src.pages.base.ui_base_case"
+_MAIN_PAGE = "import src.pages.common.main_page.main_page"
+_EAGER = "import src.pages.registry as registry; registry.import_all()"
+
+
+def _collect(test_file: str, eager: bool = False) -> str:
+    # Pages are imported from a plugin inside the session: importing anything before pytest starts
+    # would also skip pytest's assertion rewriting of the SeleniumBase plugin and skew the result
+    return (
+        "import pytest\n"
+        "class EagerPages:\n"
+        "    def pytest_configure(self, config):\n"
+        f"        {_EAGER}\n"
+        f"plugins = [EagerPages()] if {eager} else []\n"
+        f"pytest.main(['--collect-only', '-q', '-p', 'no:cacheprovider', {test_file!r}], plugins=plugins)"
+    )
+
+
+def measure(code: str, runs: int) -> float:
+    """Median wall time in milliseconds of running `code` in a new interpreter."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter starts per scenario (default: 5)")
+    parser.add_argument(
+        "--test-file",
+        default="tests/ui_test_suite/test_checkboxes.py",
+        help="Test file collected in the collection scenarios (default: tests/ui_test_suite/test_checkboxes.py)",
+    )
+    args = parser.parse_args()
+
+    baseline = measure(_BASELINE, args.runs)
+    rows = [
+        ("baseline (UiBaseCase)", baseline),
+        ("MainPage, lazy", measure(f"{_BASELINE}; {_MAIN_PAGE}", args.runs)),
+        ("MainPage, eager", measure(f"{_BASELINE}; {_MAIN_PAGE}; {_EAGER}", args.runs)),
+        ("collect file, lazy", measure(_collect(args.test_file), args.runs)),
+        ("collect file, eager", measure(_collect(args.test_file, eager=True), args.runs)),
+    ]
+
+    print(f"Median of {args.runs} interpreter starts")
+    print(f"{'scenario':<24} {'ms':>8} {'over baseline':>14}")
+    for name, ms in rows:
+        print(f"{name:<24} {ms:>8.0f} {ms - baseline:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Sets up logging, cleans result/download directories, and defines pytest hooks an
 import logging
 import os
 import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -14,10 +15,16 @@ from filelock import FileLock
 from seleniumbase.fixtures import constants
 
 from src.config import settings
-from src.config.logging_config import configure_logging
+from src.config.logging_config import configure_logging, merge_worker_logs, stop_log_listener
+from src.config.project_config import HttpArchiveModeEnum
+from src.replica import ReplicaServer, create_server
+from src.replica.archive import ArchiveSession, close_archive_session, get_archive_session, merge_archives
+from src.replica.proxy import ArchiveProxy
+from src.utils.browser_contexts import shutdown_shared_chromes
+from src.utils.driver_pool import shutdown_pools
+
+pytest_plugins = ["src.utils.duration_scheduler"]
 
-# Configure root logging once for the test session
-configure_logging()
 logging.getLogger("urllib3.connectionpool").setLevel(logging.ERROR)
 logging.getLogger("selenium.webdriver.remote.remote_connection").setLevel(logging.WARNING)
 logging.getLogger("undetected_chromedriver").setLevel(logging.WARNING)
@@ -46,6 +53,62 @@ def clean_directories_at_start() -> None:
     clean_directory(downloads_dir, worker_id)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def local_replica() -> Iterator[str | None]:
+    """Start the offline replica on a free port and point BASE_URL at it when LOCAL_REPLICA is set."""
+    if not settings.LOCAL_REPLICA:
+        yield None
+        return
+
+    original_base_url = settings.BASE_URL
+    server = create_server().start()
+    settings.BASE_URL = server.base_url
+    try:
+        yield server.base_url
+    finally:
+        settings.BASE_URL = original_base_url
+        server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_archive(request: pytest.FixtureRequest, local_replica: str | None) -> Iterator[ArchiveSession | None]:
+    """
+    Record or replay BASE_URL traffic when HTTP_ARCHIVE_MODE is set.
+
+    Chrome is intercepted over CDP by UiBaseCase; other browsers are pointed at a local
+    recording/replaying proxy. Each xdist worker records to its own part file, which the
+    controller merges into HTTP_ARCHIVE_PATH at the end of the session.
+    """
+    session = get_archive_session()
+    if session is None:
+        yield None
+        return
+
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    archive_path = Path(settings.HTTP_ARCHIVE_PATH)
+    save_to = archive_path.with_name(f"{archive_path.name}.{worker_id}") if worker_id else archive_path
+
+    server = None
+    original_base_url = settings.BASE_URL
+    if request.config.browser != "chrome":  # type: ignore[attr-defined]
+        server = ReplicaServer(ArchiveProxy(str(original_base_url), session)).start()
+        settings.BASE_URL = server.base_url
+    try:
+        yield session
+    finally:
+        if server is not None:
+            settings.BASE_URL = original_base_url
+            server.stop()
+        stats = close_archive_session(save_to)
+        if stats is not None:
+            structlog.get_logger("HttpArchive").info(
+                "HTTP archive summary.",
+                mode=settings.HTTP_ARCHIVE_MODE.value,
+                worker=worker_id or "local",
+                **stats.as_dict(),
+            )
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_configure(config: pytest.Config) -> None:
     """
@@ -54,14 +117,20 @@ def pytest_configure(config: pytest.Config) -> None:
     ensures the Allure results directory is properly managed (cleaned for local runs, preserved in CI/xdist),
     and generates an environment.properties file with relevant test metadata.
     Key actions:
+    - Configures logging for the session (kept out of import time, which must not read settings).
     - Retrieves and sets the browser type (defaulting to settings.BROWSER).
     - Configures headless mode from settings.
-    - For Chrome, sets up a user data directory and adds necessary Chromium arguments.
+    - Enables SeleniumBase session reuse when settings.REUSE_SESSION is set.
+    - For Chrome, sets up a user data directory (unless a driver pool is enabled) and adds
+      necessary Chromium arguments.
     - Manages the Allure results directory: cleans it for non-CI, non-xdist runs; ensures existence otherwise.
     - Writes environment properties including browser, headless mode, base URL, and CI-specific details.
     Args:
         config (pytest.Config): The pytest configuration object to modify.
     """
+    # Configure root logging once for the test session; not at import, which must not read the settings
+    configure_logging()
+
     is_ci_environment = os.environ.get("JENKINS_HOME") or os.environ.get("GITHUB_ACTIONS")
     is_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
     browser = os.environ.get("BROWSER", settings.BROWSER).lower()
@@ -72,8 +141,12 @@ def pytest_configure(config: pytest.Config) -> None:
     config.option.browser = browser
     config.option.headless = settings.HEADLESS
 
-    # Add Chrome arguments for user profile
-    if browser == "chrome" and not is_ci_environment:
+    # One browser per worker for the whole session; UiBaseCase resets its state between tests
+    if settings.REUSE_SESSION:
+        config.option.reuse_session = True
+
+    # Add Chrome arguments for user profile (not with a driver pool: Chrome locks a profile to one browser)
+    if browser == "chrome" and not is_ci_environment and settings.DRIVER_POOL_SIZE == 0:
         user_data_dir = os.path.abspath("chrome_user_data")
         os.makedirs(user_data_dir, exist_ok=True)
 
@@ -141,3 +214,37 @@ def bind_test_context(request: pytest.FixtureRequest) -> None:
             contains information about the current test node.
     """
     structlog.contextvars.bind_contextvars(test_name=request.node.name, browser=settings.BROWSER)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Quit pre-warmed drivers left in this worker's pool and log the pool hit/miss counts.
+    On the xdist controller, merge the archive parts recorded by the workers and stop
+    the Chromes they shared (SHARED_CHROME_CONTEXTS).
+    With ASYNC_LOGGING, every process drains its log queue and the controller merges the
+    per-worker JSONL files into a single time-ordered test_logs.jsonl.
+    """
+    if settings.HTTP_ARCHIVE_MODE == HttpArchiveModeEnum.record and not hasattr(session.config, "workerinput"):
+        archive_path = Path(settings.HTTP_ARCHIVE_PATH)
+        parts = sorted(archive_path.parent.glob(f"{archive_path.name}.gw*"))
+        if parts:
+            merge_archives(parts, archive_path)
+            for part in parts:
+                part.unlink()
+            logging.info(f"Merged {len(parts)} recorded HTTP archive parts into {archive_path}.")
+
+    if settings.SHARED_CHROME_CONTEXTS and not hasattr(session.config, "workerinput"):
+        stopped = shutdown_shared_chromes()
+        if stopped:
+            logging.info(f"Stopped {stopped} shared Chrome process(es).")
+
+    if settings.DRIVER_POOL_SIZE:
+        stats = shutdown_pools()
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER") or "local"
+        structlog.get_logger("DriverPool").info("Driver pool summary.", worker=worker_id, **stats)
+
+    if settings.ASYNC_LOGGING:
+        stop_log_listener()
+        if not hasattr(session.config, "workerinput"):
+            merged = merge_worker_logs(settings.LOG_DIR)
+            logging.info(f"Merged {merged} log records from {settings.LOG_DIR} into test_logs.jsonl.")
@@ -1,3 +1,3 @@
-from .project_config import settings
+from .project_config import PageSettings, get_settings, page_settings, reload_settings, settings
 
-__all__ = ["settings"]
+__all__ = ["PageSettings", "get_settings", "page_settings", "reload_settings", "settings"]
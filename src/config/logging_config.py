@@ -1,11 +1,102 @@
+import atexit
+import heapq
+import json
 import logging
+import os
 import sys
+from collections.abc import Iterator
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from queue import SimpleQueue
+from typing import Any
 
 import structlog
 from pythonjsonlogger import jsonlogger
 
+from .project_config import settings
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder is used without it
+    orjson = None  # type: ignore[assignment]
+
+MERGED_LOG_FILE = "test_logs.jsonl"
+_WORKER_LOG_GLOB = "test_logs.*.jsonl*"
+_WRITE_BUFFER_BYTES = 256 * 1024
+_BATCH_SIZE = 512
+
+_listener: QueueListener | None = None
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes records in batches instead of flushing after each one.
+
+    Records go to a large write buffer that is flushed every `batch_size` records and
+    whenever the feeding queue runs empty (see _BatchingQueueListener), so a burst of
+    log lines costs one write instead of one per line. The file size is tracked from the
+    bytes written rather than with the inherited shouldRollover, whose seek to the end of
+    the file would flush the buffer (and format the record a second time) on every record.
+    """
+
+    def __init__(self, filename: str | Path, max_bytes: int, backup_count: int, batch_size: int = _BATCH_SIZE) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.batch_size = batch_size
+        self._unflushed = 0
+        self._size = 0  # Bytes in the current file, buffered ones included
+
+    def _open(self) -> Any:
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=_WRITE_BUFFER_BYTES)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+            size = len(line) if line.isascii() else len(line.encode("utf-8"))
+            if self.stream is None:
+                self.stream = self._open()
+            # A single record larger than max_bytes still goes to a file of its own
+            if self.maxBytes > 0 and self._size and self._size + size > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(line)
+            self._size += size
+            self._unflushed += 1
+            if self._unflushed >= self.batch_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        super().flush()
+        self._unflushed = 0
+
+
+class _BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers each time it has drained the queue."""
+
+    def __init__(self, records: SimpleQueue[logging.LogRecord], *handlers: logging.Handler) -> None:
+        super().__init__(records, *handlers, respect_handler_level=True)
+        self.records = records
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.records.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.records.get(block)
+
 
 def configure_logging(log_level: str = "INFO") -> None:
+    """
+    Configure stdlib logging and structlog for the test session.
+
+    With ASYNC_LOGGING, callers only enqueue records; a listener thread formats them and
+    writes to the console and to this worker's own rotating JSONL file under LOG_DIR
+    (merged into test_logs.jsonl at the end of the run by merge_worker_logs). Otherwise
+    records are written synchronously to the console and test_logs.jsonl.
+    """
+    stop_log_listener()
     root = logging.getLogger()
     if root.handlers:
         root.handlers.clear()
@@ -17,33 +108,133 @@ def configure_logging(log_level: str = "INFO") -> None:
         datefmt="%H:%M:%S",
     )
     console_handler.setFormatter(console_formatter)
-    root.addHandler(console_handler)
     root.setLevel(log_level)
 
-    # File handler with JSON format for parsing
-    file_handler = logging.FileHandler("test_logs.jsonl")
-    json_formatter = jsonlogger.JsonFormatter(
-        fmt="%(asctime)s %(levelname)s %(name)s %(module)s %(funcName)s %(lineno)d %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    file_handler.setFormatter(json_formatter)
-    root.addHandler(file_handler)
+    if settings.ASYNC_LOGGING:
+        _start_log_listener(root, console_handler)
+    else:
+        root.addHandler(console_handler)
+
+        # File handler with JSON format for parsing
+        file_handler = logging.FileHandler(MERGED_LOG_FILE)
+        json_formatter = jsonlogger.JsonFormatter(
+            fmt="%(asctime)s %(levelname)s %(name)s %(module)s %(funcName)s %(lineno)d %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+        file_handler.setFormatter(json_formatter)
+        root.addHandler(file_handler)
 
-    # Configure structlog with console-friendly output
+    # Configure structlog: colored console output for terminals, compact JSON for CI logs
+    renderer: Any
+    if sys.stdout.isatty():
+        renderer = structlog.dev.ConsoleRenderer(
+            colors=True,
+            exception_formatter=structlog.dev.plain_traceback,
+        )
+    else:
+        renderer = structlog.processors.JSONRenderer(serializer=_dumps)
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
-            structlog.dev.ConsoleRenderer(
-                colors=True,
-                exception_formatter=structlog.dev.plain_traceback,
-            ),
+            renderer,
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(log_level)),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-configure_logging()
+def _start_log_listener(root: logging.Logger, console_handler: logging.Handler) -> None:
+    global _listener
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER") or "local"
+    log_dir = Path(settings.LOG_DIR)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    # Start from empty files; the controller (or a run without xdist) also drops other workers' old files
+    stale = f"test_logs.{worker_id}.jsonl*" if worker_id != "local" else _WORKER_LOG_GLOB
+    for path in log_dir.glob(stale):
+        path.unlink(missing_ok=True)
+
+    file_handler = BatchedRotatingFileHandler(
+        log_dir / f"test_logs.{worker_id}.jsonl", settings.LOG_MAX_BYTES, settings.LOG_BACKUP_COUNT
+    )
+    # `created` keeps sub-second order for merging the workers' files
+    file_handler.setFormatter(
+        jsonlogger.JsonFormatter(
+            fmt="%(created)f %(asctime)s %(levelname)s %(name)s %(module)s %(funcName)s %(lineno)d %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    _listener = _BatchingQueueListener(log_queue, console_handler, file_handler)
+    _listener.start()
+
+
+def stop_log_listener() -> None:
+    """
+    Drain the logging queue, flush the files and switch the root logger to writing synchronously.
+
+    Called when a worker finishes, so its file is complete before the controller merges it;
+    anything logged afterwards still reaches the same handlers.
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    root = logging.getLogger()
+    for queue_handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+        root.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        handler.flush()
+        root.addHandler(handler)
+
+
+def merge_worker_logs(log_dir: str | Path, destination: str | Path = MERGED_LOG_FILE) -> int:
+    """
+    Merge the per-worker JSONL files (rotated backups included) into one time-ordered file.
+
+    Each worker's records are already in time order, so the files are merged as sorted
+    streams without loading them into memory. Returns the number of records written.
+    """
+    streams: dict[str, list[Path]] = {}
+    for path in Path(log_dir).glob(_WORKER_LOG_GLOB):
+        streams.setdefault(path.name.partition(".jsonl")[0], []).append(path)
+    # Oldest first: test_logs.gw0.jsonl.3, ... .1, then test_logs.gw0.jsonl
+    ordered = [sorted(paths, key=_backup_index, reverse=True) for paths in streams.values()]
+
+    written = 0
+    with open(destination, "w", encoding="utf-8") as out:
+        for line in heapq.merge(*(_records(paths) for paths in ordered), key=_created):
+            out.write(line)
+            written += 1
+    return written
+
+
+def _backup_index(path: Path) -> int:
+    suffix = path.name.rpartition(".jsonl")[2]
+    return int(suffix[1:]) if suffix[1:].isdigit() else 0
+
+
+def _records(paths: list[Path]) -> Iterator[str]:
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            yield from (line for line in f if line.strip())
+
+
+def _created(line: str) -> float:
+    try:
+        return float(json.loads(line).get("created", 0.0))
+    except (ValueError, TypeError, AttributeError):
+        return 0.0
+
+
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"), **kwargs)
+
+
+atexit.register(stop_log_listener)
@@ -1,4 +1,7 @@
+from dataclasses import dataclass
 from enum import Enum
+from functools import cache
+from typing import Any, cast
 
 from pydantic import AnyUrl, Field, PositiveInt, field_validator
 from pydantic import SecretStr as PydanticSecretStr
@@ -17,6 +20,28 @@ class BrowserEnum(str, Enum):
     firefox = "firefox"
 
 
+class WaitStrategyEnum(str, Enum):
+    polling = "polling"
+    observer = "observer"
+
+
+class NavigationModeEnum(str, Enum):
+    click = "click"
+    deep_link = "deep_link"
+
+
+class ResourceProfileEnum(str, Enum):
+    full = "full"
+    no_media = "no_media"
+    lean = "lean"
+
+
+class HttpArchiveModeEnum(str, Enum):
+    off = "off"
+    record = "record"
+    replay = "replay"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -35,16 +60,122 @@ class Settings(BaseSettings):
     HEADLESS: bool = Field(default=True, description="Run in headless mode")
     MAXIMIZED: bool = False
     UC_MODE: bool = True
+    REUSE_SESSION: bool = Field(
+        default=False,
+        description="Keep one browser per worker for the whole session and reset its state between tests",
+    )
+    DRIVER_POOL_SIZE: int = Field(
+        default=0,
+        ge=0,
+        le=4,
+        description="Spare Chrome sessions each worker pre-warms in the background (0 disables the pool)",
+    )
+    DRIVER_POOL_MAX_IDLE: PositiveInt = Field(
+        default=300,
+        description="Seconds a pooled driver may sit idle before it is evicted",
+    )
+    SHARED_CHROME_CONTEXTS: int = Field(
+        default=0,
+        ge=0,
+        le=8,
+        description="Workers sharing one Chrome process, each in its own isolated browser context (0 disables)",
+    )
+
+    RESOURCE_PROFILE: ResourceProfileEnum = Field(
+        default=ResourceProfileEnum.full,
+        description=(
+            "Resources the browser does not load: 'full' loads everything, 'no_media' blocks images, fonts "
+            "and media, 'lean' also blocks third-party scripts; tests override it with @pytest.mark.resources"
+        ),
+    )
 
     # Timeouts
     SHORT_TIMEOUT: PositiveInt = Field(default=5, ge=1, le=30)
     LONG_TIMEOUT: PositiveInt = Field(default=15, ge=5, le=60)
 
+    # Wait engine
+    WAIT_STRATEGY: WaitStrategyEnum = Field(
+        default=WaitStrategyEnum.polling,
+        description="'polling' uses SeleniumBase waits; 'observer' resolves in-page via MutationObserver",
+    )
+
+    # Downloads
+    DOWNLOAD_WORKERS: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="Files FilesDownloadPage downloads concurrently over HTTP",
+    )
+
+    # API tests
+    API_CONCURRENCY: int = Field(
+        default=16,
+        ge=1,
+        le=64,
+        description="Requests the API test suite keeps in flight at once",
+    )
+    API_RATE_LIMIT: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Requests per second the API test suite starts at most (0 disables the limit)",
+    )
+
+    # Diagnostics
+    PROFILE_COMMANDS: bool = Field(
+        default=False,
+        description="Record every WebDriver command per test and report a summary at teardown",
+    )
+    COMMAND_PROFILE_DIR: str = Field(
+        default="reports/command-profiles",
+        description="Directory for per-worker command profile JSONL files",
+    )
+
+    # Logging
+    ASYNC_LOGGING: bool = Field(
+        default=False,
+        description="Log through a background queue to batched, rotated per-worker JSONL files under LOG_DIR",
+    )
+    LOG_DIR: str = Field(
+        default="reports/logs",
+        description="Directory for per-worker JSONL log files, merged into test_logs.jsonl at session end",
+    )
+    LOG_MAX_BYTES: PositiveInt = Field(
+        default=20 * 1024 * 1024,
+        description="Size at which a worker's JSONL log file is rotated",
+    )
+    LOG_BACKUP_COUNT: int = Field(
+        default=5,
+        ge=0,
+        description="Rotated JSONL log files kept per worker",
+    )
+    QUIET_HOT_PATH: bool = Field(
+        default=False,
+        description="Drop per-interaction page object logs (clicks, typing, element checks) below WARNING",
+    )
+
+    # Navigation
+    NAVIGATION_MODE: NavigationModeEnum = Field(
+        default=NavigationModeEnum.click,
+        description="'click' follows MainPage links; 'deep_link' opens feature pages by URL",
+    )
+
     # URLs
     BASE_URL: str | AnyUrl = Field(
         default="https://the-internet.herokuapp.com/",
         description="Application Under Test base URL",
     )
+    LOCAL_REPLICA: bool = Field(
+        default=False,
+        description="Serve the application under test from a local replica and point BASE_URL at it",
+    )
+    HTTP_ARCHIVE_MODE: HttpArchiveModeEnum = Field(
+        default=HttpArchiveModeEnum.off,
+        description="'record' captures BASE_URL traffic to HTTP_ARCHIVE_PATH; 'replay' serves it from there",
+    )
+    HTTP_ARCHIVE_PATH: str = Field(
+        default="recordings/base-url.sbhar",
+        description="Archive file written by record runs and memory-mapped by replay runs",
+    )
     ALLURE_SERVER_URL: AnyUrl | None = Field(
         default=None,
         description="Allure Server for report upload (optional in local/CI)",
@@ -89,14 +220,75 @@ class Settings(BaseSettings):
         return v
 
 
-# Singleton instance
-try:
-    settings = Settings()
-except Exception as exc:
-    import structlog
+@dataclass(frozen=True)
+class PageSettings:
+    """Immutable snapshot of the values page objects read, shared by the page objects of a worker."""
+
+    base_url: str
+    short_timeout: int
+    long_timeout: int
+    wait_strategy: WaitStrategyEnum
+    navigation_mode: NavigationModeEnum
+    quiet_hot_path: bool
+    geolocation_lat: float
+    geolocation_lon: float
+    download_workers: int
+
+
+@cache
+def get_settings() -> Settings:
+    """Build the settings on first use (reads .env and validates them) and return that instance from then on."""
+    try:
+        return Settings()
+    except Exception as exc:
+        import structlog
+
+        log = structlog.get_logger(__name__)
+        log.error("Failed to initialize settings:", error=str(exc))
+        raise
+
+
+@cache
+def page_settings() -> PageSettings:
+    """Return this worker's page settings snapshot; rebuilt after `settings` is modified or reloaded."""
+    current = get_settings()
+    return PageSettings(
+        base_url=str(current.BASE_URL),
+        short_timeout=current.SHORT_TIMEOUT,
+        long_timeout=current.LONG_TIMEOUT,
+        wait_strategy=current.WAIT_STRATEGY,
+        navigation_mode=current.NAVIGATION_MODE,
+        quiet_hot_path=current.QUIET_HOT_PATH,
+        geolocation_lat=current.GEOLOCATION_LAT,
+        geolocation_lon=current.GEOLOCATION_LON,
+        download_workers=current.DOWNLOAD_WORKERS,
+    )
+
+
+def reload_settings() -> Settings:
+    """Re-read the environment and .env, dropping overrides made at runtime."""
+    get_settings.cache_clear()
+    page_settings.cache_clear()
+    return get_settings()
+
+
+class _LazySettings:
+    """Stand-in for the Settings instance that builds it on first attribute access."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+        page_settings.cache_clear()  # Page objects created from now on see the override
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
 
-    log = structlog.get_logger(__name__)
-    log.error("Failed to initialize settings:", error=str(exc))
-    raise
+# Module-level accessor; importing this module no longer reads .env or runs validation
+settings = cast(Settings, _LazySettings())
 
-__all__ = ["settings"]
+__all__ = ["PageSettings", "get_settings", "page_settings", "reload_settings", "settings"]
@@ -1,23 +1,48 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import allure
 import structlog
-from selenium.common.exceptions import ElementNotVisibleException, NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    ElementNotVisibleException,
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 from seleniumbase import BaseCase
 
-from src.config import settings
+from src.config import PageSettings, page_settings
+from src.config.project_config import WaitStrategyEnum
+from src.pages.base.content_load import ContentLoad
+from src.pages.base.element_state import ElementState, StateSnapshot
+from src.pages.base.loader_timing import LoaderTiming
+from src.pages.base.locator import Locator
+from src.pages.base.scripts import (
+    AWAIT_LOADER_JS,
+    ELEMENTS_PROPERTIES_JS,
+    OBSERVE_ELEMENT_JS,
+    READ_TABLE_JS,
+    SCROLL_AND_AWAIT_CONTENT_JS,
+    SNAPSHOT_STATES_JS,
+    TRACK_LOADER_JS,
+)
+from src.pages.base.table import TableModel
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from logging import Logger
 
     from pydantic import AnyUrl
 
-    Locator = dict[str, str]
-else:
-    Locator = Any
+    from src.utils.resource_blocking import ResourceKind
+
+# Seconds the driver's script timeout exceeds an in-page wait by
+_SCRIPT_TIMEOUT_MARGIN = 5
 
 
 class BasePage:
@@ -35,6 +60,10 @@ class BasePage:
     8. Utility Methods
     """
 
+    # Resource kinds the page needs even when the test's resource profile blocks them; MainPage
+    # unblocks them (see UiBaseCase.allow_resources) before navigating to the page
+    required_resources: ClassVar[frozenset[ResourceKind]] = frozenset()
+
     # ============================================================================
     # INITIALIZATION
     # ============================================================================
@@ -44,11 +73,22 @@ class BasePage:
         # that pass a logger to `super().__init__`. We derive our structured
         # logger instance below regardless of the passed value.
         self.driver = base_case
+        # The test case's snapshot (per-test overrides) or the worker's shared one; never re-read from settings
+        self.page_config: PageSettings = getattr(base_case, "page_config", None) or page_settings()
         self.actions = ActionChains(self.driver.driver)
         self.logger = structlog.get_logger(self.__class__.__name__).bind(page=self.__class__.__name__)
-        self.short_wait = settings.SHORT_TIMEOUT
-        self.long_wait = settings.LONG_TIMEOUT
-        self.base_url = settings.BASE_URL
+        # Per-interaction events (clicks, typing, element state checks and queries); QUIET_HOT_PATH
+        # keeps only their warnings and errors
+        self.hot_path_logger = (
+            _quiet_logger(self.__class__.__name__) if self.page_config.quiet_hot_path else self.logger
+        )
+        self.short_wait = self.page_config.short_timeout
+        self.long_wait = self.page_config.long_timeout
+        self.base_url: str | AnyUrl = self.page_config.base_url
+        self.wait_strategy = self.page_config.wait_strategy
+        self.loader_timings: list[LoaderTiming] = []
+        self._properties_cache: dict[tuple[str, str, tuple[str, ...]], list[dict[str, Any]]] = {}
+        self._table_cache: dict[tuple[str, str], TableModel] = {}
 
     # ============================================================================
     # WAIT METHODS
@@ -76,16 +116,16 @@ class BasePage:
             try:
                 self.driver.wait_for_ready_state_complete()
             except Exception as e:
-                self.logger.debug(f"readyState check failed or timed out: {e}")
+                self.logger.debug("readyState check failed or timed out.", error=str(e))
 
         if indicator_locator:
-            self.logger.info(f"Waiting for page to load with indicator '{indicator_locator}' for {timeout}s.")
-            self.driver.wait_for_element_visible(**indicator_locator, timeout=timeout)
-            self.logger.info(f"Page loaded successfully with indicator '{indicator_locator}'.")
+            self.logger.info("Waiting for page to load.", indicator=indicator_locator, timeout=timeout)
+            self.wait_for_visibility(indicator_locator, timeout=timeout)
+            self.logger.info("Page loaded.", indicator=indicator_locator)
 
     def wait_for_visibility(self, locator: Locator, timeout: int | float | None = None) -> Any:
         """
-        Wait for element to be visible.
+        Wait for element to be visible, using the configured wait strategy.
 
         Args:
             locator: Element locator dict
@@ -98,11 +138,13 @@ class BasePage:
             TimeoutException: If element not visible within timeout
         """
         timeout = timeout or self.short_wait
+        if self.wait_strategy == WaitStrategyEnum.observer:
+            return self._observe_element(locator, "visible", timeout)
         return self.driver.wait_for_element_visible(**locator, timeout=timeout)
 
     def wait_for_invisibility(self, locator: Locator, timeout: int | float | None = None) -> bool:
         """
-        Wait for element to become invisible.
+        Wait for element to become invisible, using the configured wait strategy.
 
         Args:
             locator: Element locator dict
@@ -115,8 +157,55 @@ class BasePage:
             TimeoutException: If element remains visible after timeout
         """
         timeout = timeout or self.short_wait
+        if self.wait_strategy == WaitStrategyEnum.observer:
+            self._observe_element(locator, "invisible", timeout)
+            return True
         return self.driver.wait_for_element_not_visible(**locator, timeout=timeout)
 
+    def _observe_element(self, locator: Locator, condition: str, timeout: int | float) -> Any:
+        """
+        Wait in-page for an element to become visible or invisible.
+
+        A MutationObserver-driven script resolves as soon as the condition holds, so the
+        whole wait costs a single WebDriver command. If the document unloads while waiting
+        (e.g. the wait spans a navigation), the remaining time is spent on a polling wait.
+
+        Args:
+            locator: Element locator dict
+            condition: "visible" or "invisible"
+            timeout: Timeout in seconds
+
+        Returns:
+            WebElement | None: The visible element for "visible", None for "invisible"
+
+        Raises:
+            TimeoutException: If the condition is not met within timeout
+        """
+        payload = {"selector": locator["selector"], "by": locator["by"]}
+        start_time = time.monotonic()
+        try:
+            result = self._execute_async_script(
+                OBSERVE_ELEMENT_JS, payload, condition, int(timeout * 1000), timeout=timeout
+            )
+        except TimeoutException:
+            raise
+        except WebDriverException as e:
+            remaining = max(timeout - (time.monotonic() - start_time), 0.1)
+            self.hot_path_logger.debug(
+                "Observer wait interrupted, polling.", locator=locator, error=e.msg, remaining_s=round(remaining, 2)
+            )
+            if condition == "visible":
+                return self.driver.wait_for_element_visible(**locator, timeout=remaining)
+            self.driver.wait_for_element_not_visible(**locator, timeout=remaining)
+            return None
+
+        if not result or not result.get("met"):
+            raise TimeoutException(f"Element '{locator}' was not {condition} after {timeout}s (observer wait).")
+        self.hot_path_logger.debug(
+            "Observer wait met.", locator=locator, condition=condition, elapsed_ms=round(result["elapsed_ms"])
+        )
+        return result.get("element")
+
     def wait_for_loader(self, locator: Locator, timeout: int | float | None = None) -> bool:
         """
         Wait for loading indicator to appear and disappear.
@@ -135,16 +224,125 @@ class BasePage:
             half_timeout = timeout / 2
             self.driver.wait_for_element_visible(**locator, timeout=half_timeout)
             self.driver.wait_for_element_not_visible(**locator, timeout=half_timeout)
-            self.logger.debug("Loader completed successfully.")
+            self.logger.debug("Loader completed.")
             return True
         except Exception as e:
-            self.logger.warning(f"Loader timeout after {timeout}s: {str(e)}")
+            self.logger.warning("Loader timed out.", timeout=timeout, error=str(e))
             return False
 
+    def start_loader_tracking(self, locator: Locator) -> None:
+        """
+        Install an in-page observer that records when the loader appears and disappears.
+
+        Call this before the action that triggers the loader, then collect the result with
+        `wait_for_tracked_loader`. Installing a new tracker replaces the previous one.
+
+        Args:
+            locator: Loader element locator dict
+        """
+        payload = {"selector": locator["selector"], "by": locator["by"]}
+        self.driver.execute_script(TRACK_LOADER_JS, payload)
+        self.logger.debug("Loader tracking installed.", locator=locator)
+
+    def wait_for_tracked_loader(self, timeout: int | float | None = None) -> LoaderTiming:
+        """
+        Wait for the tracked loader to disappear and return its timings.
+
+        Unlike `wait_for_loader`, the whole timeout is available to the loader cycle and
+        the wait resolves as soon as the loader is gone, even if it vanished before this
+        call. Timings are kept in `loader_timings` and attached to the Allure report.
+
+        Args:
+            timeout: Optional timeout in seconds
+
+        Returns:
+            LoaderTiming: Appear/disappear timestamps; `completed` is False on timeout
+        """
+        timeout = timeout or self.short_wait
+        raw = self._execute_async_script(AWAIT_LOADER_JS, int(timeout * 1000), timeout=timeout)
+        timing = LoaderTiming.from_script_result(raw)
+        self.loader_timings.append(timing)
+
+        metrics = timing.as_metrics()
+        allure.attach(json.dumps(metrics, indent=2), name="Loader timing", attachment_type=allure.attachment_type.JSON)
+        if timing.completed:
+            self.logger.info("Loader completed.", **metrics)
+        else:
+            self.logger.warning("Loader did not complete.", timeout=timeout, **metrics)
+        return timing
+
+    def click_and_wait_for_loader(
+        self, trigger_locator: Locator, loader_locator: Locator, timeout: int | float | None = None
+    ) -> LoaderTiming:
+        """
+        Click an element that triggers a loader and wait for the loader cycle to finish.
+
+        Args:
+            trigger_locator: Locator dict of the element that starts the loader
+            loader_locator: Loader element locator dict
+            timeout: Optional timeout in seconds
+
+        Returns:
+            LoaderTiming: Appear/disappear timestamps of the loader
+        """
+        self.start_loader_tracking(loader_locator)
+        self.click_element(trigger_locator)
+        return self.wait_for_tracked_loader(timeout)
+
+    def scroll_and_wait_for_content(
+        self,
+        locator: Locator,
+        known_count: int | None = None,
+        timeout: int | float | None = None,
+        pending_locator: Locator | None = None,
+    ) -> ContentLoad:
+        """
+        Scroll to the bottom of the page and wait in-page for lazily loaded content.
+
+        The wait resolves as soon as more elements match `locator` than `known_count` and
+        none of the new ones still holds a `pending_locator` placeholder. Scrolling and
+        waiting happen in the same async script, so a scroll is one WebDriver command (see
+        `_execute_async_script` for the one-off script timeout change) and no fixed sleep.
+
+        Args:
+            locator: Locator dict of the elements the page appends
+            known_count: How many matching elements were already seen; None counts them before scrolling
+            timeout: Optional timeout in seconds
+            pending_locator: Optional locator dict of a loading placeholder inside an appended element
+
+        Returns:
+            ContentLoad: Texts of the elements appended past `known_count`; `completed` is False on timeout
+        """
+        timeout = timeout or self.short_wait
+        payload = {"selector": locator["selector"], "by": locator["by"]}
+        pending = {"selector": pending_locator["selector"], "by": pending_locator["by"]} if pending_locator else None
+        result = self._execute_async_script(
+            SCROLL_AND_AWAIT_CONTENT_JS, payload, known_count, pending, int(timeout * 1000), timeout=timeout
+        )
+        load = ContentLoad.from_script_result(result)
+        if load.completed:
+            self.hot_path_logger.debug(
+                "Content loaded after scrolling.",
+                locator=locator,
+                added=len(load.added),
+                elapsed_ms=round(load.elapsed_ms or 0),
+            )
+        elif load.page_grew:
+            self.logger.warning(
+                "Page grew after scrolling, but no new content loaded.", locator=locator, timeout=timeout
+            )
+        else:
+            self.logger.warning("No content loaded after scrolling.", locator=locator, timeout=timeout)
+        return load
+
     def wait_for_file_to_download(self, filename: str, timeout: int | float | None = None) -> bool:
         """
         Wait for file to finish download.
 
+        Uses the test's download watcher when available, so completion is detected on the
+        final rename/close of the file rather than on a polling grid, and partially written
+        `.crdownload`/`.part` files are never mistaken for finished ones.
+
         Args:
             filename: Name of the file to wait for
             timeout: Optional timeout in seconds
@@ -152,10 +350,23 @@ class BasePage:
         Returns:
             bool: True if file download completed, False if timeout
         """
-        import time
-
         timeout = timeout or self.short_wait
-        self.logger.info(f"Waiting for file '{filename}' to download (timeout: {timeout}s).")
+        self.logger.info("Waiting for file to download.", filename=filename, timeout=timeout)
+
+        watcher = getattr(self.driver, "download_watcher", None)
+        if watcher is not None:
+            result = watcher.wait_for_files([filename], timeout).get(filename)
+            if result is None:
+                self.logger.warning("File not downloaded in time.", filename=filename, timeout=timeout)
+                return False
+            self.logger.debug(
+                "File downloaded.",
+                filename=filename,
+                size_bytes=result.size_bytes,
+                elapsed_s=round(result.elapsed_s, 3),
+                throughput_bps=result.throughput_bps,
+            )
+            return True
 
         start_time = time.time()
         poll_interval = 0.5  # Check every 500ms
@@ -164,14 +375,14 @@ class BasePage:
             while time.time() - start_time < timeout:
                 if self.driver.is_downloaded_file_present(filename):
                     elapsed = time.time() - start_time
-                    self.logger.debug(f"File '{filename}' downloaded successfully after {elapsed:.2f}s.")
+                    self.logger.debug("File downloaded.", filename=filename, elapsed_s=round(elapsed, 2))
                     return True
                 time.sleep(poll_interval)
 
-            self.logger.warning(f"File '{filename}' not found after {timeout}s timeout.")
+            self.logger.warning("File not downloaded in time.", filename=filename, timeout=timeout)
             return False
         except Exception as e:
-            self.logger.error(f"Error while waiting for file '{filename}': {str(e)}")
+            self.logger.error("Error while waiting for file.", filename=filename, error=str(e))
             return False
 
     # ============================================================================
@@ -180,19 +391,22 @@ class BasePage:
 
     @allure.step("Navigate to the page")
     def navigate_to(self, url: str) -> None:
-        self.logger.info(f"Navigating to url: {url}.")
+        self.logger.info("Navigating to url.", url=url)
+        self.invalidate_page_cache()
         self.driver.open(url)
         self.logger.info("Navigation completed.")
 
     def refresh_page(self) -> None:
         """Refresh the current page."""
         self.logger.info("Refreshing page.")
+        self.invalidate_page_cache()
         self.driver.refresh()
         self.logger.info("Page refreshed.")
 
     def navigate_back(self) -> None:
         """Navigate back."""
         self.logger.info("Navigating back.")
+        self.invalidate_page_cache()
         self.driver.go_back()
         self.logger.info("Navigation completed.")
 
@@ -212,10 +426,10 @@ class BasePage:
         """
         try:
             self.driver.switch_to_frame(locator["selector"])
-            self.logger.debug(f"Switched to frame with locator '{locator}'.")
+            self.hot_path_logger.debug("Switched to frame.", locator=locator)
             return
         except Exception as e:
-            self.logger.error(f"Failed to switch to frame '{locator}': {str(e)}")
+            self.hot_path_logger.error("Failed to switch to frame.", locator=locator, error=str(e))
             raise
 
     # ============================================================================
@@ -232,12 +446,13 @@ class BasePage:
         Raises:
             Exception: If click fails
         """
+        self.invalidate_page_cache()
         try:
             self.driver.click(**locator)
-            self.logger.debug(f"Clicked on element with locator '{locator}'.")
+            self.hot_path_logger.debug("Clicked element.", locator=locator)
             return
         except Exception as e:
-            self.logger.error(f"Failed to click element '{locator}': {str(e)}")
+            self.hot_path_logger.error("Failed to click element.", locator=locator, error=str(e))
             raise
 
     def send_keys_to_element(self, locator: Locator, text: str) -> None:
@@ -251,13 +466,14 @@ class BasePage:
         Raises:
             Exception: If send keys fails
         """
-        self.logger.info(f"Sending keys '{text}' to element '{locator}'.")
+        self.hot_path_logger.info("Sending keys.", locator=locator, text=text)
+        self.invalidate_page_cache()
         try:
             self.driver.type(text=text, **locator)
-            self.logger.debug(f"Sent keys to '{locator}'.")
+            self.hot_path_logger.debug("Sent keys.", locator=locator)
             return
         except Exception as e:
-            self.logger.error(f"Failed to send keys to '{locator}': {str(e)}")
+            self.hot_path_logger.error("Failed to send keys.", locator=locator, error=str(e))
             raise
 
     def perform_right_click(self, locator: Locator) -> None:
@@ -270,14 +486,14 @@ class BasePage:
         Raises:
             Exception: If right-click fails
         """
-        self.logger.info(f"Performing right-click on element '{locator}'.")
+        self.hot_path_logger.info("Performing right-click.", locator=locator)
         try:
             elem = self.wait_for_visibility(locator)
             self.actions.context_click(elem).perform()
-            self.logger.debug(f"Right-clicked on '{locator}'.")
+            self.hot_path_logger.debug("Right-clicked element.", locator=locator)
             return
         except Exception as e:
-            self.logger.error(f"Failed to perform right-click on '{locator}': {str(e)}")
+            self.hot_path_logger.error("Failed to right-click element.", locator=locator, error=str(e))
             raise
 
     def download_file(self, locator: Locator, file_name: str, timeout: int | float | None = None) -> None:
@@ -292,14 +508,14 @@ class BasePage:
         Raises:
             Exception: If download click fails
         """
-        self.logger.info(f"Downloading file '{file_name}'.")
+        self.logger.info("Downloading file.", filename=file_name)
         formatted_locator = self.format_locator(locator, file_name=file_name)
         try:
             self.driver.click(**formatted_locator)
-            self.logger.debug(f"Clicked download link for file: {file_name}")
+            self.logger.debug("Clicked download link.", filename=file_name)
             return
         except Exception as e:
-            self.logger.error(f"Failed to click download link '{formatted_locator}': {str(e)}")
+            self.logger.error("Failed to click download link.", locator=formatted_locator, error=str(e))
             raise
 
     # ============================================================================
@@ -318,12 +534,12 @@ class BasePage:
             # Fast immediate check (no waiting)
             if timeout == 0 and hasattr(self.driver, "is_element_visible"):
                 visible = bool(self.driver.is_element_visible(**locator))
-                self.logger.debug(f"is_element_visible({locator}) -> {visible} (fast)")
+                self.hot_path_logger.debug("is_element_visible", locator=locator, result=visible, waited=False)
                 return visible
 
             # Wait for visibility
-            self.driver.wait_for_element_visible(**locator, timeout=timeout)
-            self.logger.debug(f"is_element_visible({locator}) -> True (waited)")
+            self.wait_for_visibility(locator, timeout=timeout)
+            self.hot_path_logger.debug("is_element_visible", locator=locator, result=True, waited=True)
             return True
 
         except Exception as e:
@@ -331,10 +547,10 @@ class BasePage:
             if isinstance(
                 e, (ElementNotVisibleException, NoSuchElementException, TimeoutException)
             ) or "not visible" in str(e):
-                self.logger.debug(f"is_element_visible({locator}) -> False ({e})")
+                self.hot_path_logger.debug("is_element_visible", locator=locator, result=False, error=str(e))
                 return False
             else:
-                self.logger.error(f"Unexpected error checking visibility for {locator}: {e}")
+                self.hot_path_logger.error("Unexpected error checking visibility.", locator=locator, error=str(e))
                 raise
 
     def is_element_selected(self, locator: Locator, timeout: int | float | None = None) -> bool:
@@ -345,23 +561,23 @@ class BasePage:
         Default: waits up to short_wait (or provided timeout) for visibility then checks selected state.
         """
         timeout = timeout if timeout is not None else self.short_wait
-        self.logger.info(f"Checking selected state for element '{locator}'.")
+        self.hot_path_logger.info("Checking selected state.", locator=locator)
         try:
             if timeout == 0 and hasattr(self.driver, "is_selected"):
                 selected = bool(self.driver.is_selected(**locator))
-                self.logger.debug(f"is_element_selected({locator}) -> {selected} (fast)")
+                self.hot_path_logger.debug("is_element_selected", locator=locator, result=selected, waited=False)
                 return selected
 
             # Wait for visibility then check selected
-            self.driver.wait_for_element_visible(**locator, timeout=timeout)
+            self.wait_for_visibility(locator, timeout=timeout)
             selected = bool(self.driver.is_selected(**locator))
-            self.logger.debug(f"is_element_selected({locator}) -> {selected} (waited)")
+            self.hot_path_logger.debug("is_element_selected", locator=locator, result=selected, waited=True)
             return selected
         except (TimeoutException, NoSuchElementException) as e:
-            self.logger.debug(f"is_element_selected({locator}) -> False ({e})")
+            self.hot_path_logger.debug("is_element_selected", locator=locator, result=False, error=str(e))
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error checking selected state for {locator}: {e}")
+            self.hot_path_logger.error("Unexpected error checking selected state.", locator=locator, error=str(e))
             raise
 
     def is_element_enabled(self, locator: Locator, timeout: int | float | None = None) -> bool:
@@ -372,25 +588,47 @@ class BasePage:
         Default: waits up to short_wait (or provided timeout) for visibility then checks enabled state.
         """
         timeout = timeout if timeout is not None else self.short_wait
-        self.logger.info(f"Checking enabled state for element '{locator}'.")
+        self.hot_path_logger.info("Checking enabled state.", locator=locator)
         try:
             if timeout == 0 and hasattr(self.driver, "is_element_enabled"):
                 enabled = bool(self.driver.is_element_enabled(**locator))
-                self.logger.debug(f"is_element_enabled({locator}) -> {enabled} (fast)")
+                self.hot_path_logger.debug("is_element_enabled", locator=locator, result=enabled, waited=False)
                 return enabled
 
             # Wait for visibility then check enabled
-            self.driver.wait_for_element_visible(**locator, timeout=timeout)
+            self.wait_for_visibility(locator, timeout=timeout)
             enabled = bool(self.driver.is_element_enabled(**locator))
-            self.logger.debug(f"is_element_enabled({locator}) -> {enabled} (waited)")
+            self.hot_path_logger.debug("is_element_enabled", locator=locator, result=enabled, waited=True)
             return enabled
         except (TimeoutException, NoSuchElementException) as e:
-            self.logger.debug(f"is_element_enabled({locator}) -> False ({e})")
+            self.hot_path_logger.debug("is_element_enabled", locator=locator, result=False, error=str(e))
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error checking enabled state for {locator}: {e}")
+            self.hot_path_logger.error("Unexpected error checking enabled state.", locator=locator, error=str(e))
             raise
 
+    def snapshot_states(self, locators: Sequence[Locator]) -> StateSnapshot:
+        """
+        Capture the state of several elements with a single script execution.
+
+        For each locator, the first matching element is inspected for visibility,
+        selection, enabled state, visible text and bounding box. Missing elements
+        are reported with `count == 0` instead of raising.
+
+        Args:
+            locators: Element locator dicts, in the order results should be returned
+
+        Returns:
+            StateSnapshot: One ElementState per locator, in input order
+        """
+        payload = [{"selector": loc["selector"], "by": loc["by"]} for loc in locators]
+        raw_states = self.driver.execute_script(SNAPSHOT_STATES_JS, payload)
+        snapshot = StateSnapshot(
+            tuple(ElementState.from_script_result(loc, raw) for loc, raw in zip(locators, raw_states))
+        )
+        self.hot_path_logger.debug("snapshot_states captured in one round trip.", locators=len(payload))
+        return snapshot
+
     # ============================================================================
     # ELEMENT QUERY METHODS
     # ============================================================================
@@ -411,14 +649,14 @@ class BasePage:
         """
         timeout = timeout or self.long_wait
 
-        self.logger.debug(f"Waiting for '{locator}' visibility.")
+        self.hot_path_logger.debug("Waiting for visibility.", locator=locator)
         try:
-            self.driver.wait_for_element_visible(**locator, timeout=timeout)
+            self.wait_for_visibility(locator, timeout=timeout)
             text = self.driver.get_text(**locator)
-            self.logger.debug(f"Retrieved text: '{text}'.")
+            self.hot_path_logger.debug("Retrieved text.", locator=locator, text=text)
             return text
         except Exception as e:
-            self.logger.error(f"Failed to get text for '{locator}': {str(e)}")
+            self.hot_path_logger.error("Failed to get text.", locator=locator, error=str(e))
             raise
 
     def get_all_elements(self, locator: Locator) -> list:
@@ -435,7 +673,7 @@ class BasePage:
             elements = self.driver.find_elements(**locator)
             return elements
         except Exception:
-            self.logger.debug(f"No elements found with locator {locator}.")
+            self.hot_path_logger.debug("No elements found.", locator=locator)
             return []
 
     def get_number_of_elements(self, locator: Locator) -> int:
@@ -448,10 +686,10 @@ class BasePage:
         Returns:
             int: Number of matching elements
         """
-        self.logger.info(f"Counting elements with locator: '{locator}'.")
+        self.hot_path_logger.info("Counting elements.", locator=locator)
         elements = self.get_all_elements(locator)
         count = len(elements)
-        self.logger.debug(f"Found {count} elements with locator '{locator}'.")
+        self.hot_path_logger.debug("Counted elements.", locator=locator, count=count)
         return count
 
     def get_element_attr(self, locator: Locator, attribute: str) -> Any | None:
@@ -467,12 +705,69 @@ class BasePage:
         """
         try:
             result = self.driver.get_attribute(**locator, attribute=attribute)
-            self.logger.debug(f"Retrieved {attribute}={result} for element.")
+            self.hot_path_logger.debug("Retrieved attribute.", locator=locator, attribute=attribute, value=result)
             return result
         except Exception as e:
-            self.logger.error(f"Failed to get {attribute}: {str(e)}")
+            self.hot_path_logger.error("Failed to get attribute.", locator=locator, attribute=attribute, error=str(e))
             return None
 
+    def get_elements_properties(
+        self, locator: Locator, properties: Sequence[str], use_cache: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Read DOM properties of every element matching the locator in one script execution.
+
+        Results are memoized for the current page load: navigation and interaction methods
+        on this page object invalidate the cache, or call `invalidate_page_cache()` after
+        changing the DOM by other means.
+
+        Args:
+            locator: Element locator dict
+            properties: DOM property names, e.g. ["naturalWidth", "src"]. Missing properties
+                fall back to the attribute of the same name.
+            use_cache: Return the memoized result for this page load when available
+
+        Returns:
+            list[dict]: One dict of property values per matching element, in document order
+        """
+        key = (locator["selector"], locator["by"], tuple(properties))
+        if use_cache and key in self._properties_cache:
+            self.hot_path_logger.debug("get_elements_properties served from page cache.", locator=locator)
+            return self._properties_cache[key]
+
+        payload = {"selector": locator["selector"], "by": locator["by"]}
+        results: list[dict[str, Any]] = self.driver.execute_script(ELEMENTS_PROPERTIES_JS, payload, list(properties))
+        self._properties_cache[key] = results
+        self.hot_path_logger.debug(
+            "Retrieved element properties.", locator=locator, properties=properties, elements=len(results)
+        )
+        return results
+
+    def get_table(self, locator: Locator, use_cache: bool = True) -> TableModel:
+        """
+        Read the header and body cell texts of the table matching the locator in one script execution.
+
+        Like `get_elements_properties`, the result is memoized for the current page load and
+        dropped by navigation and interaction methods or `invalidate_page_cache()`.
+
+        Args:
+            locator: Locator of the table element; the first match is read
+            use_cache: Set to False to force a fresh read
+
+        Returns:
+            TableModel: The table's texts, empty if no table matches
+        """
+        key = (locator["selector"], locator["by"])
+        if use_cache and key in self._table_cache:
+            self.hot_path_logger.debug("get_table served from page cache.", locator=locator)
+            return self._table_cache[key]
+
+        payload = {"selector": locator["selector"], "by": locator["by"]}
+        table = TableModel.from_script_result(self.driver.execute_script(READ_TABLE_JS, payload))
+        self._table_cache[key] = table
+        self.hot_path_logger.debug("Read table.", locator=locator, columns=len(table.headers), rows=len(table.rows))
+        return table
+
     def get_base_url(self) -> str | AnyUrl:
         """
         Get the base URL from configuration.
@@ -481,23 +776,56 @@ class BasePage:
             str: Base URL
         """
         url = self.base_url
-        self.logger.debug(f"Base URL: {url}")
+        self.logger.debug("Base URL.", url=url)
         return url
 
     # ============================================================================
     # UTILITY METHODS
     # ============================================================================
 
+    def _execute_async_script(self, script: str, *args: Any, timeout: int | float) -> Any:
+        """
+        Execute an asynchronous script with arguments on the underlying WebDriver.
+
+        The driver's script timeout must exceed `timeout` by a small margin so the in-page
+        timer always fires first. It is only ever raised, and the value is remembered on the
+        driver, so a wait costs one WebDriver command rather than a read, set and restore of
+        the timeout around every script.
+        """
+        web_driver = self.driver.driver
+        required = timeout + _SCRIPT_TIMEOUT_MARGIN
+        if getattr(web_driver, "_async_script_timeout", 0) < required:
+            web_driver.set_script_timeout(required)
+            web_driver._async_script_timeout = required
+        return web_driver.execute_async_script(script, *args)
+
+    def invalidate_page_cache(self) -> None:
+        """Drop results memoized for the current page load."""
+        self._properties_cache.clear()
+        self._table_cache.clear()
+
     def format_locator(self, locator: Locator, **kwargs: Any) -> Locator:
         """
         Format a locator's selector string with provided keyword arguments and return the updated locator.
 
+        The selector template is parsed once when the Locator is created, and formatted
+        results are interned, so calling this in a loop with repeating values does not
+        allocate a new locator per call. Legacy dict locators are accepted and converted.
+
         Args:
-            locator: Original locator dict with 'selector' and 'by' keys.
+            locator: Original locator with 'selector' and 'by' keys.
             **kwargs: Keyword arguments for formatting the selector string.
 
         Returns:
-            Locator: Updated locator dict with the formatted selector.
+            Locator: Locator with the formatted selector.
         """
-        formatted_selector = locator["selector"].format(**kwargs)
-        return {"selector": formatted_selector, "by": locator["by"]}
+        return Locator.from_mapping(locator).format(**kwargs)
+
+
+def _quiet_logger(name: str) -> Any:
+    """Logger for `name` with the configured processors that drops events below WARNING."""
+    return structlog.wrap_logger(
+        None,
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+        logger_factory_args=(name,),
+    ).bind(page=name)
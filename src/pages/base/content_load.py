@@ -0,0 +1,29 @@
+"""
+Module containing the result of a BasePage scroll-and-wait for lazily loaded content.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ContentLoad:
+    """What a scroll loaded: the texts of the new elements, or why nothing was returned."""
+
+    completed: bool  # New, fully loaded elements arrived; False means the wait timed out
+    added: tuple[str, ...] = ()
+    page_grew: bool = False  # The document got taller, whether or not new elements arrived
+    elapsed_ms: float | None = None
+
+    @classmethod
+    def from_script_result(cls, raw: dict[str, Any] | None) -> ContentLoad:
+        if not raw:
+            return cls(completed=False)
+        return cls(
+            completed=bool(raw.get("met")),
+            added=tuple(raw.get("added") or ()),
+            page_grew=bool(raw.get("grew")),
+            elapsed_ms=raw.get("elapsed_ms"),
+        )
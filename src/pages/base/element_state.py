@@ -0,0 +1,68 @@
+"""
+Module containing typed results for batched element-state queries.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ElementRect:
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+@dataclass(frozen=True)
+class ElementState:
+    locator: Any
+    count: int
+    visible: bool
+    selected: bool
+    enabled: bool
+    text: str
+    rect: ElementRect | None
+
+    @property
+    def present(self) -> bool:
+        return self.count > 0
+
+    @classmethod
+    def from_script_result(cls, locator: Any, raw: dict[str, Any]) -> ElementState:
+        rect = raw.get("rect")
+        return cls(
+            locator=locator,
+            count=int(raw.get("count", 0)),
+            visible=bool(raw.get("visible")),
+            selected=bool(raw.get("selected")),
+            enabled=bool(raw.get("enabled")),
+            text=raw.get("text") or "",
+            rect=ElementRect(**rect) if rect else None,
+        )
+
+
+@dataclass(frozen=True)
+class StateSnapshot(Sequence[ElementState]):
+    """Element states captured in a single round trip, in the order the locators were given."""
+
+    states: tuple[ElementState, ...]
+
+    def __getitem__(self, index: int) -> ElementState:  # type: ignore[override]
+        return self.states[index]
+
+    def __iter__(self) -> Iterator[ElementState]:
+        return iter(self.states)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def for_locator(self, locator: Any) -> ElementState:
+        """Return the state captured for `locator` (compared by selector and strategy)."""
+        for state in self.states:
+            if state.locator["selector"] == locator["selector"] and state.locator["by"] == locator["by"]:
+                return state
+        raise KeyError(f"Locator '{locator}' is not part of this snapshot")
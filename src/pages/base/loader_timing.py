@@ -0,0 +1,37 @@
+"""
+Module containing the timing record produced by BasePage loader tracking.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class LoaderTiming:
+    """Loader appear/disappear times in milliseconds, measured from when tracking was installed."""
+
+    completed: bool
+    appeared_ms: float | None = None
+    disappeared_ms: float | None = None
+
+    @property
+    def visible_ms(self) -> float | None:
+        """How long the loader stayed visible, or None if it never completed a full cycle."""
+        if self.appeared_ms is None or self.disappeared_ms is None:
+            return None
+        return self.disappeared_ms - self.appeared_ms
+
+    @classmethod
+    def from_script_result(cls, raw: dict[str, Any] | None) -> LoaderTiming:
+        if not raw:
+            return cls(completed=False)
+        return cls(
+            completed=bool(raw.get("completed")),
+            appeared_ms=raw.get("appeared_ms"),
+            disappeared_ms=raw.get("disappeared_ms"),
+        )
+
+    def as_metrics(self) -> dict[str, Any]:
+        return {**asdict(self), "visible_ms": self.visible_ms}
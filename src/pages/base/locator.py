@@ -0,0 +1,145 @@
+"""
+Module containing the Locator type used by all page objects.
+
+A Locator is an immutable `(selector, by)` pair that still behaves like the
+`{"selector": ..., "by": ...}` dicts the framework started with: it supports
+`locator["selector"]`, `dict(locator)` and `**locator` splatting into SeleniumBase.
+
+Selectors containing `str.format` fields (e.g. `div.figure:nth-of-type({index})`) are
+parsed once at construction. `format()` then joins the precompiled pieces and interns
+the result in a bounded LRU cache, so formatting the same locator with the same values
+in a loop returns the same object instead of allocating a new one each time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from string import Formatter
+from typing import Any
+
+CSS_SELECTOR = "css selector"
+FORMAT_CACHE_SIZE = 1024
+
+_KEYS = ("selector", "by")
+
+
+class Locator(Mapping[str, str]):
+    __slots__ = ("selector", "by", "_literals", "_fields", "_hash")
+
+    selector: str
+    by: str
+    _literals: tuple[str, ...]
+    _fields: tuple[str, ...] | None
+    _hash: int
+
+    def __init__(self, selector: str, by: str = CSS_SELECTOR) -> None:
+        object.__setattr__(self, "selector", selector)
+        object.__setattr__(self, "by", by)
+        literals, fields = _compile_template(selector)
+        object.__setattr__(self, "_literals", literals)
+        object.__setattr__(self, "_fields", fields)
+        object.__setattr__(self, "_hash", hash((selector, by)))
+
+    @classmethod
+    def from_mapping(cls, locator: Mapping[str, str]) -> Locator:
+        """Return `locator` as a Locator, converting legacy dict locators."""
+        if isinstance(locator, Locator):
+            return locator
+        return cls(locator["selector"], locator["by"])
+
+    @property
+    def is_template(self) -> bool:
+        return self._fields is None or bool(self._fields)
+
+    def format(self, **kwargs: Any) -> Locator:
+        """
+        Return a Locator with the selector's format fields filled from `kwargs`.
+
+        Raises:
+            KeyError: If a field in the selector has no matching keyword argument
+        """
+        if self._fields is None:
+            return Locator(self.selector.format(**kwargs), self.by)
+        if not self._fields:
+            return self
+        values = tuple([kwargs[name] for name in self._fields])
+        try:
+            # Keyed by type too: 1, 1.0 and True are equal and hash alike, but render differently
+            return _format_interned(self, tuple([(type(value), value) for value in values]))
+        except TypeError:  # Unhashable values cannot be interned
+            return self._render(values)
+
+    def _render(self, values: tuple[Any, ...]) -> Locator:
+        parts = [self._literals[0]]
+        for value, literal in zip(values, self._literals[1:]):
+            parts.append(str(value))
+            parts.append(literal)
+        return Locator("".join(parts), self.by)
+
+    # Immutability -------------------------------------------------------------
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self) -> tuple[type[Locator], tuple[str, str]]:
+        return (self.__class__, (self.selector, self.by))
+
+    # Mapping protocol (dict compatibility) --------------------------------------
+
+    def __getitem__(self, key: str) -> str:
+        if key == "selector":
+            return self.selector
+        if key == "by":
+            return self.by
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return 2
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Locator):
+            return self.selector == other.selector and self.by == other.by
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Locator(selector={self.selector!r}, by={self.by!r})"
+
+
+def _compile_template(selector: str) -> tuple[tuple[str, ...], tuple[str, ...] | None]:
+    """
+    Split a selector into literal text and plain `{name}` fields.
+
+    Selectors using conversions, format specs, attribute/index access or positional
+    fields cannot be rendered by joining; for those the fields are None and `format()`
+    falls back to `str.format`.
+    """
+    literals: list[str] = [""]
+    fields: list[str] = []
+    try:
+        parsed = list(Formatter().parse(selector))
+    except ValueError:
+        return (selector,), None
+    for literal, field_name, format_spec, conversion in parsed:
+        literals[-1] += literal
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or format_spec or conversion:
+            return (selector,), None
+        fields.append(field_name)
+        literals.append("")
+    return tuple(literals), tuple(fields)
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_interned(locator: Locator, typed_values: tuple[tuple[type, Any], ...]) -> Locator:
+    return locator._render(tuple([value for _, value in typed_values]))
@@ -0,0 +1,374 @@
+"""
+Module containing in-page JavaScript snippets used by BasePage.
+
+Each snippet is a plain string passed to `execute_script`. Snippets that need to
+resolve locators in the browser embed `FIND_ELEMENTS_JS`, which understands the same
+`{"selector": ..., "by": ...}` shape the page objects use.
+"""
+
+# Resolves a locator dict to an array of elements, mirroring Selenium's `By` strategies.
+FIND_ELEMENTS_JS = """
+function __sbFindElements(locator, root) {
+    root = root || document;
+    var selector = locator.selector;
+    switch (locator.by) {
+        case "css selector":
+            return Array.prototype.slice.call(root.querySelectorAll(selector));
+        case "xpath":
+            var result = document.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < result.snapshotLength; i++) {
+                nodes.push(result.snapshotItem(i));
+            }
+            return nodes;
+        case "id":
+            return Array.prototype.slice.call(root.querySelectorAll("#" + CSS.escape(selector)));
+        case "name":
+            return Array.prototype.slice.call(root.querySelectorAll('[name="' + CSS.escape(selector) + '"]'));
+        case "class name":
+            return Array.prototype.slice.call(root.querySelectorAll("." + CSS.escape(selector)));
+        case "tag name":
+            return Array.prototype.slice.call(root.getElementsByTagName(selector));
+        case "link text":
+        case "partial link text":
+            var partial = locator.by === "partial link text";
+            return Array.prototype.slice.call(root.querySelectorAll("a")).filter(function (a) {
+                var text = (a.innerText || a.textContent || "").trim();
+                return partial ? text.indexOf(selector) !== -1 : text === selector;
+            });
+        default:
+            throw new Error("Unsupported locator strategy: " + locator.by);
+    }
+}
+"""
+
+# Approximates WebDriver's `isDisplayed` without the full Selenium atom.
+IS_VISIBLE_JS = """
+function __sbIsVisible(el) {
+    if (!el || !el.isConnected) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === "hidden" || style.visibility === "collapse" || style.opacity === "0") {
+        return false;
+    }
+    return el.getClientRects().length > 0;
+}
+"""
+
+# Returns one state record per locator passed in `arguments[0]`.
+SNAPSHOT_STATES_JS = (
+    FIND_ELEMENTS_JS
+    + IS_VISIBLE_JS
+    + """
+return arguments[0].map(function (locator) {
+    var matches = __sbFindElements(locator);
+    var el = matches[0];
+    if (!el) {
+        return {count: 0, visible: false, selected: false, enabled: false, text: "", rect: null};
+    }
+    var box = el.getBoundingClientRect();
+    return {
+        count: matches.length,
+        visible: __sbIsVisible(el),
+        selected: !!(el.checked || el.selected),
+        enabled: !el.matches(":disabled"),
+        text: (el.innerText || "").trim(),
+        rect: {x: box.x, y: box.y, width: box.width, height: box.height}
+    };
+});
+"""
+)
+
+# Async script: resolves once the first element matching `arguments[0]` satisfies the
+# condition in `arguments[1]` ("visible" or "invisible"), or after `arguments[2]` ms.
+# Re-checks are driven by DOM mutations, CSS transition/animation ends and intersection
+# changes; a slow in-page fallback tick covers layout-only changes none of those report.
+OBSERVE_ELEMENT_JS = (
+    FIND_ELEMENTS_JS
+    + IS_VISIBLE_JS
+    + """
+var locator = arguments[0];
+var condition = arguments[1];
+var timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var finished = false;
+var mutationObserver = null;
+var intersectionObserver = null;
+var observedElement = null;
+var timer = null;
+var fallbackTick = null;
+var started = performance.now();
+
+function finish(met, el) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (mutationObserver) {
+        mutationObserver.disconnect();
+    }
+    if (intersectionObserver) {
+        intersectionObserver.disconnect();
+    }
+    document.removeEventListener("transitionend", check, true);
+    document.removeEventListener("animationend", check, true);
+    clearTimeout(timer);
+    clearInterval(fallbackTick);
+    done({met: met, element: el || null, elapsed_ms: performance.now() - started});
+}
+
+function watchIntersection(el) {
+    if (!window.IntersectionObserver || el === observedElement) {
+        return;
+    }
+    if (intersectionObserver) {
+        intersectionObserver.disconnect();
+    }
+    observedElement = el;
+    intersectionObserver = new IntersectionObserver(check);
+    intersectionObserver.observe(el);
+}
+
+function check() {
+    if (finished) {
+        return;
+    }
+    var el = __sbFindElements(locator)[0];
+    var visible = __sbIsVisible(el);
+    if (el) {
+        watchIntersection(el);
+    }
+    if (condition === "visible" && visible) {
+        finish(true, el);
+    } else if (condition === "invisible" && !visible) {
+        finish(true, null);
+    }
+}
+
+mutationObserver = new MutationObserver(check);
+mutationObserver.observe(document.documentElement, {
+    subtree: true, childList: true, attributes: true, characterData: true
+});
+document.addEventListener("transitionend", check, true);
+document.addEventListener("animationend", check, true);
+timer = setTimeout(function () { finish(false, null); }, timeoutMs);
+fallbackTick = setInterval(check, 250);
+check();
+"""
+)
+
+# Installs `window.__sbLoaderTracker` for the loader matching `arguments[0]`. The tracker
+# records when the loader first appears and when it disappears afterwards (ms since
+# installation). Mutation records are inspected too, so a loader that is added and removed
+# between two observer callbacks still counts as having appeared.
+TRACK_LOADER_JS = (
+    FIND_ELEMENTS_JS
+    + IS_VISIBLE_JS
+    + """
+var locator = arguments[0];
+var previous = window.__sbLoaderTracker;
+if (previous) {
+    previous.stop();
+}
+var tracker = {
+    startedAt: performance.now(),
+    appearedAt: null,
+    disappearedAt: null,
+    listeners: [],
+    observer: null,
+    fallbackTick: null
+};
+
+function matchesLocator(node) {
+    if (node.nodeType !== Node.ELEMENT_NODE) {
+        return false;
+    }
+    if (locator.by === "css selector") {
+        return node.matches(locator.selector) || !!node.querySelector(locator.selector);
+    }
+    return __sbFindElements(locator).some(function (el) { return node === el || node.contains(el); });
+}
+
+tracker.stop = function () {
+    tracker.observer.disconnect();
+    clearInterval(tracker.fallbackTick);
+    document.removeEventListener("transitionend", tracker.check, true);
+    document.removeEventListener("animationend", tracker.check, true);
+};
+
+tracker.check = function (records) {
+    var now = performance.now() - tracker.startedAt;
+    var visible = __sbIsVisible(__sbFindElements(locator)[0]);
+    if (tracker.appearedAt === null) {
+        var added = Array.isArray(records) && records.some(function (record) {
+            return Array.prototype.some.call(record.addedNodes || [], matchesLocator);
+        });
+        if (visible || added) {
+            tracker.appearedAt = now;
+        }
+    }
+    if (tracker.appearedAt !== null && tracker.disappearedAt === null && !visible) {
+        tracker.disappearedAt = now;
+        tracker.stop();
+        tracker.listeners.splice(0).forEach(function (listener) { listener(); });
+    }
+};
+
+tracker.observer = new MutationObserver(tracker.check);
+tracker.observer.observe(document.documentElement, {
+    subtree: true, childList: true, attributes: true, characterData: true
+});
+document.addEventListener("transitionend", tracker.check, true);
+document.addEventListener("animationend", tracker.check, true);
+tracker.fallbackTick = setInterval(tracker.check, 250);
+window.__sbLoaderTracker = tracker;
+tracker.check();
+"""
+)
+
+# Async script: resolves with the tracker timings as soon as the tracked loader has
+# disappeared, or after `arguments[0]` ms. Resolves with null if no tracker is installed.
+AWAIT_LOADER_JS = """
+var timeoutMs = arguments[0];
+var done = arguments[arguments.length - 1];
+var tracker = window.__sbLoaderTracker;
+if (!tracker) {
+    done(null);
+    return;
+}
+
+function report(completed) {
+    done({completed: completed, appeared_ms: tracker.appearedAt, disappeared_ms: tracker.disappearedAt});
+}
+
+if (tracker.disappearedAt !== null) {
+    report(true);
+    return;
+}
+var timer = setTimeout(function () {
+    tracker.stop();
+    report(false);
+}, timeoutMs);
+tracker.listeners.push(function () {
+    clearTimeout(timer);
+    report(true);
+});
+tracker.check();
+"""
+
+# Returns, for every element matching `arguments[0]`, a dict of the DOM properties named in
+# `arguments[1]`. Properties the element lacks fall back to the attribute of the same name;
+# object values are stringified so the result is always JSON-serialisable.
+ELEMENTS_PROPERTIES_JS = (
+    FIND_ELEMENTS_JS
+    + """
+var locator = arguments[0];
+var names = arguments[1];
+return __sbFindElements(locator).map(function (el) {
+    var properties = {};
+    names.forEach(function (name) {
+        var value = el[name];
+        if (value === undefined) {
+            value = el.getAttribute(name);
+        }
+        if (value !== null && (typeof value === "object" || typeof value === "function")) {
+            value = String(value);
+        }
+        properties[name] = value;
+    });
+    return properties;
+});
+"""
+)
+
+# Returns the header and body cell texts of the first table matching `arguments[0]`, or null.
+READ_TABLE_JS = (
+    FIND_ELEMENTS_JS
+    + """
+var table = __sbFindElements(arguments[0])[0];
+if (!table) {
+    return null;
+}
+function texts(cells) {
+    return Array.prototype.map.call(cells, function (cell) {
+        return (cell.innerText || cell.textContent || "").trim();
+    });
+}
+var headers = table.tHead ? table.tHead.querySelectorAll("th") : [];
+var rows = [];
+Array.prototype.forEach.call(table.tBodies, function (body) {
+    Array.prototype.forEach.call(body.rows, function (row) {
+        rows.push(texts(row.cells));
+    });
+});
+return {"headers": texts(headers), "rows": rows};
+"""
+)
+
+# Async script: scrolls to the bottom of the page, then resolves once more elements match
+# `arguments[0]` than the `arguments[1]` already seen (null: as many as before scrolling) and
+# none of the new ones still contains an element matching `arguments[2]` (a loading
+# placeholder; null to skip the check), or after `arguments[3]` ms. The observer is installed
+# before scrolling, so content appended by the scroll handler itself is not missed.
+SCROLL_AND_AWAIT_CONTENT_JS = (
+    FIND_ELEMENTS_JS
+    + """
+var locator = arguments[0];
+var known = arguments[1];
+var pendingLocator = arguments[2];
+var timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var scroller = document.scrollingElement || document.documentElement;
+var baselineHeight = scroller.scrollHeight;
+var finished = false;
+var observer = null;
+var timer = null;
+var started = performance.now();
+if (known === null) {
+    known = __sbFindElements(locator).length;
+}
+
+function newElements() {
+    return __sbFindElements(locator).slice(known);
+}
+
+function isLoaded(el) {
+    return pendingLocator === null || __sbFindElements(pendingLocator, el).length === 0;
+}
+
+function finish(met) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    var added = met ? newElements().map(function (el) {
+        return (el.innerText || el.textContent || "").trim();
+    }) : [];
+    done({
+        met: met,
+        added: added,
+        grew: scroller.scrollHeight > baselineHeight,
+        elapsed_ms: performance.now() - started
+    });
+}
+
+function check() {
+    if (finished) {
+        return;
+    }
+    var added = newElements();
+    if (added.length && added.every(isLoaded)) {
+        finish(true);
+    }
+}
+
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {subtree: true, childList: true, characterData: true});
+timer = setTimeout(function () { finish(false); }, timeoutMs);
+window.scrollTo(0, scroller.scrollHeight);
+check();
+"""
+)
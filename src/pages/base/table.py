@@ -0,0 +1,59 @@
+"""
+Module containing an in-memory model of an HTML table read in one script execution.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class TableModel:
+    """Header and body cell texts of a table, indexed by column name for constant-time lookups."""
+
+    headers: tuple[str, ...]
+    rows: tuple[tuple[str, ...], ...]
+    _column_index: dict[str, int] = field(init=False, repr=False, compare=False)
+    _column_values: tuple[frozenset[str], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # First occurrence wins for duplicate header names
+        index: dict[str, int] = {}
+        for position, name in enumerate(self.headers):
+            index.setdefault(name, position)
+        values = tuple(frozenset(row[i] for row in self.rows if i < len(row)) for i in range(len(self.headers)))
+        object.__setattr__(self, "_column_index", index)
+        object.__setattr__(self, "_column_values", values)
+
+    @classmethod
+    def from_script_result(cls, raw: dict[str, Any] | None) -> TableModel:
+        if not raw:
+            return cls(headers=(), rows=())
+        return cls(headers=tuple(raw.get("headers") or ()), rows=tuple(tuple(row) for row in raw.get("rows") or ()))
+
+    def has_column(self, name: str) -> bool:
+        return name in self._column_index
+
+    def column_index(self, name: str) -> int:
+        """
+        Return the 0-based position of the column.
+
+        Raises:
+            KeyError: If the table has no such column
+        """
+        return self._column_index[name]
+
+    def column(self, name: str) -> tuple[str, ...]:
+        """Return the body cell texts of the column, top to bottom."""
+        index = self.column_index(name)
+        return tuple(row[index] if index < len(row) else "" for row in self.rows)
+
+    def contains(self, column: str, value: str) -> bool:
+        """Return True if any body cell of the column has exactly this text."""
+        index = self._column_index.get(column)
+        return index is not None and value in self._column_values[index]
+
+    def cell(self, row: int, column: str) -> str:
+        """Return the text of a body cell by 0-based row and column name."""
+        return self.rows[row][self.column_index(column)]
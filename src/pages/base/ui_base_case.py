@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+import dataclasses
+import inspect
 import os
+import time
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import allure
 import pytest
 import structlog
-from seleniumbase import BaseCase
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from seleniumbase import BaseCase, Driver
 from seleniumbase.fixtures import constants
 
-from src.config import settings
+from src.config import PageSettings, page_settings, settings
+from src.config.project_config import NavigationModeEnum, ResourceProfileEnum
+from src.replica.archive import get_archive_session
+from src.replica.cdp_fetch import CdpFetchInterceptor
+from src.utils.browser_contexts import ContextDriver, open_context_driver
+from src.utils.command_profiler import CommandProfiler
+from src.utils.download_watcher import DownloadWatcher
+from src.utils.driver_pool import get_pool
+from src.utils.resource_blocking import PROFILES, ResourceBlocker, ResourceKind, firefox_prefs
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import Any
 
 
@@ -22,22 +37,170 @@ class UiBaseCase(BaseCase):
         """Inject pytest request object for parametrization support"""
         self.request = request
 
+    download_watcher: DownloadWatcher | None = None
+    page_config: PageSettings | None = None  # Read by the page objects created by this test
+    command_profiler: CommandProfiler | None = None
+    _created_driver: bool = False
+
+    # Attributes BaseCase.get_new_driver copies from an undetected-chromedriver session
+    _UC_DRIVER_METHODS = (
+        "cdp",
+        "uc_open",
+        "uc_open_with_tab",
+        "uc_open_with_reconnect",
+        "uc_open_with_cdp_mode",
+        "uc_open_with_disconnect",
+        "reconnect",
+        "disconnect",
+        "connect",
+        "uc_click",
+        "uc_gui_press_key",
+        "uc_gui_press_keys",
+        "uc_gui_write",
+        "uc_gui_click_x_y",
+        "uc_gui_click_captcha",
+        "uc_gui_click_cf",
+        "uc_gui_click_rc",
+        "uc_gui_handle_captcha",
+        "uc_gui_handle_cf",
+        "uc_gui_handle_rc",
+        "uc_switch_to_frame",
+    )
+
     def get_new_driver(self, *args: Any, **kwargs: Any) -> Any:
-        """Override to set download directory before driver creation."""
+        """
+        Override to set download directory before driver creation and start watching it.
+        With SHARED_CHROME_CONTEXTS > 0 (Chrome), the driver runs in a browser context of a shared Chrome.
+        With DRIVER_POOL_SIZE > 0 (Chrome), a pre-warmed driver is checked out when one is ready.
+        With HTTP_ARCHIVE_MODE record/replay (Chrome), BASE_URL traffic is intercepted over CDP.
+        With PROFILE_COMMANDS enabled, the new driver's commands are recorded for this test.
+        The test's resource profile is applied: over CDP in Chrome, as launch preferences in Firefox.
+        """
         worker_id: str = os.environ.get("PYTEST_XDIST_WORKER") or "local"
         downloads_dir: str = os.path.abspath(os.path.join(constants.Files.DOWNLOADS_FOLDER, worker_id))
         os.makedirs(downloads_dir, exist_ok=True)
 
         self.downloads_folder = downloads_dir
-        driver = super().get_new_driver(*args, **kwargs)
+        if self.download_watcher is None:
+            watcher = DownloadWatcher(downloads_dir)
+            if settings.REUSE_SESSION:
+                UiBaseCase.download_watcher = watcher  # Outlives the test, like the shared browser
+            else:
+                self.download_watcher = watcher
+        driver = self._open_context_driver(downloads_dir, args, kwargs)
+        if driver is None:
+            driver = self._checkout_pooled_driver(downloads_dir, args, kwargs)
+        if driver is None:
+            firefox_blocked = self._launch_firefox_with_blocking(args, kwargs)
+            driver = super().get_new_driver(*args, **kwargs)
+            if firefox_blocked:
+                driver.blocked_resources = firefox_blocked  # Read by allow_resources
+            if self.browser == "chrome":
+                _set_chrome_download_dir(driver, downloads_dir)
+                self.logger = structlog.get_logger(self.__class__.__name__)
+                self.logger.info("Chrome download directory set to", download_path=downloads_dir)
+        self._created_driver = True
+        self._start_http_archive(driver)
+        self._apply_resource_profile(driver)
+        self._start_command_profiler(driver)
 
-        if self.browser == "chrome":
-            driver.execute_cdp_cmd("Page.setDownloadBehavior", {"behavior": "allow", "downloadPath": downloads_dir})
-            self.logger = structlog.get_logger(self.__class__.__name__)
-            self.logger.info("Chrome download directory set to", download_path=downloads_dir)
+        return driver
+
+    def _open_context_driver(self, downloads_dir: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any | None:
+        """
+        Open a fresh browser context in the Chrome this worker shares with others.
 
+        The context gets the per-worker download path; geolocation permissions and
+        overrides are granted per context by GeolocationPage. Returns None when
+        SHARED_CHROME_CONTEXTS is 0, for other browsers and for drivers with explicit options.
+        """
+        if settings.SHARED_CHROME_CONTEXTS == 0 or args:
+            return None
+        if kwargs.get("browser", self.browser) != "chrome":
+            return None
+
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER") or "local"
+        driver = open_context_driver(worker_id, downloads_dir, settings.SHARED_CHROME_CONTEXTS)
+        self._adopt_driver(driver, browser_name="chrome", switch_to=kwargs.get("switch_to", True))
         return driver
 
+    def _checkout_pooled_driver(self, downloads_dir: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any | None:
+        """
+        Check out a pre-warmed driver for these options and top the pool back up.
+
+        The pool is used for Chrome only (the per-worker download path is applied via CDP)
+        and not with REUSE_SESSION, where a single browser serves the whole session anyway.
+        Returns None when the pool is disabled or has no driver ready.
+        """
+        if settings.DRIVER_POOL_SIZE == 0 or settings.REUSE_SESSION or args:
+            return None
+        if kwargs.get("browser", self.browser) != "chrome":
+            return None
+
+        options = {name: value for name, value in kwargs.items() if name in _DRIVER_PARAMETERS}
+
+        def factory() -> Any:
+            pooled_driver = Driver(**options)
+            _set_chrome_download_dir(pooled_driver, downloads_dir)
+            return pooled_driver
+
+        pool = get_pool(
+            repr(sorted(options.items())), factory, settings.DRIVER_POOL_SIZE, settings.DRIVER_POOL_MAX_IDLE
+        )
+        driver = pool.checkout()
+        pool.replenish()  # Spawn the next spare while this test runs
+        if driver is not None:
+            self._adopt_driver(driver, browser_name="chrome", switch_to=kwargs.get("switch_to", True))
+        return driver
+
+    def _adopt_driver(self, driver: Any, browser_name: str, switch_to: bool) -> None:
+        """Register an externally created driver the way BaseCase.get_new_driver registers its own."""
+        self._drivers_list.append(driver)
+        self._drivers_browser_map[driver] = browser_name
+        if switch_to:
+            self.driver = driver
+            self.browser = browser_name
+        for name in self._UC_DRIVER_METHODS:
+            if hasattr(driver, name):
+                setattr(self, name, getattr(driver, name))
+
+    def blocked_resources_for_test(self) -> frozenset[ResourceKind]:
+        """Resource kinds the test's browser does not load: its `@pytest.mark.resources` profile or RESOURCE_PROFILE."""
+        marker = self.request.node.get_closest_marker("resources") if hasattr(self, "request") else None
+        profile = ResourceProfileEnum(marker.args[0]) if marker and marker.args else settings.RESOURCE_PROFILE
+        return PROFILES[profile]
+
+    def allow_resources(self, kinds: Iterable[ResourceKind]) -> bool:
+        """
+        Unblock resource kinds for the rest of this test; MainPage calls it before opening a page that needs them.
+
+        Returns True if any of them was blocked; a page that is already loaded needs a reload to get them.
+        Firefox only takes its blocking preferences at launch, so there a warning is logged
+        and False is returned.
+        """
+        needed = frozenset(kinds)
+        blocker: ResourceBlocker | None = getattr(self.driver, "resource_blocker", None)
+        if blocker is None:
+            still_blocked = needed & getattr(self.driver, "blocked_resources", frozenset())
+            if still_blocked:
+                self.logger.warning("Resources stay blocked until the browser restarts.", kinds=sorted(still_blocked))
+            return False
+        if not needed & blocker.blocked:
+            return False
+        blocker.block(blocker.blocked - needed)
+        self.logger.debug("Resources unblocked.", kinds=sorted(needed))
+        return True
+
+    def override_page_settings(self, **changes: Any) -> PageSettings:
+        """
+        Override page settings for the page objects this test creates from now on.
+
+        Only this test case's snapshot changes; the worker's settings and other tests are
+        unaffected. For example: `self.override_page_settings(short_timeout=1)`.
+        """
+        self.page_config = dataclasses.replace(self.page_config or page_settings(), **changes)
+        return self.page_config
+
     def get_downloads_folder(self) -> str:
         """Override to return the per-worker download directory."""
         worker_id = os.environ.get("PYTEST_XDIST_WORKER") or "local"
@@ -54,17 +217,128 @@ class UiBaseCase(BaseCase):
         This method initializes the logger using structlog with the class name,
         retrieves the worker ID from the PYTEST_XDIST_WORKER environment variable
         (or defaults to 'local' if not set), and navigates to the base URL if the
-        test is marked with @pytest.mark.ui. The navigation is logged as an Allure step.
+        test is marked with @pytest.mark.ui and NAVIGATION_MODE is 'click'. The navigation
+        is logged as an Allure step.
         """
         super().setUp()
         self.logger = structlog.get_logger(self.__class__.__name__)
         self.worker_id = os.environ.get("PYTEST_XDIST_WORKER") or "local"
 
-        # Navigate to base URL if @pytest.mark.ui
-        if hasattr(self, "request") and self.request.node.get_closest_marker("ui"):
+        # With REUSE_SESSION, SeleniumBase hands back the worker's shared browser instead of
+        # calling get_new_driver, so state left behind by the previous test is reset here.
+        if settings.REUSE_SESSION and not self._created_driver:
+            self.downloads_folder = self.get_downloads_folder()
+            self._start_command_profiler(self.driver)
+            self._apply_resource_profile(self.driver)
+            self.reset_browser_state()
+
+        # Navigate to base URL if @pytest.mark.ui (in deep-link mode MainPage opens feature pages directly)
+        deep_link = (self.page_config or page_settings()).navigation_mode == NavigationModeEnum.deep_link
+        if hasattr(self, "request") and self.request.node.get_closest_marker("ui") and not deep_link:
             with allure.step(f"Navigate to base URL: {settings.BASE_URL}"):
                 self.open(settings.BASE_URL)
 
+    def reset_browser_state(self) -> None:
+        """
+        Return a reused browser to a clean state without restarting it.
+
+        Dismisses a pending alert, closes every window but the first, clears cookies and
+        local/session storage, resets granted permissions and the geolocation override
+        (Chrome, via CDP), and empties the per-worker downloads directory. A driver in a
+        shared Chrome gets a fresh browser context instead, which drops all of that at once
+        and leaves the other workers' windows alone.
+        """
+        start_time = time.perf_counter()
+        driver = self.driver
+
+        if isinstance(driver, ContextDriver):
+            driver.reset_context()
+            self._reset_downloads_folder()
+            self.logger.debug("Browser context reset.", elapsed_ms=round((time.perf_counter() - start_time) * 1000))
+            return
+
+        with suppress(NoAlertPresentException):
+            driver.switch_to.alert.dismiss()
+
+        handles = driver.window_handles
+        if len(handles) > 1:
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+        with suppress(WebDriverException):  # about:blank and data: URLs have no storage
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.delete_all_cookies()
+
+        if self.browser == "chrome":
+            origins = {_origin(settings.BASE_URL), _origin(driver.current_url)} - {None}
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Browser.resetPermissions", {})
+            driver.execute_cdp_cmd("Emulation.clearGeolocationOverride", {})
+
+        self._reset_downloads_folder()
+        self.logger.debug("Browser state reset.", elapsed_ms=round((time.perf_counter() - start_time) * 1000))
+
+    def _reset_downloads_folder(self) -> None:
+        downloads_dir = Path(self.get_downloads_folder())
+        for entry in downloads_dir.iterdir():
+            if entry.is_file() and entry.suffix != ".lock":
+                entry.unlink(missing_ok=True)
+        if self.download_watcher is not None:
+            self.download_watcher.reset()
+
+    def _start_http_archive(self, driver: Any) -> None:
+        """Record or replay the browser's BASE_URL traffic; other browsers use the proxy set up in conftest."""
+        session = get_archive_session()
+        if session is None or self.browser != "chrome" or hasattr(driver, "http_archive_interceptor"):
+            return
+        try:
+            interceptor = CdpFetchInterceptor.for_driver(driver, session, f"{_origin(settings.BASE_URL)}/*")
+        except Exception as e:
+            self.logger.warning("Failed to start HTTP archive interception.", error=str(e))
+            return
+        driver.http_archive_interceptor = interceptor  # Lives as long as the browser
+
+    def _launch_firefox_with_blocking(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> frozenset[ResourceKind]:
+        """Add the test's blocking preferences to the options of a Firefox about to launch; returns the kinds."""
+        if args or kwargs.get("browser", self.browser) != "firefox":
+            return frozenset()
+        blocked = self.blocked_resources_for_test()
+        prefs = firefox_prefs(blocked)
+        if prefs:
+            existing = kwargs.get("firefox_pref") or self.firefox_pref
+            kwargs["firefox_pref"] = f"{existing},{prefs}" if existing else prefs
+        return blocked
+
+    def _apply_resource_profile(self, driver: Any) -> None:
+        """Block the test's resource kinds in a Chrome driver; the blocker lives as long as the browser."""
+        if self.browser != "chrome":
+            return
+        blocked = self.blocked_resources_for_test()
+        blocker: ResourceBlocker | None = getattr(driver, "resource_blocker", None)
+        if blocker is None:
+            if not blocked:
+                return
+            try:
+                blocker = ResourceBlocker.for_driver(driver, _origin(settings.BASE_URL))
+            except Exception as e:
+                self.logger.warning("Failed to start resource blocking.", error=str(e))
+                return
+            if blocker is None:
+                return
+            driver.resource_blocker = blocker
+        blocker.block(blocked)
+
+    def _start_command_profiler(self, driver: Any) -> None:
+        if not settings.PROFILE_COMMANDS:
+            return
+        if self.command_profiler is None:
+            self.command_profiler = CommandProfiler()
+        self.command_profiler.instrument(driver)
+
     def tearDown(self) -> None:
         """
         Clean up after each test method.
@@ -77,6 +351,14 @@ class UiBaseCase(BaseCase):
         """
         super().tearDown()
 
+        if self.download_watcher is not None and not settings.REUSE_SESSION:
+            self.download_watcher.close()
+            self.download_watcher = None
+
+        if self.command_profiler is not None:
+            self._report_command_profile(self.command_profiler)
+            self.command_profiler = None
+
         # Attach screenshot to Allure Report on failure
         if hasattr(self, "request") and hasattr(self, "_outcome") and self._outcome.errors:
             try:
@@ -93,6 +375,32 @@ class UiBaseCase(BaseCase):
                         name=f"Failed Screenshot - {self.request.node.name}",
                         attachment_type=allure.attachment_type.PNG,
                     )
-                    self.logger.info(f"Test failed - screenshot attached from: {screenshot_path}")
+                    self.logger.info("Test failed - screenshot attached.", path=str(screenshot_path))
             except Exception as e:
-                self.logger.error(f"Failed to attach screenshot: {e}")
+                self.logger.error("Failed to attach screenshot.", error=str(e))
+
+    def _report_command_profile(self, profiler: CommandProfiler) -> None:
+        """Attach the test's WebDriver command summary to Allure and append it to the worker's JSONL file."""
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER") or "local"
+        jsonl_path = Path(settings.COMMAND_PROFILE_DIR) / f"{worker_id}.jsonl"
+        try:
+            profiler.report(jsonl_path)
+        except Exception as e:
+            self.logger.error("Failed to report WebDriver command profile.", error=str(e))
+        finally:
+            profiler.uninstrument()
+
+
+def _origin(url: str | Any) -> str | None:
+    parts = urlsplit(str(url))
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _set_chrome_download_dir(driver: Any, downloads_dir: str) -> None:
+    driver.execute_cdp_cmd("Page.setDownloadBehavior", {"behavior": "allow", "downloadPath": downloads_dir})
+
+
+# Options of BaseCase.get_new_driver that the standalone Driver() factory understands
+_DRIVER_PARAMETERS = frozenset(inspect.signature(Driver).parameters)
@@ -4,36 +4,68 @@ Module containing locators for Main Page object.
 
 from selenium.webdriver.common.by import By
 
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class MainPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "h1.heading", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("h1.heading")
 
-    AB_TESTING_LINK: Locator = {"selector": "A/B Testing", "by": By.LINK_TEXT}
-    ADD_REMOVE_ELEMENTS_LINK: Locator = {"selector": "Add/Remove Elements", "by": By.LINK_TEXT}
-    BROKEN_IMAGES_LINK: Locator = {"selector": "Broken Images", "by": By.LINK_TEXT}
-    CHALLENGING_DOM_LINK: Locator = {"selector": "Challenging DOM", "by": By.LINK_TEXT}
-    CHECKBOXES_LINK: Locator = {"selector": "Checkboxes", "by": By.LINK_TEXT}
-    CONTEXT_MENU_LINK: Locator = {"selector": "Context Menu", "by": By.LINK_TEXT}
-    DRAG_AND_DROP_LINK: Locator = {"selector": "Drag and Drop", "by": By.LINK_TEXT}
-    DROPDOWN_LINK: Locator = {"selector": "Dropdown", "by": By.LINK_TEXT}
-    DYNAMIC_CONTENT_LINK: Locator = {"selector": "Dynamic Content", "by": By.LINK_TEXT}
-    DYNAMIC_CONTROLS_LINK: Locator = {"selector": "Dynamic Controls", "by": By.LINK_TEXT}
-    DYNAMIC_LOADING_LINK: Locator = {"selector": "Dynamic Loading", "by": By.LINK_TEXT}
-    ENTRY_AD_LINK: Locator = {"selector": "Entry Ad", "by": By.LINK_TEXT}
-    EXIT_INTENT_LINK: Locator = {"selector": "Exit Intent", "by": By.LINK_TEXT}
-    FILE_DOWNLOAD_LINK: Locator = {"selector": "File Download", "by": By.LINK_TEXT}
-    FILE_UPLOAD_LINK: Locator = {"selector": "File Upload", "by": By.LINK_TEXT}
-    FLOATING_MENU_LINK: Locator = {"selector": "Floating Menu", "by": By.LINK_TEXT}
-    FORM_AUTH_LINK: Locator = {"selector": "Form Authentication", "by": By.LINK_TEXT}
-    FRAMES_LINK: Locator = {"selector": "Frames", "by": By.LINK_TEXT}
-    GEOLOCATION_LINK: Locator = {"selector": "Geolocation", "by": By.LINK_TEXT}
-    HORIZONTAL_SLIDER_LINK: Locator = {"selector": "Horizontal Slider", "by": By.LINK_TEXT}
-    HOVERS_LINK: Locator = {"selector": "Hovers", "by": By.LINK_TEXT}
-    INFINITE_SCROLL_LINK: Locator = {"selector": "Infinite Scroll", "by": By.LINK_TEXT}
-    INPUTS_LINK: Locator = {"selector": "Inputs", "by": By.LINK_TEXT}
-    JQUERY_UI_MENUS_LINK: Locator = {"selector": "JQuery UI Menus", "by": By.LINK_TEXT}
-    JAVASCRIPT_ALERTS_LINK: Locator = {"selector": "JavaScript Alerts", "by": By.LINK_TEXT}
-    JAVASCRIPT_ONLOAD_EVENT_ERROR_LINK: Locator = {"selector": "JavaScript onload event error", "by": By.LINK_TEXT}
-    KEY_PRESSES_LINK: Locator = {"selector": "Key Presses", "by": By.LINK_TEXT}
+    AB_TESTING_LINK = Locator("A/B Testing", By.LINK_TEXT)
+    ADD_REMOVE_ELEMENTS_LINK = Locator("Add/Remove Elements", By.LINK_TEXT)
+    BROKEN_IMAGES_LINK = Locator("Broken Images", By.LINK_TEXT)
+    CHALLENGING_DOM_LINK = Locator("Challenging DOM", By.LINK_TEXT)
+    CHECKBOXES_LINK = Locator("Checkboxes", By.LINK_TEXT)
+    CONTEXT_MENU_LINK = Locator("Context Menu", By.LINK_TEXT)
+    DRAG_AND_DROP_LINK = Locator("Drag and Drop", By.LINK_TEXT)
+    DROPDOWN_LINK = Locator("Dropdown", By.LINK_TEXT)
+    DYNAMIC_CONTENT_LINK = Locator("Dynamic Content", By.LINK_TEXT)
+    DYNAMIC_CONTROLS_LINK = Locator("Dynamic Controls", By.LINK_TEXT)
+    DYNAMIC_LOADING_LINK = Locator("Dynamic Loading", By.LINK_TEXT)
+    ENTRY_AD_LINK = Locator("Entry Ad", By.LINK_TEXT)
+    EXIT_INTENT_LINK = Locator("Exit Intent", By.LINK_TEXT)
+    FILE_DOWNLOAD_LINK = Locator("File Download", By.LINK_TEXT)
+    FILE_UPLOAD_LINK = Locator("File Upload", By.LINK_TEXT)
+    FLOATING_MENU_LINK = Locator("Floating Menu", By.LINK_TEXT)
+    FORM_AUTH_LINK = Locator("Form Authentication", By.LINK_TEXT)
+    FRAMES_LINK = Locator("Frames", By.LINK_TEXT)
+    GEOLOCATION_LINK = Locator("Geolocation", By.LINK_TEXT)
+    HORIZONTAL_SLIDER_LINK = Locator("Horizontal Slider", By.LINK_TEXT)
+    HOVERS_LINK = Locator("Hovers", By.LINK_TEXT)
+    INFINITE_SCROLL_LINK = Locator("Infinite Scroll", By.LINK_TEXT)
+    INPUTS_LINK = Locator("Inputs", By.LINK_TEXT)
+    JQUERY_UI_MENUS_LINK = Locator("JQuery UI Menus", By.LINK_TEXT)
+    JAVASCRIPT_ALERTS_LINK = Locator("JavaScript Alerts", By.LINK_TEXT)
+    JAVASCRIPT_ONLOAD_EVENT_ERROR_LINK = Locator("JavaScript onload event error", By.LINK_TEXT)
+    KEY_PRESSES_LINK = Locator("Key Presses", By.LINK_TEXT)
+
+
+# Paths (relative to BASE_URL) of the pages the links above open, used for deep-link navigation
+MAIN_PAGE_LINK_PATHS: dict[Locator, str] = {
+    MainPageLocators.AB_TESTING_LINK: "abtest",
+    MainPageLocators.ADD_REMOVE_ELEMENTS_LINK: "add_remove_elements/",
+    MainPageLocators.BROKEN_IMAGES_LINK: "broken_images",
+    MainPageLocators.CHALLENGING_DOM_LINK: "challenging_dom",
+    MainPageLocators.CHECKBOXES_LINK: "checkboxes",
+    MainPageLocators.CONTEXT_MENU_LINK: "context_menu",
+    MainPageLocators.DRAG_AND_DROP_LINK: "drag_and_drop",
+    MainPageLocators.DROPDOWN_LINK: "dropdown",
+    MainPageLocators.DYNAMIC_CONTENT_LINK: "dynamic_content",
+    MainPageLocators.DYNAMIC_CONTROLS_LINK: "dynamic_controls",
+    MainPageLocators.DYNAMIC_LOADING_LINK: "dynamic_loading",
+    MainPageLocators.ENTRY_AD_LINK: "entry_ad",
+    MainPageLocators.EXIT_INTENT_LINK: "exit_intent",
+    MainPageLocators.FILE_DOWNLOAD_LINK: "download",
+    MainPageLocators.FILE_UPLOAD_LINK: "upload",
+    MainPageLocators.FLOATING_MENU_LINK: "floating_menu",
+    MainPageLocators.FORM_AUTH_LINK: "login",
+    MainPageLocators.FRAMES_LINK: "frames",
+    MainPageLocators.GEOLOCATION_LINK: "geolocation",
+    MainPageLocators.HORIZONTAL_SLIDER_LINK: "horizontal_slider",
+    MainPageLocators.HOVERS_LINK: "hovers",
+    MainPageLocators.INFINITE_SCROLL_LINK: "infinite_scroll",
+    MainPageLocators.INPUTS_LINK: "inputs",
+    MainPageLocators.JQUERY_UI_MENUS_LINK: "jqueryui/menu",
+    MainPageLocators.JAVASCRIPT_ALERTS_LINK: "javascript_alerts",
+    MainPageLocators.JAVASCRIPT_ONLOAD_EVENT_ERROR_LINK: "javascript_error",
+    MainPageLocators.KEY_PRESSES_LINK: "key_presses",
+}
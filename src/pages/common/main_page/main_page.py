@@ -1,264 +1,304 @@
 from __future__ import annotations
 
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin, urlsplit
 
 import allure
 
-from src.config import settings
+from src.config.project_config import NavigationModeEnum
 from src.pages.base.base_page import BaseCase, BasePage
-from src.pages.common.main_page.locators import MainPageLocators
-from src.pages.features.ab_testing.ab_testing_page import ABTestingPage
-from src.pages.features.add_remove_elements.add_remove_elements_page import AddRemoveElementsPage
-from src.pages.features.basic_auth.basic_auth_page import BasicAuthPage
-from src.pages.features.broken_images.broken_images_page import BrokenImagesPage
-from src.pages.features.challenging_dom.challenging_dom_page import ChallengingDomPage
-from src.pages.features.checkboxes.checkboxes_page import CheckboxesPage
-from src.pages.features.context_menu.context_menu_page import ContextMenuPage
-from src.pages.features.digest_auth.digest_auth_page import DigestAuthPage
-from src.pages.features.drag_and_drop.drag_and_drop_page import DragAndDropPage
-from src.pages.features.dropdown_list.dropdown_list_page import DropdownListPage
-from src.pages.features.dynamic_content.dynamic_content_page import DynamicContentPage
-from src.pages.features.dynamic_controls.dynamic_controls_page import DynamicControlsPage
-from src.pages.features.dynamic_loading.dynamic_loading_page import DynamicLoadingPage
-from src.pages.features.entry_ad.entry_ad_page import EntryAdPage
-from src.pages.features.exit_intent.exit_intent_page import ExitIntentPage
-from src.pages.features.files_download.files_download_page import FilesDownloadPage
-from src.pages.features.files_upload.files_upload_page import FileUploadPage
-from src.pages.features.floating_menu.floating_menu_page import FloatingMenuPage
-from src.pages.features.form_authentication.form_authentication_page import FormAuthenticationPage
-from src.pages.features.frames.frames_page import FramesPage
-from src.pages.features.geolocation.geolocation_page import GeolocationPage
-from src.pages.features.horizontal_slider.horizontal_slider_page import HorizontalSliderPage
-from src.pages.features.hovers.hovers_page import HoversPage
-from src.pages.features.infinite_scroll.infinite_scroll_page import InfiniteScrollPage
-from src.pages.features.inputs.inputs_page import InputsPage
-from src.pages.features.javascript_alerts.javascript_alerts_page import JavaScriptAlertsPage
-from src.pages.features.javascript_onload_event_error.javascript_onload_event_error_page import (
-    JavaScriptOnloadRventErrorPage,
-)
-from src.pages.features.jquery_ui_menus.jquery_ui_menus_page import JQueryUIMenusPage
-from src.pages.features.key_presses.key_presses_page import KeyPressesPage
+from src.pages.base.locator import Locator
+from src.pages.common.main_page.locators import MAIN_PAGE_LINK_PATHS, MainPageLocators
+from src.pages.registry import get_page_class
+
+if TYPE_CHECKING:
+    from src.pages.features.ab_testing.ab_testing_page import ABTestingPage
+    from src.pages.features.add_remove_elements.add_remove_elements_page import AddRemoveElementsPage
+    from src.pages.features.basic_auth.basic_auth_page import BasicAuthPage
+    from src.pages.features.broken_images.broken_images_page import BrokenImagesPage
+    from src.pages.features.challenging_dom.challenging_dom_page import ChallengingDomPage
+    from src.pages.features.checkboxes.checkboxes_page import CheckboxesPage
+    from src.pages.features.context_menu.context_menu_page import ContextMenuPage
+    from src.pages.features.digest_auth.digest_auth_page import DigestAuthPage
+    from src.pages.features.drag_and_drop.drag_and_drop_page import DragAndDropPage
+    from src.pages.features.dropdown_list.dropdown_list_page import DropdownListPage
+    from src.pages.features.dynamic_content.dynamic_content_page import DynamicContentPage
+    from src.pages.features.dynamic_controls.dynamic_controls_page import DynamicControlsPage
+    from src.pages.features.dynamic_loading.dynamic_loading_page import DynamicLoadingPage
+    from src.pages.features.entry_ad.entry_ad_page import EntryAdPage
+    from src.pages.features.exit_intent.exit_intent_page import ExitIntentPage
+    from src.pages.features.files_download.files_download_page import FilesDownloadPage
+    from src.pages.features.files_upload.files_upload_page import FileUploadPage
+    from src.pages.features.floating_menu.floating_menu_page import FloatingMenuPage
+    from src.pages.features.form_authentication.form_authentication_page import FormAuthenticationPage
+    from src.pages.features.frames.frames_page import FramesPage
+    from src.pages.features.geolocation.geolocation_page import GeolocationPage
+    from src.pages.features.horizontal_slider.horizontal_slider_page import HorizontalSliderPage
+    from src.pages.features.hovers.hovers_page import HoversPage
+    from src.pages.features.infinite_scroll.infinite_scroll_page import InfiniteScrollPage
+    from src.pages.features.inputs.inputs_page import InputsPage
+    from src.pages.features.javascript_alerts.javascript_alerts_page import JavaScriptAlertsPage
+    from src.pages.features.javascript_onload_event_error.javascript_onload_event_error_page import (
+        JavaScriptOnloadRventErrorPage,
+    )
+    from src.pages.features.jquery_ui_menus.jquery_ui_menus_page import JQueryUIMenusPage
+    from src.pages.features.key_presses.key_presses_page import KeyPressesPage
 
 
 class MainPage(BasePage):
-    def __init__(self, driver: BaseCase) -> None:
+    """
+    Page object for the index page, the entry point to every feature page.
+
+    In `click` navigation mode the `click_*_link` methods click the index page links. In
+    `deep_link` mode they open the feature page URL directly, skipping the index page load;
+    UiBaseCase does not open BASE_URL first in that mode. Tests that verify the index page
+    itself pass `navigation_mode=NavigationModeEnum.click`.
+
+    Feature page classes come from the page registry, which imports a page's module the
+    first time a test navigates to it rather than when MainPage is imported.
+    """
+
+    def __init__(self, driver: BaseCase, navigation_mode: NavigationModeEnum | None = None) -> None:
         super().__init__(driver)
+        self.navigation_mode = navigation_mode or self.page_config.navigation_mode
         if hasattr(self.driver, "request") and self.driver.request.node.get_closest_marker("ui"):
-            self.wait_for_page_to_load(MainPageLocators.PAGE_LOADED_INDICATOR)
-            self.base_url = settings.BASE_URL
+            if self.navigation_mode == NavigationModeEnum.click:
+                if self.page_config.navigation_mode == NavigationModeEnum.deep_link:
+                    self.navigate_to(str(self.base_url))  # setUp skipped the index page
+                self.wait_for_page_to_load(MainPageLocators.PAGE_LOADED_INDICATOR)
+
+    def _page(self, name: str, **kwargs: Any) -> Any:
+        """Create the feature page object registered as `name`; its module is imported on first use."""
+        return get_page_class(name)(self.driver, **kwargs)
+
+    def _open_link(self, link_locator: Locator, page_name: str) -> None:
+        """
+        Follow an index page link: click it, or open its target URL directly in deep-link mode.
+
+        Resources the target page declares in `required_resources` are unblocked first, so the
+        page loads with them and never needs a reload.
+        """
+        allow_resources = getattr(self.driver, "allow_resources", None)
+        required = get_page_class(page_name).required_resources
+        if required and allow_resources is not None:
+            allow_resources(required)
+        if self.navigation_mode == NavigationModeEnum.deep_link:
+            self.navigate_to(urljoin(str(self.base_url), MAIN_PAGE_LINK_PATHS[link_locator]))
+        else:
+            self.click_element(link_locator)
 
     @allure.step("Navigate to {page_name} page")
     def click_ab_testing_link(self, page_name: str = "A/B Testing") -> ABTestingPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.AB_TESTING_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.AB_TESTING_LINK, "ABTestingPage")
 
-        return ABTestingPage(self.driver)
+        return self._page("ABTestingPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_add_remove_elements_link(self, page_name: str = "Add/Remove Elements") -> AddRemoveElementsPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.ADD_REMOVE_ELEMENTS_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.ADD_REMOVE_ELEMENTS_LINK, "AddRemoveElementsPage")
 
-        return AddRemoveElementsPage(self.driver)
+        return self._page("AddRemoveElementsPage")
 
     @allure.step("Returning object of {page_name} page")
     def get_basic_auth_page(self, page_name: str = "Basic Auth") -> BasicAuthPage:
-        self.logger.info(f"Returning object of {page_name} page.")
+        self.logger.info("Returning page object.", page_name=page_name)
 
-        return BasicAuthPage(self.driver)
+        return self._page("BasicAuthPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_broken_images_link(self, page_name: str = "Broken Images") -> BrokenImagesPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.BROKEN_IMAGES_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.BROKEN_IMAGES_LINK, "BrokenImagesPage")
 
-        return BrokenImagesPage(self.driver)
+        return self._page("BrokenImagesPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_challenging_dom_link(self, page_name: str = "Challenging DOM") -> ChallengingDomPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.CHALLENGING_DOM_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.CHALLENGING_DOM_LINK, "ChallengingDomPage")
 
-        return ChallengingDomPage(self.driver)
+        return self._page("ChallengingDomPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_checkboxes_link(self, page_name: str = "Checkboxes") -> CheckboxesPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.CHECKBOXES_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.CHECKBOXES_LINK, "CheckboxesPage")
 
-        return CheckboxesPage(self.driver)
+        return self._page("CheckboxesPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_context_menu_link(self, page_name: str = "Context Menu") -> ContextMenuPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.CONTEXT_MENU_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.CONTEXT_MENU_LINK, "ContextMenuPage")
 
-        return ContextMenuPage(self.driver)
+        return self._page("ContextMenuPage")
 
     @allure.step("Navigate to {page_name} page")
     def get_digest_auth_page(
         self, username: str, password: str, page_name: str = "Digest Authentication"
     ) -> DigestAuthPage:
-        self.logger.info(f"Navigating to {page_name} page.")
+        self.logger.info("Navigating to page.", page_name=page_name)
         if not username or not password:
             raise ValueError(f"Invalid credentials: username='{username}', password='{password or ''}'")
-        base_path = urljoin(str(self.base_url), "digest_auth")
-        url = base_path.replace("https://", f"https://{username}:{password}@")
+        parts = urlsplit(urljoin(str(self.base_url), "digest_auth"))
+        url = parts._replace(netloc=f"{username}:{password}@{parts.netloc}").geturl()
         self.navigate_to(url)
 
-        return DigestAuthPage(self.driver)
+        return self._page("DigestAuthPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_drag_and_drop_link(self, page_name: str = "Drag and Drop") -> DragAndDropPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.DRAG_AND_DROP_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.DRAG_AND_DROP_LINK, "DragAndDropPage")
 
-        return DragAndDropPage(self.driver)
+        return self._page("DragAndDropPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_dropdown_list_link(self, page_name: str = "Dropdown List") -> DropdownListPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.DROPDOWN_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.DROPDOWN_LINK, "DropdownListPage")
 
-        return DropdownListPage(self.driver)
+        return self._page("DropdownListPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_dynamic_content_link(self, page_name: str = "Dynamic Content") -> DynamicContentPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.DYNAMIC_CONTENT_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.DYNAMIC_CONTENT_LINK, "DynamicContentPage")
 
-        return DynamicContentPage(self.driver)
+        return self._page("DynamicContentPage")
 
     @allure.step("Return object of {page_name} page")
     def get_dynamic_content_page(self, page_name: str = "Dynamic Content") -> DynamicContentPage:
-        self.logger.info(f"Returning object of {page_name} page.")
+        self.logger.info("Returning page object.", page_name=page_name)
 
-        return DynamicContentPage(self.driver)
+        return self._page("DynamicContentPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_dynamic_controls_link(self, page_name: str = "Dynamic Controls") -> DynamicControlsPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.DYNAMIC_CONTROLS_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.DYNAMIC_CONTROLS_LINK, "DynamicControlsPage")
 
-        return DynamicControlsPage(self.driver)
+        return self._page("DynamicControlsPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_dynamic_loading_link(self, page_name: str = "Dynamic Loading") -> DynamicLoadingPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.DYNAMIC_LOADING_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.DYNAMIC_LOADING_LINK, "DynamicLoadingPage")
 
-        return DynamicLoadingPage(self.driver)
+        return self._page("DynamicLoadingPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_entry_ad_link(self, page_name: str = "Entry Ad") -> EntryAdPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.ENTRY_AD_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.ENTRY_AD_LINK, "EntryAdPage")
 
-        return EntryAdPage(self.driver)
+        return self._page("EntryAdPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_exit_intent_link(self, page_name: str = "Exit Intent") -> ExitIntentPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.EXIT_INTENT_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.EXIT_INTENT_LINK, "ExitIntentPage")
 
-        return ExitIntentPage(self.driver)
+        return self._page("ExitIntentPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_file_download_link(self, page_name: str = "File Download") -> FilesDownloadPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.FILE_DOWNLOAD_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.FILE_DOWNLOAD_LINK, "FilesDownloadPage")
 
-        return FilesDownloadPage(self.driver)
+        return self._page("FilesDownloadPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_file_upload_link(self, page_name: str = "File Upload") -> FileUploadPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.FILE_UPLOAD_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.FILE_UPLOAD_LINK, "FileUploadPage")
 
-        return FileUploadPage(self.driver)
+        return self._page("FileUploadPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_floating_menu_link(self, page_name: str = "Floating Menu") -> FloatingMenuPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.FLOATING_MENU_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.FLOATING_MENU_LINK, "FloatingMenuPage")
 
-        return FloatingMenuPage(self.driver)
+        return self._page("FloatingMenuPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_form_authentication_link(self, page_name: str = "Form Authentication") -> FormAuthenticationPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.FORM_AUTH_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.FORM_AUTH_LINK, "FormAuthenticationPage")
 
-        return FormAuthenticationPage(self.driver)
+        return self._page("FormAuthenticationPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_frames_link(self, page_name: str = "Frames") -> FramesPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.FRAMES_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.FRAMES_LINK, "FramesPage")
 
-        return FramesPage(self.driver)
+        return self._page("FramesPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_geolocation_link(self, page_name: str = "Geolocation") -> GeolocationPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.GEOLOCATION_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.GEOLOCATION_LINK, "GeolocationPage")
 
-        return GeolocationPage(self.driver, wait_for_load=True)
+        return self._page("GeolocationPage", wait_for_load=True)
 
     @allure.step("Navigate to {page_name} page")
     def click_horizontal_slider_link(self, page_name: str = "Horizontal Slider") -> HorizontalSliderPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.HORIZONTAL_SLIDER_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.HORIZONTAL_SLIDER_LINK, "HorizontalSliderPage")
 
-        return HorizontalSliderPage(self.driver)
+        return self._page("HorizontalSliderPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_hovers_link(self, page_name: str = "Hovers") -> HoversPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.HOVERS_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.HOVERS_LINK, "HoversPage")
 
-        return HoversPage(self.driver)
+        return self._page("HoversPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_infinite_scroll_link(self, page_name: str = "Infinite Scroll") -> InfiniteScrollPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.INFINITE_SCROLL_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.INFINITE_SCROLL_LINK, "InfiniteScrollPage")
 
-        return InfiniteScrollPage(self.driver)
+        return self._page("InfiniteScrollPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_inputs_link(self, page_name: str = "Inputs") -> InputsPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.INPUTS_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.INPUTS_LINK, "InputsPage")
 
-        return InputsPage(self.driver)
+        return self._page("InputsPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_jquery_ui_menus_link(self, page_name: str = "JQuery UI Menus") -> JQueryUIMenusPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.JQUERY_UI_MENUS_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.JQUERY_UI_MENUS_LINK, "JQueryUIMenusPage")
 
-        return JQueryUIMenusPage(self.driver)
+        return self._page("JQueryUIMenusPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_javascript_alerts_link(self, page_name: str = "JavaScript Alerts") -> JavaScriptAlertsPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.JAVASCRIPT_ALERTS_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.JAVASCRIPT_ALERTS_LINK, "JavaScriptAlertsPage")
 
-        return JavaScriptAlertsPage(self.driver)
+        return self._page("JavaScriptAlertsPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_javascript_onload_event_error_link(
         self, page_name: str = "JavaScript Alerts"
     ) -> JavaScriptOnloadRventErrorPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.JAVASCRIPT_ONLOAD_EVENT_ERROR_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.JAVASCRIPT_ONLOAD_EVENT_ERROR_LINK, "JavaScriptOnloadRventErrorPage")
 
-        return JavaScriptOnloadRventErrorPage(self.driver)
+        return self._page("JavaScriptOnloadRventErrorPage")
 
     @allure.step("Navigate to {page_name} page")
     def click_key_presses_link(self, page_name: str = "Key Presses") -> KeyPressesPage:
-        self.logger.info(f"Navigating to {page_name} page.")
-        self.click_element(MainPageLocators.KEY_PRESSES_LINK)
+        self.logger.info("Navigating to page.", page_name=page_name)
+        self._open_link(MainPageLocators.KEY_PRESSES_LINK, "KeyPressesPage")
 
-        return KeyPressesPage(self.driver)
+        return self._page("KeyPressesPage")
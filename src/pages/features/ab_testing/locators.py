@@ -2,12 +2,10 @@
 Module containing locators for AB Testing page object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class AbTestingPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "div.example h3", "by": By.CSS_SELECTOR}
-    TITLE: Locator = {"selector": "div.example h3", "by": By.CSS_SELECTOR}
-    CONTENT_PARAGRAPH: Locator = {"selector": "div#content p", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("div.example h3")
+    TITLE = Locator("div.example h3")
+    CONTENT_PARAGRAPH = Locator("div#content p")
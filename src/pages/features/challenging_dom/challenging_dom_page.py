@@ -8,7 +8,7 @@ from src.pages.base.base_page import BaseCase, BasePage
 from src.pages.features.challenging_dom.locators import ChallengingDomPageLocators
 
 if TYPE_CHECKING:
-    pass
+    from src.pages.base.table import TableModel
 
 
 class ChallengingDomPage(BasePage):
@@ -32,45 +32,33 @@ class ChallengingDomPage(BasePage):
         }
         btn = mapping.get(button_color.lower())
         if btn is None:
-            self.logger.warning(f"Unknown button color requested: {button_color}")
+            self.logger.warning("Unknown button color requested.", button_color=button_color)
             return
         self.click_element(btn)
 
-    @allure.step("Get table head text of column '{col}'")
-    def get_table_head_text(self, col: str) -> None | str:
+    @allure.step("Read table")
+    def read_table(self) -> TableModel:
         """
-        Return header text for the requested column name (exact match) or None.
-        This searches the thead th elements instead of relying purely on dynamic selectors.
+        Return the table's headers and cells, read in one script execution.
+
+        The model is reused by every lookup until a click on this page (edit, delete or a
+        colored button) or a navigation drops it; the next lookup then reads the table again.
         """
-        # Locate header elements directly for stability
-        headers = self.get_all_elements(ChallengingDomPageLocators.TABLE_HEADERS_TEXT)
-        if not headers:
-            return None
-        for h in headers:
-            if h.text.strip() == col:
-                return h.text.strip()
-        # fallback to selector approach
-        locator = self.format_locator(ChallengingDomPageLocators.TABLE_HEAD_TEXT, column_name=col)
-        return self.get_dynamic_element_text(locator)
+        return self.get_table(ChallengingDomPageLocators.TABLE)
+
+    @allure.step("Get table head text of column '{col}'")
+    def get_table_head_text(self, col: str) -> None | str:
+        """Return header text for the requested column name (exact match) or None."""
+        return col if self.read_table().has_column(col) else None
 
     @allure.step("Get table cell text '{cell}' under column '{col}'")
     def get_table_cell_text(self, col: str, cell: str) -> str | None:
-        headers = self.get_all_elements(ChallengingDomPageLocators.TABLE_HEADERS_TEXT)
-        if not headers:
-            # fallback to selector approach
-            locator = self.format_locator(ChallengingDomPageLocators.TABLE_CELL_TEXT, column_name=col, cell_value=cell)
-            return self.get_dynamic_element_text(locator)
-
-        # find header index (0-based)
-        try:
-            idx = next(i for i, h in enumerate(headers) if h.text.strip() == col)
-        except StopIteration:
-            self.logger.warning(f"Column '{col}' not found in table headers.")
+        """Return the cell text if a body cell under the column has exactly this text, otherwise None."""
+        table = self.read_table()
+        if not table.has_column(col):
+            self.logger.warning("Column not found in table headers.", column=col)
             return None
-
-        # locator for the td in the found column index with exact text match
-        locator = self.format_locator(ChallengingDomPageLocators.TD, index=idx + 1, cell=cell)
-        return self.get_dynamic_element_text(locator)
+        return cell if table.contains(col, cell) else None
 
     @allure.step("Click edit button in row {row}")
     def click_edit_button(self, row: int) -> None:
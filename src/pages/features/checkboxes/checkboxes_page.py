@@ -6,10 +6,11 @@ import allure
 from selenium.webdriver.common.by import By
 
 from src.pages.base.base_page import BaseCase, BasePage
+from src.pages.base.locator import Locator
 from src.pages.features.checkboxes.locators import CheckboxesPageLocators
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Sequence
 
 
 class CheckboxesPage(BasePage):
@@ -19,7 +20,7 @@ class CheckboxesPage(BasePage):
         super().__init__(driver)
         self.wait_for_page_to_load(CheckboxesPageLocators.PAGE_LOADED_INDICATOR)
 
-    def _get_checkbox_locator(self, index: int) -> dict[str, str]:
+    def _get_checkbox_locator(self, index: int) -> Locator:
         """
         Returns a locator for the checkbox at the given index (0-based).
         Example: index=0 → first checkbox, index=1 → second checkbox
@@ -35,9 +36,7 @@ class CheckboxesPage(BasePage):
 
         # Add :nth-of-type(index + 1) because CSS is 1-based
         dynamic_selector = f"{value}:nth-of-type({index + 1})"
-        locator = {"selector": dynamic_selector, "by": By.CSS_SELECTOR}
-
-        return locator
+        return Locator(dynamic_selector, By.CSS_SELECTOR)
 
     @allure.step("Click checkbox {index}")
     def _click_checkbox(self, index: int) -> None:
@@ -49,8 +48,14 @@ class CheckboxesPage(BasePage):
         locator = self._get_checkbox_locator(index)
         return self.is_element_selected(locator)
 
+    @allure.step("Get checked state of checkboxes {indices}")
+    def get_checkboxes_checked(self, indices: Sequence[int]) -> list[bool]:
+        """Return the checked state of each requested checkbox using a single state snapshot."""
+        snapshot = self.snapshot_states([self._get_checkbox_locator(index) for index in indices])
+        return [state.selected for state in snapshot]
+
     @allure.step("Set checkbox '{index}' to '{should_be_checked}'")
     def set_checkbox(self, index: int, should_be_checked: bool) -> None:
-        self.logger.info(f"Set checkbox '{index}' to '{should_be_checked}'.")
+        self.hot_path_logger.info("Set checkbox.", index=index, checked=should_be_checked)
         if self.is_checkbox_checked(index) != should_be_checked:
             self._click_checkbox(index)
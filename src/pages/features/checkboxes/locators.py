@@ -2,11 +2,9 @@
 Module containing locators for Checkboxes page object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class CheckboxesPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "div.example h3", "by": By.CSS_SELECTOR}
-    CHECKBOXES: Locator = {"selector": "form#checkboxes input[type=checkbox]", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("div.example h3")
+    CHECKBOXES = Locator("form#checkboxes input[type=checkbox]")
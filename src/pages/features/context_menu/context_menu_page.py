@@ -43,7 +43,7 @@ class ContextMenuPage(BasePage):
         try:
             alert = self.driver.wait_for_and_switch_to_alert(timeout=timeout)
             text = alert.text
-            self.logger.debug(f"Alert text: '{text}'")
+            self.logger.debug("Alert text.", text=text)
             return text
         except Exception:
             self.logger.error("Alert did not appear within timeout")
@@ -2,11 +2,9 @@
 Module containing locators for Context Menu page object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class ContextMenuPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "div.example h3", "by": By.CSS_SELECTOR}
-    HOT_SPOT_BOX: Locator = {"selector": "div#hot-spot", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("div.example h3")
+    HOT_SPOT_BOX = Locator("div#hot-spot")
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import allure
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -12,12 +10,14 @@ from selenium.common.exceptions import (
 from src.pages.base.base_page import BaseCase, BasePage
 from src.pages.features.digest_auth.locators import DigestAuthPageLocators
 
-if TYPE_CHECKING:
-    pass
-
 
 class DigestAuthPage(BasePage):
-    """Page object for the Digest Authentication page containing methods to test digest authentication scenarios"""
+    """
+    Page object for the Digest Authentication page containing methods to test digest authentication scenarios.
+
+    `is_login_successful` checks the page the browser was sent to with credentials in the URL.
+    Credential matrices are checked without a browser by `src.utils.http_auth.get_digest_client`.
+    """
 
     def __init__(self, driver: BaseCase) -> None:
         super().__init__(driver)
@@ -37,7 +37,7 @@ class DragAndDropPage(BasePage):
                 time.sleep(0.4)  # Allow DOM update
                 return
             except Exception as e:
-                self.logger.warning(f"SeleniumBase drag_and_drop failed: {e}. Falling back to JS.")
+                self.logger.warning("SeleniumBase drag_and_drop failed, falling back to JS.", error=str(e))
 
         # Fallback to improved JS simulation for Firefox or if SeleniumBase failed
         source = self.wait_for_visibility(DragAndDropPageLocators.BOX_A)
@@ -102,7 +102,7 @@ class DragAndDropPage(BasePage):
             self.driver.execute_script(js, source, target)
             self.logger.info("Drag and drop completed using JS simulation.")
         except Exception as e:
-            self.logger.error(f"JS drag_and_drop failed: {e}")
+            self.logger.error("JS drag_and_drop failed.", error=str(e))
             raise
         time.sleep(0.4)  # Allow DOM update
 
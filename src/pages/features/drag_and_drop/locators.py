@@ -2,13 +2,11 @@
 Module containing locators for Drag And Drop page object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class DragAndDropPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "div.example h3", "by": By.CSS_SELECTOR}
-    BOX_A: Locator = {"selector": "div#column-a", "by": By.CSS_SELECTOR}
-    BOX_B: Locator = {"selector": "div#column-b", "by": By.CSS_SELECTOR}
-    BOX_HEADER: Locator = {"selector": "div#column-{box} header", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("div.example h3")
+    BOX_A = Locator("div#column-a")
+    BOX_B = Locator("div#column-b")
+    BOX_HEADER = Locator("div#column-{box} header")
@@ -32,8 +32,8 @@ class DropdownListPage(BasePage):
             select = Select(select_element)
             selected_option = select.first_selected_option
             selected_text = selected_option.text.strip()
-            self.logger.debug(f"Selected option text: '{selected_text}'")
+            self.hot_path_logger.debug("Selected option.", text=selected_text)
             return selected_text == option
         except Exception as e:
-            self.logger.error(f"Failed to get selected option: {e}")
+            self.hot_path_logger.error("Failed to get selected option.", error=str(e))
             return False
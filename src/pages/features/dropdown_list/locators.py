@@ -2,11 +2,9 @@
 Module containing locators for Dropdown List page object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class DropdownListPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "div.example h3", "by": By.CSS_SELECTOR}
-    DROPDOWN: Locator = {"selector": "select#dropdown", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("div.example h3")
+    DROPDOWN = Locator("select#dropdown")
@@ -6,6 +6,7 @@ import allure
 
 from src.pages.base.base_page import BaseCase, BasePage
 from src.pages.features.dynamic_content.locators import DynamicContentPageLocators
+from src.utils.resource_blocking import ResourceKind
 
 if TYPE_CHECKING:
     pass
@@ -14,25 +15,18 @@ if TYPE_CHECKING:
 class DynamicContentPage(BasePage):
     """Page object for the Dynamic Content page containing methods to interact with and validate page functionality"""
 
+    required_resources = frozenset({ResourceKind.image})
+
     def __init__(self, driver: BaseCase) -> None:
         super().__init__(driver)
         self.wait_for_page_to_load(DynamicContentPageLocators.PAGE_LOADED_INDICATOR)
 
     @allure.step("Get all content blocks data")
     def get_all_content_blocks(self) -> list:
-        blocks = self.get_all_elements(DynamicContentPageLocators.CONTENT_BLOCKS)
-        data = []
-        for block in blocks:
-            try:
-                img = block.find_element(
-                    DynamicContentPageLocators.IMAGE_IN_BLOCK["by"],
-                    DynamicContentPageLocators.IMAGE_IN_BLOCK["selector"],
-                ).get_attribute("src")
-                text = block.find_element(
-                    DynamicContentPageLocators.TEXT_IN_BLOCK["by"], DynamicContentPageLocators.TEXT_IN_BLOCK["selector"]
-                ).text.strip()
-                data.append({"image": img, "text": text})
-            except Exception:
-                self.logger.warning("Failed to parse block content")
-                continue
-        return data
+        images = self.get_elements_properties(DynamicContentPageLocators.IMAGE_IN_BLOCK, ["src"])
+        texts = self.get_elements_properties(DynamicContentPageLocators.TEXT_IN_BLOCK, ["innerText"])
+        if len(images) != len(texts):
+            self.logger.warning("Mismatched block content.", images=len(images), texts=len(texts))
+        return [
+            {"image": image["src"], "text": (text["innerText"] or "").strip()} for image, text in zip(images, texts)
+        ]
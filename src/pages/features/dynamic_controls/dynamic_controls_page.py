@@ -21,14 +21,18 @@ class DynamicControlsPage(BasePage):
 
     @allure.step("Click remove button")
     def click_remove_button(self, timeout: int = 10) -> None:
-        self.click_element(DynamicControlsPageLocators.REMOVE_BTN)
-        if not self.wait_for_loader(DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout):
+        timing = self.click_and_wait_for_loader(
+            DynamicControlsPageLocators.REMOVE_BTN, DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout
+        )
+        if not timing.completed:
             self.logger.warning("Loader did not complete normally, continuing test...")
 
     @allure.step("Click add button")
     def click_add_button(self, timeout: int = 10) -> None:
-        self.click_element(DynamicControlsPageLocators.ADD_BTN)
-        if not self.wait_for_loader(DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout):
+        timing = self.click_and_wait_for_loader(
+            DynamicControlsPageLocators.ADD_BTN, DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout
+        )
+        if not timing.completed:
             self.logger.warning("Loader did not complete normally, continuing test...")
 
     @allure.step("Check if checkbox is visible or not visible")
@@ -41,14 +45,18 @@ class DynamicControlsPage(BasePage):
 
     @allure.step("Click enable button")
     def click_enable_button(self, timeout: int = 10) -> None:
-        self.click_element(DynamicControlsPageLocators.ENABLE_BTN)
-        if not self.wait_for_loader(DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout):
+        timing = self.click_and_wait_for_loader(
+            DynamicControlsPageLocators.ENABLE_BTN, DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout
+        )
+        if not timing.completed:
             self.logger.warning("Loader did not complete normally, continuing test...")
 
     @allure.step("Click disable button")
     def click_disable_button(self, timeout: int = 10) -> None:
-        self.click_element(DynamicControlsPageLocators.DISABLE_BTN)
-        if not self.wait_for_loader(DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout):
+        timing = self.click_and_wait_for_loader(
+            DynamicControlsPageLocators.DISABLE_BTN, DynamicControlsPageLocators.WAIT_LOADER, timeout=timeout
+        )
+        if not timing.completed:
             self.logger.warning("Loader did not complete normally, continuing test...")
 
     @allure.step("Check if textbox is enabled or disabled")
@@ -4,19 +4,19 @@ Module containing locators for Dynamic Controls page object.
 
 from selenium.webdriver.common.by import By
 
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class DynamicControlsPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h4", "by": By.CSS_SELECTOR}
-    WAIT_LOADER: Locator = {"selector": "#loading", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator(".example h4")
+    WAIT_LOADER = Locator("#loading")
 
-    A_CHECKBOX: Locator = {"selector": "input[type=checkbox]", "by": By.CSS_SELECTOR}
-    REMOVE_BTN: Locator = {"selector": "//button[text()='Remove']", "by": By.XPATH}
-    ADD_BTN: Locator = {"selector": "//button[text()='Add']", "by": By.XPATH}
-    REMOVE_ADD_MSG: Locator = {"selector": "#checkbox-example #message", "by": By.CSS_SELECTOR}
+    A_CHECKBOX = Locator("input[type=checkbox]")
+    REMOVE_BTN = Locator("//button[text()='Remove']", By.XPATH)
+    ADD_BTN = Locator("//button[text()='Add']", By.XPATH)
+    REMOVE_ADD_MSG = Locator("#checkbox-example #message")
 
-    TEXTBOX: Locator = {"selector": "input[type=text]", "by": By.CSS_SELECTOR}
-    ENABLE_BTN: Locator = {"selector": "//button[text()='Enable']", "by": By.XPATH}
-    DISABLE_BTN: Locator = {"selector": "//button[text()='Disable']", "by": By.XPATH}
-    ENABLE_DISABLE_MSG: Locator = {"selector": "#input-example #message", "by": By.CSS_SELECTOR}
+    TEXTBOX = Locator("input[type=text]")
+    ENABLE_BTN = Locator("//button[text()='Enable']", By.XPATH)
+    DISABLE_BTN = Locator("//button[text()='Disable']", By.XPATH)
+    ENABLE_DISABLE_MSG = Locator("#input-example #message")
@@ -22,7 +22,7 @@ class DynamicLoadingPage(BasePage):
 
     @allure.step("Navigate to {page_name} page")
     def click_example_1_link(self, page_name: str = "Example 1: Element on page that is hidden") -> Example1Page:
-        self.logger.info(f"Navigating to {page_name} page.")
+        self.logger.info("Navigating to page.", page_name=page_name)
         self.click_element(DynamicLoadingPageLocators.EXAMPLE_1_LINK)
         from src.pages.features.dynamic_loading.example_1_page import Example1Page
 
@@ -30,7 +30,7 @@ class DynamicLoadingPage(BasePage):
 
     @allure.step("Navigate to {page_name} page")
     def click_example_2_link(self, page_name: str = "Example 2: Element rendered after the fact") -> Example2Page:
-        self.logger.info(f"Navigating to {page_name} page.")
+        self.logger.info("Navigating to page.", page_name=page_name)
         self.click_element(DynamicLoadingPageLocators.EXAMPLE_2_LINK)
         from src.pages.features.dynamic_loading.example_2_page import Example2Page
 
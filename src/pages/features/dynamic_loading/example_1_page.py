@@ -20,8 +20,11 @@ class Example1Page(BasePage):
 
     @allure.step("Click start button")
     def click_start_button(self, timeout: int = 10) -> None:
-        self.click_element(Example1PageLocators.START_BTN)
-        self.wait_for_loader(Example1PageLocators.WAIT_LOADER, timeout=timeout)
+        timing = self.click_and_wait_for_loader(
+            Example1PageLocators.START_BTN, Example1PageLocators.WAIT_LOADER, timeout=timeout
+        )
+        if not timing.completed:
+            self.logger.warning("Loader did not complete normally, continuing test...")
 
     @allure.step("Get success message")
     def get_success_message(self) -> str:
@@ -4,11 +4,11 @@ Module containing locators for Entry Ad page object.
 
 from selenium.webdriver.common.by import By
 
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class EntryAdPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h3", "by": By.CSS_SELECTOR}
-    MODAL_LOADED_INDICATOR: Locator = {"selector": ".modal-title h3", "by": By.CSS_SELECTOR}
-    CLOSE_BTN: Locator = {"selector": "div.modal-footer p", "by": By.CSS_SELECTOR}
-    RE_ENABLE_LINK: Locator = {"selector": "click here", "by": By.LINK_TEXT}
+    PAGE_LOADED_INDICATOR = Locator(".example h3")
+    MODAL_LOADED_INDICATOR = Locator(".modal-title h3")
+    CLOSE_BTN = Locator("div.modal-footer p")
+    RE_ENABLE_LINK = Locator("click here", By.LINK_TEXT)
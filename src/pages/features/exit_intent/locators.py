@@ -4,11 +4,11 @@ Module containing locators for Exit Intent page object.
 
 from selenium.webdriver.common.by import By
 
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class ExitIntentPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h3", "by": By.CSS_SELECTOR}
-    PAGE_BODY: Locator = {"selector": "body", "by": By.TAG_NAME}
-    MODAL_LOADED_INDICATOR: Locator = {"selector": ".modal-title h3", "by": By.CSS_SELECTOR}
-    CLOSE_BTN: Locator = {"selector": "div.modal-footer p", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator(".example h3")
+    PAGE_BODY = Locator("body", By.TAG_NAME)
+    MODAL_LOADED_INDICATOR = Locator(".modal-title h3")
+    CLOSE_BTN = Locator("div.modal-footer p")
@@ -6,6 +6,7 @@ import allure
 
 from src.pages.base.base_page import BaseCase, BasePage
 from src.pages.features.files_download.locators import FilesDownloadPageLocators
+from src.utils.http_downloads import HttpDownloader, HttpDownloadReport
 
 if TYPE_CHECKING:
     pass
@@ -20,10 +21,33 @@ class FilesDownloadPage(BasePage):
 
     @allure.step("Get list of files links")
     def get_list_of_files_links(self) -> list[str]:
-        elements = self.get_all_elements(FilesDownloadPageLocators.FILE_LINK)
-        return [elem.get_attribute("href") for elem in elements]
-
-    @allure.step("Get list of files links")
-    def download_files(self, files_links: list[str], dest_folder: str) -> None:
-        for link in files_links:
-            self.driver.download_file(link, dest_folder)
+        links = self.get_elements_properties(FilesDownloadPageLocators.FILE_LINK, ["href"])
+        return [link["href"] for link in links]
+
+    @allure.step("Download files")
+    def download_files(self, files_links: list[str], dest_folder: str) -> HttpDownloadReport:
+        """
+        Download the files concurrently over HTTP with the browser's cookies and user agent.
+
+        Files that fail, or whose size does not match Content-Length, are logged and left out
+        of `dest_folder`; the returned report lists them with per-file timings.
+        """
+        with HttpDownloader(max_workers=self.page_config.download_workers) as downloader:
+            downloader.use_browser_identity(self.driver.driver)
+            report = downloader.download_all(files_links, dest_folder)
+
+        for download in report.downloads:
+            self.hot_path_logger.debug(
+                "File downloaded.", name=download.name, size_bytes=download.size_bytes, elapsed_s=download.elapsed_s
+            )
+        for url, error in report.failures.items():
+            self.logger.warning("File download failed.", url=url, error=error)
+        self.logger.info(
+            "Files downloaded.",
+            files=len(report.downloads),
+            failed=len(report.failures),
+            total_bytes=report.total_bytes,
+            elapsed_s=round(report.elapsed_s, 3),
+            throughput_bps=round(report.throughput_bps or 0),
+        )
+        return report
@@ -2,11 +2,9 @@
 Module containing locators for Files Download page object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class FilesDownloadPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h3", "by": By.CSS_SELECTOR}
-    FILE_LINK: Locator = {"selector": ".example a[href^='download']", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator(".example h3")
+    FILE_LINK = Locator(".example a[href^='download']")
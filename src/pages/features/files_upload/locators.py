@@ -4,16 +4,16 @@ Module containing locators for Files Upload page object.
 
 from selenium.webdriver.common.by import By
 
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class FilesUploadPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h3", "by": By.CSS_SELECTOR}
-    FILE_UPLOAD: Locator = {"selector": "file-upload", "by": By.ID}
-    UPLOAD_BTN: Locator = {"selector": "file-submit", "by": By.ID}
-    UPLOAD_BOX: Locator = {"selector": "div[id=drag-drop-upload]", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator(".example h3")
+    FILE_UPLOAD = Locator("file-upload", By.ID)
+    UPLOAD_BTN = Locator("file-submit", By.ID)
+    UPLOAD_BOX = Locator("div[id=drag-drop-upload]")
 
 
 class FileUploadedPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h3", "by": By.CSS_SELECTOR}
-    UPLOADED_FILE: Locator = {"selector": "uploaded-files", "by": By.ID}
+    PAGE_LOADED_INDICATOR = Locator(".example h3")
+    UPLOADED_FILE = Locator("uploaded-files", By.ID)
@@ -4,9 +4,9 @@ Module containing locators for Floating Menu page object.
 
 from selenium.webdriver.common.by import By
 
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class FloatingMenuPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h3", "by": By.CSS_SELECTOR}
-    MENU_ITEM: Locator = {"selector": "{item}", "by": By.LINK_TEXT}
+    PAGE_LOADED_INDICATOR = Locator(".example h3")
+    MENU_ITEM = Locator("{item}", By.LINK_TEXT)
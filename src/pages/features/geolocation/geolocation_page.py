@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import allure
 
-from src.config import settings
 from src.pages.base.base_page import BaseCase, BasePage
 from src.pages.features.geolocation.locators import GeolocationPageLocators
 
@@ -35,15 +35,18 @@ class GeolocationPage(BasePage):
     def _inject_chrome_geolocation_mock(self) -> None:
         """Inject geolocation mock for Chrome browser."""
 
-        self.driver.execute_cdp_cmd(
-            "Browser.grantPermissions",
-            {"origin": "https://the-internet.herokuapp.com", "permissions": ["geolocation"]},
-        )
+        base_url = urlsplit(str(self.base_url))
+        permissions = {"origin": f"{base_url.scheme}://{base_url.netloc}", "permissions": ["geolocation"]}
+        # In a shared Chrome, grant to this test's browser context rather than the default one
+        browser_context = getattr(self.driver.driver, "browser_context", None)
+        if browser_context is not None:
+            permissions["browserContextId"] = browser_context.context_id
+        self.driver.execute_cdp_cmd("Browser.grantPermissions", permissions)
         self.driver.execute_cdp_cmd(
             "Emulation.setGeolocationOverride",
             {
-                "latitude": settings.GEOLOCATION_LAT,
-                "longitude": settings.GEOLOCATION_LON,
+                "latitude": self.page_config.geolocation_lat,
+                "longitude": self.page_config.geolocation_lon,
                 "accuracy": 100,
             },
         )
@@ -56,8 +59,8 @@ class GeolocationPage(BasePage):
             value: function(success, error) {{
                 success({{
                     coords: {{
-                        latitude: {settings.GEOLOCATION_LAT},
-                        longitude: {settings.GEOLOCATION_LON},
+                        latitude: {self.page_config.geolocation_lat},
+                        longitude: {self.page_config.geolocation_lon},
                         accuracy: 100,
                         altitude: null,
                         altitudeAccuracy: null,
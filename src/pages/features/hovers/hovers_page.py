@@ -7,6 +7,7 @@ import allure
 from src.pages.base.base_page import BaseCase, BasePage
 from src.pages.features.hovers.hovers_user_page import HoversUserPage
 from src.pages.features.hovers.locators import HoversPageLocators
+from src.utils.resource_blocking import ResourceKind
 
 if TYPE_CHECKING:
     pass
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 class HoversPage(BasePage):
     """Page object for the Hovers page containing methods to interact with and validate page functionality"""
 
+    required_resources = frozenset({ResourceKind.image})
+
     def __init__(self, driver: BaseCase) -> None:
         super().__init__(driver)
         self.wait_for_page_to_load(HoversPageLocators.PAGE_LOADED_INDICATOR)
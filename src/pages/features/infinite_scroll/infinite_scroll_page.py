@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from time import sleep
 from typing import TYPE_CHECKING
 
 import allure
@@ -9,21 +8,50 @@ from src.pages.base.base_page import BaseCase, BasePage
 from src.pages.features.infinite_scroll.locators import InfiniteScrollPageLocators
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterator
+
+    from src.pages.base.content_load import ContentLoad
 
 
 class InfiniteScrollPage(BasePage):
-    """Page object for the Infinite Scroll page containing methods to interact with and validate page functionality"""
+    """
+    Page object for the Infinite Scroll page containing methods to interact with and validate page functionality
+
+    Scrolling waits in-page for the next `.jscroll-added` paragraphs instead of sleeping, and
+    the page remembers how many it has seen, so every scroll reports only the new ones.
+    """
 
     def __init__(self, driver: BaseCase) -> None:
         super().__init__(driver)
         self.wait_for_page_to_load(InfiniteScrollPageLocators.PAGE_LOADED_INDICATOR)
+        self._paragraphs_seen = self.get_number_of_elements(InfiniteScrollPageLocators.ADDED_PARAGRAPHS)
 
     @allure.step("Get page height")
     def get_page_height(self) -> int:
         return self.driver.execute_script("return document.body.scrollHeight")
 
     @allure.step("Scroll to bottom of page")
-    def scroll_to_bottom_of_page(self) -> None:
-        self.driver.scroll_down(100)
-        sleep(1)
+    def scroll_to_bottom_of_page(self, timeout: int | float | None = None) -> ContentLoad:
+        """
+        Scroll down and wait for the next paragraphs to finish loading.
+
+        The result's `added` holds the new paragraphs. On timeout `completed` is False, and
+        `page_grew` tells a page that grew without new paragraphs from one that did not change.
+        """
+        load = self.scroll_and_wait_for_content(
+            InfiniteScrollPageLocators.ADDED_PARAGRAPHS,
+            self._paragraphs_seen,
+            timeout,
+            pending_locator=InfiniteScrollPageLocators.LOADING_PLACEHOLDER,
+        )
+        self._paragraphs_seen += len(load.added)
+        return load
+
+    def iter_loaded_paragraphs(self, timeout: int | float | None = None) -> Iterator[tuple[str, ...]]:
+        """
+        Keep scrolling and yield each chunk of newly appended paragraphs once it has loaded.
+
+        Stops when a scroll loads nothing within `timeout`; take N chunks with `itertools.islice`.
+        """
+        while (load := self.scroll_to_bottom_of_page(timeout)).completed:
+            yield load.added
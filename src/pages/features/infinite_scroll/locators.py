@@ -2,10 +2,10 @@
 Module containing locators for Infinite Scroll pages object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class InfiniteScrollPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": ".example h3", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator(".example h3")
+    ADDED_PARAGRAPHS = Locator(".jscroll-added")
+    LOADING_PLACEHOLDER = Locator(".jscroll-loading")  # Inside a .jscroll-added chunk until it is filled in
@@ -2,11 +2,9 @@
 Module containing locators for Inputs pages object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class InputsPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "h3", "by": By.CSS_SELECTOR}
-    INPUT_NUMBER: Locator = {"selector": "input[type=number]", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("h3")
+    INPUT_NUMBER = Locator("input[type=number]")
@@ -2,14 +2,12 @@
 Module containing locators for JavaScript Alerts pages object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class JavaScriptAlertsPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "h3", "by": By.CSS_SELECTOR}
-    JS_ALERTS_BTN: Locator = {"selector": "button[onclick='jsAlert()'", "by": By.CSS_SELECTOR}
-    JS_CONFIRM_BTN: Locator = {"selector": "button[onclick='jsConfirm()'", "by": By.CSS_SELECTOR}
-    JS_PROMPT_BTN: Locator = {"selector": "button[onclick='jsPrompt()'", "by": By.CSS_SELECTOR}
-    RESULT: Locator = {"selector": "p#result", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("h3")
+    JS_ALERTS_BTN = Locator("button[onclick='jsAlert()'")
+    JS_CONFIRM_BTN = Locator("button[onclick='jsConfirm()'")
+    JS_PROMPT_BTN = Locator("button[onclick='jsPrompt()'")
+    RESULT = Locator("p#result")
@@ -2,10 +2,8 @@
 Module containing locators for JavaScript onload event error pages object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class JavaScriptOnloadRventErrorPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "p", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("p")
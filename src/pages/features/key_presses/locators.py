@@ -2,12 +2,10 @@
 Module containing locators for Key Presses pages object.
 """
 
-from selenium.webdriver.common.by import By
-
-from src.pages.base.base_page import Locator
+from src.pages.base.locator import Locator
 
 
 class KeyPressesPageLocators:
-    PAGE_LOADED_INDICATOR: Locator = {"selector": "h3", "by": By.CSS_SELECTOR}
-    TEXT_INPUT: Locator = {"selector": "input#target", "by": By.CSS_SELECTOR}
-    RESULT: Locator = {"selector": "p#result", "by": By.CSS_SELECTOR}
+    PAGE_LOADED_INDICATOR = Locator("h3")
+    TEXT_INPUT = Locator("input#target")
+    RESULT = Locator("p#result")
@@ -0,0 +1,73 @@
+"""
+Lazy registry of the feature page objects reachable from the index page.
+
+Page classes are looked up by name and their modules imported on first use, so importing
+MainPage (which every UI test does at collection time) does not import all feature page
+modules and what they depend on. Each xdist worker only pays for the pages its tests open.
+"""
+
+from __future__ import annotations
+
+import importlib
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.pages.base.base_page import BasePage
+
+_FEATURES_PACKAGE = "src.pages.features"
+
+# Page class name -> module defining it, relative to src.pages.features
+PAGES: dict[str, str] = {
+    "ABTestingPage": "ab_testing.ab_testing_page",
+    "AddRemoveElementsPage": "add_remove_elements.add_remove_elements_page",
+    "BasicAuthPage": "basic_auth.basic_auth_page",
+    "BrokenImagesPage": "broken_images.broken_images_page",
+    "ChallengingDomPage": "challenging_dom.challenging_dom_page",
+    "CheckboxesPage": "checkboxes.checkboxes_page",
+    "ContextMenuPage": "context_menu.context_menu_page",
+    "DigestAuthPage": "digest_auth.digest_auth_page",
+    "DragAndDropPage": "drag_and_drop.drag_and_drop_page",
+    "DropdownListPage": "dropdown_list.dropdown_list_page",
+    "DynamicContentPage": "dynamic_content.dynamic_content_page",
+    "DynamicControlsPage": "dynamic_controls.dynamic_controls_page",
+    "DynamicLoadingPage": "dynamic_loading.dynamic_loading_page",
+    "EntryAdPage": "entry_ad.entry_ad_page",
+    "ExitIntentPage": "exit_intent.exit_intent_page",
+    "FilesDownloadPage": "files_download.files_download_page",
+    "FileUploadPage": "files_upload.files_upload_page",
+    "FloatingMenuPage": "floating_menu.floating_menu_page",
+    "FormAuthenticationPage": "form_authentication.form_authentication_page",
+    "FramesPage": "frames.frames_page",
+    "GeolocationPage": "geolocation.geolocation_page",
+    "HorizontalSliderPage": "horizontal_slider.horizontal_slider_page",
+    "HoversPage": "hovers.hovers_page",
+    "InfiniteScrollPage": "infinite_scroll.infinite_scroll_page",
+    "InputsPage": "inputs.inputs_page",
+    "JavaScriptAlertsPage": "javascript_alerts.javascript_alerts_page",
+    "JavaScriptOnloadRventErrorPage": "javascript_onload_event_error.javascript_onload_event_error_page",
+    "JQueryUIMenusPage": "jquery_ui_menus.jquery_ui_menus_page",
+    "KeyPressesPage": "key_presses.key_presses_page",
+}
+
+
+@cache
+def get_page_class(name: str) -> type[BasePage]:
+    """
+    Return the page class registered as `name`, importing its module on first use.
+
+    Raises:
+        KeyError: If no page is registered under `name`
+    """
+    try:
+        module_name = PAGES[name]
+    except KeyError:
+        raise KeyError(f"No page object registered as '{name}'") from None
+    page_class: type[BasePage] = getattr(importlib.import_module(f"{_FEATURES_PACKAGE}.{module_name}"), name)
+    return page_class
+
+
+def import_all() -> None:
+    """Import every registered page module (e.g. to warm up a long-lived process)."""
+    for name in PAGES:
+        get_page_class(name)
@@ -0,0 +1,17 @@
+"""
+Offline replica of the application under test (the-internet.herokuapp.com).
+
+Serves the pages the page objects in `src/pages/features/*` use from a local asyncio
+server, so the UI suite can run without network access or third-party flakiness.
+"""
+
+from src.replica.app import ReplicaApp
+from src.replica.server import ReplicaServer
+
+
+def create_server(host: str = "127.0.0.1", port: int = 0) -> ReplicaServer:
+    """Return a (not yet started) server hosting a fresh replica application."""
+    return ReplicaServer(ReplicaApp(), host=host, port=port)
+
+
+__all__ = ["ReplicaApp", "ReplicaServer", "create_server"]
@@ -0,0 +1,33 @@
+"""
+Run the replica in the foreground, e.g. to browse it or to point a manual test run at it.
+
+Usage:
+    python -m src.replica [--host HOST] [--port PORT]
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+
+from src.replica import create_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on, 0 for any free port (default: 8000)")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port).start()
+    print(f"Replica serving on {server.base_url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
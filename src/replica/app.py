@@ -0,0 +1,830 @@
+"""
+Request handlers and HTML for the replica of the application under test.
+
+Each page reproduces only the DOM, behaviour and text the page objects in
+`src/pages/features/*` rely on (element ids and classes, link texts, messages), not the
+full markup or styling of the original site.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import html
+import json
+import random
+import secrets
+from collections.abc import Callable
+from email.parser import BytesParser
+from email.policy import HTTP
+from urllib.parse import quote, unquote
+
+from src.replica.server import Request, Response
+
+AUTH_USERNAME = "admin"
+AUTH_PASSWORD = "admin"
+LOGIN_USERNAME = "tomsmith"
+LOGIN_PASSWORD = "SuperSecretPassword!"
+DIGEST_REALM = "Protected Area"
+
+# 1x1 transparent GIF served for every image the pages reference
+_PIXEL_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+_FLASH_COOKIE = "replica_flash"
+
+_SEED_DOWNLOADS: dict[str, bytes] = {
+    "some-file.txt": b"Replica download fixture.\n",
+    "sample.csv": b"id,name\n1,alpha\n2,beta\n",
+    "sample.json": b'{"replica": true}\n',
+}
+
+_MENU_DOWNLOADS: dict[str, bytes] = {
+    "menu.pdf": b"%PDF-1.4\n% replica\n",
+    "menu.csv": b"item,price\n",
+    "menu.xls": b"replica\n",
+}
+
+_LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore "
+    "et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut "
+    "aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse."
+).split()
+
+_INDEX_LINKS = [
+    ("abtest", "A/B Testing"),
+    ("add_remove_elements/", "Add/Remove Elements"),
+    ("basic_auth", "Basic Auth"),
+    ("broken_images", "Broken Images"),
+    ("challenging_dom", "Challenging DOM"),
+    ("checkboxes", "Checkboxes"),
+    ("context_menu", "Context Menu"),
+    ("digest_auth", "Digest Authentication"),
+    ("drag_and_drop", "Drag and Drop"),
+    ("dropdown", "Dropdown"),
+    ("dynamic_content", "Dynamic Content"),
+    ("dynamic_controls", "Dynamic Controls"),
+    ("dynamic_loading", "Dynamic Loading"),
+    ("entry_ad", "Entry Ad"),
+    ("exit_intent", "Exit Intent"),
+    ("download", "File Download"),
+    ("upload", "File Upload"),
+    ("floating_menu", "Floating Menu"),
+    ("login", "Form Authentication"),
+    ("frames", "Frames"),
+    ("geolocation", "Geolocation"),
+    ("horizontal_slider", "Horizontal Slider"),
+    ("hovers", "Hovers"),
+    ("infinite_scroll", "Infinite Scroll"),
+    ("inputs", "Inputs"),
+    ("jqueryui/menu", "JQuery UI Menus"),
+    ("javascript_alerts", "JavaScript Alerts"),
+    ("javascript_error", "JavaScript onload event error"),
+    ("key_presses", "Key Presses"),
+]
+
+_MODAL = """
+<div id="modal" class="modal" style="display: none">
+  <div class="modal-window">
+    <div class="modal-title"><h3>This is a modal window</h3></div>
+    <div class="modal-body"><p>It's commonly used to encourage a user to take an action.</p></div>
+    <div class="modal-footer"><p onclick="closeModal()">Close</p></div>
+  </div>
+</div>
+<style>
+  .modal { position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0, 0, 0, 0.6); }
+  .modal-window { background: #fff; width: 400px; margin: 100px auto; padding: 10px; }
+  .modal-footer p { cursor: pointer; }
+</style>
+"""
+
+_KEY_NAMES = """
+var KEY_NAMES = {8: "BACK_SPACE", 9: "TAB", 13: "ENTER", 16: "SHIFT", 17: "CONTROL", 18: "ALT",
+  27: "ESCAPE", 32: "SPACE", 37: "LEFT", 38: "UP", 39: "RIGHT", 40: "DOWN", 46: "DELETE"};
+for (var n = 0; n <= 9; n++) { KEY_NAMES[96 + n] = "NUMPAD" + n; KEY_NAMES[48 + n] = String(n); }
+for (var c = 65; c <= 90; c++) { KEY_NAMES[c] = String.fromCharCode(c); }
+"""
+
+
+def _page(title: str, body: str, head: str = "", body_attrs: str = "") -> Response:
+    document = f"""<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>The Internet</title>
+  <link rel="icon" href="/favicon.ico">
+  {head}
+</head>
+<body{body_attrs}>
+  <div class="row">
+    <div id="content" class="large-12 columns">
+      {body}
+    </div>
+  </div>
+  <div id="page-footer">Powered by a local replica ({html.escape(title)})</div>
+</body>
+</html>
+"""
+    return Response(body=document)
+
+
+def _example(title: str, content: str, tag: str = "h3") -> str:
+    return f'<div class="example">\n<{tag}>{title}</{tag}>\n{content}\n</div>'
+
+
+def _attachment(name: str, data: bytes) -> Response:
+    return Response(
+        body=data,
+        content_type="application/octet-stream",
+        headers=[("Content-Disposition", f'attachment; filename="{name}"')],
+    )
+
+
+def _with_flash(location: str, message: str, kind: str) -> Response:
+    value = quote(json.dumps({"message": message, "kind": kind}))
+    return Response.redirect(location, headers=[("Set-Cookie", f"{_FLASH_COOKIE}={value}; Path=/")])
+
+
+def _flash_html(request: Request) -> tuple[str, list[tuple[str, str]]]:
+    """Render and consume the flash message carried in the cookie set by `_with_flash`."""
+    raw = request.cookies.get(_FLASH_COOKIE)
+    if not raw:
+        return '<div id="flash-messages"></div>', []
+    flash = json.loads(unquote(raw))
+    markup = (
+        f'<div id="flash-messages"><div id="flash" class="flash {flash["kind"]}">'
+        f'{html.escape(flash["message"])}<a href="#" class="close">×</a></div></div>'
+    )
+    return markup, [("Set-Cookie", f"{_FLASH_COOKIE}=; Path=/; Max-Age=0")]
+
+
+class ReplicaApp:
+    """Routes requests to the replica pages; holds the state the pages share (uploads, digest nonces)."""
+
+    def __init__(self, loading_delay_ms: int = 1000) -> None:
+        self.loading_delay_ms = loading_delay_ms
+        self.uploads: dict[str, bytes] = {}
+        self._nonces: set[str] = set()
+        self._routes: dict[str, Callable[[Request], Response]] = {
+            "/": self.index,
+            "/favicon.ico": lambda request: Response(body=_PIXEL_GIF, content_type="image/gif"),
+            "/abtest": self.abtest,
+            "/add_remove_elements/": self.add_remove_elements,
+            "/basic_auth": self.basic_auth,
+            "/broken_images": self.broken_images,
+            "/challenging_dom": self.challenging_dom,
+            "/checkboxes": self.checkboxes,
+            "/context_menu": self.context_menu,
+            "/digest_auth": self.digest_auth,
+            "/drag_and_drop": self.drag_and_drop,
+            "/dropdown": self.dropdown,
+            "/dynamic_content": self.dynamic_content,
+            "/dynamic_controls": self.dynamic_controls,
+            "/dynamic_loading": self.dynamic_loading,
+            "/dynamic_loading/1": self.dynamic_loading_example,
+            "/dynamic_loading/2": self.dynamic_loading_example,
+            "/entry_ad": self.entry_ad,
+            "/exit_intent": self.exit_intent,
+            "/download": self.download,
+            "/upload": self.upload,
+            "/floating_menu": self.floating_menu,
+            "/login": self.login,
+            "/authenticate": self.authenticate,
+            "/secure": self.secure,
+            "/logout": self.logout,
+            "/frames": self.frames,
+            "/nested_frames": self.nested_frames,
+            "/frame_top": self.frame_top,
+            "/frame_left": lambda request: self.frame_body("LEFT"),
+            "/frame_middle": lambda request: self.frame_body("MIDDLE"),
+            "/frame_right": lambda request: self.frame_body("RIGHT"),
+            "/frame_bottom": lambda request: self.frame_body("BOTTOM"),
+            "/iframe": self.iframe,
+            "/geolocation": self.geolocation,
+            "/horizontal_slider": self.horizontal_slider,
+            "/hovers": self.hovers,
+            "/infinite_scroll": self.infinite_scroll,
+            "/inputs": self.inputs,
+            "/jqueryui/menu": self.jqueryui_menu,
+            "/javascript_alerts": self.javascript_alerts,
+            "/javascript_error": self.javascript_error,
+            "/key_presses": self.key_presses,
+        }
+
+    def __call__(self, request: Request) -> Response:
+        path = request.path
+        handler = self._routes.get(path)
+        if handler is not None:
+            return handler(request)
+        if path.startswith("/img/avatars/") or path == "/img/avatar-blank.jpg":
+            return Response(body=_PIXEL_GIF, content_type="image/gif")
+        if path.startswith("/download/"):
+            return self.download_file(path.removeprefix("/download/"))
+        if path.startswith("/jqueryui/menu/"):
+            name = path.rsplit("/", 1)[-1]
+            if name in _MENU_DOWNLOADS:
+                return _attachment(name, _MENU_DOWNLOADS[name])
+        if path.startswith("/users/"):
+            return _page("Not Found", "<h1>Not Found</h1>")
+        return Response(status=404, body="<h1>Not Found</h1>")
+
+    # ============================================================================
+    # INDEX AND STATIC PAGES
+    # ============================================================================
+
+    def index(self, request: Request) -> Response:
+        links = "\n".join(f'<li><a href="/{path}">{text}</a></li>' for path, text in _INDEX_LINKS)
+        body = f'<h1 class="heading">Welcome to the-internet</h1>\n<h2>Available Examples</h2>\n<ul>{links}</ul>'
+        return _page("Index", body)
+
+    def abtest(self, request: Request) -> Response:
+        title = random.choice(["A/B Test Control", "A/B Test Variation 1"])
+        paragraph = (
+            "<p>Also known as split testing. This is a way in which businesses are able to simultaneously test "
+            "and learn different versions of a page to see which text and/or functionality works best.</p>"
+        )
+        return _page("A/B Testing", _example(title, paragraph))
+
+    def add_remove_elements(self, request: Request) -> Response:
+        content = """
+<button onclick="addElement()">Add Element</button>
+<div id="elements"></div>
+<script>
+  function addElement() {
+    var button = document.createElement("button");
+    button.className = "added-manually";
+    button.textContent = "Delete";
+    button.onclick = function () { this.parentNode.removeChild(this); };
+    document.getElementById("elements").appendChild(button);
+  }
+</script>"""
+        return _page("Add/Remove Elements", _example("Add/Remove Elements", content))
+
+    def broken_images(self, request: Request) -> Response:
+        content = '<img src="asdf.jpg">\n<img src="hjkl.jpg">\n<img src="img/avatar-blank.jpg">'
+        return _page("Broken Images", _example("Broken Images", content))
+
+    def challenging_dom(self, request: Request) -> Response:
+        headers = "".join(
+            f"<th>{name}</th>" for name in ["Lorem", "Ipsum", "Dolor", "Sit", "Amet", "Diceret", "Action"]
+        )
+        columns = ["Iuvaret", "Apeirian", "Adipisci", "Definiebas", "Consequuntur", "Phaedrum"]
+        rows = "\n".join(
+            "<tr>"
+            + "".join(f"<td>{column}{i}</td>" for column in columns)
+            + '<td><a href="#edit">edit</a> <a href="#delete">delete</a></td></tr>'
+            for i in range(10)
+        )
+        content = f"""
+<div class="row">
+  <div class="large-2 columns">
+    <a id="{secrets.token_hex(4)}" href="" class="button">foo</a>
+    <a id="{secrets.token_hex(4)}" href="" class="button alert">bar</a>
+    <a id="{secrets.token_hex(4)}" href="" class="button success">baz</a>
+  </div>
+  <div class="large-10 columns">
+    <table><thead><tr>{headers}</tr></thead><tbody>{rows}</tbody></table>
+  </div>
+</div>"""
+        return _page("Challenging DOM", _example("Challenging DOM", content))
+
+    def checkboxes(self, request: Request) -> Response:
+        content = (
+            '<form id="checkboxes"><input type="checkbox"> checkbox 1<br>'
+            '<input type="checkbox" checked> checkbox 2</form>'
+        )
+        return _page("Checkboxes", _example("Checkboxes", content))
+
+    def context_menu(self, request: Request) -> Response:
+        content = """
+<p>Right-click in the box below to see one called 'the-internet'.</p>
+<div id="hot-spot" style="width: 250px; height: 150px; border: 5px dashed #000"
+     oncontextmenu="alert('You selected a context menu'); return false;"></div>"""
+        return _page("Context Menu", _example("Context Menu", content))
+
+    def drag_and_drop(self, request: Request) -> Response:
+        content = """
+<div id="columns">
+  <div class="column" id="column-a" draggable="true"><header>A</header></div>
+  <div class="column" id="column-b" draggable="true"><header>B</header></div>
+</div>
+<style>.column { float: left; width: 150px; height: 150px; margin: 5px; border: 2px solid #666; }</style>
+<script>
+  var dragSource = null;
+  document.querySelectorAll(".column").forEach(function (column) {
+    column.addEventListener("dragstart", function (e) {
+      dragSource = this;
+      e.dataTransfer.effectAllowed = "move";
+      e.dataTransfer.setData("text/html", this.innerHTML);
+    });
+    column.addEventListener("dragover", function (e) { e.preventDefault(); return false; });
+    column.addEventListener("drop", function (e) {
+      e.stopPropagation();
+      e.preventDefault();
+      if (dragSource && dragSource !== this) {
+        dragSource.innerHTML = this.innerHTML;
+        this.innerHTML = e.dataTransfer.getData("text/html");
+      }
+      return false;
+    });
+  });
+</script>"""
+        return _page("Drag and Drop", _example("Drag and Drop", content))
+
+    def dropdown(self, request: Request) -> Response:
+        content = """
+<select id="dropdown">
+  <option value="" disabled selected>Please select an option</option>
+  <option value="1">Option 1</option>
+  <option value="2">Option 2</option>
+</select>"""
+        return _page("Dropdown", _example("Dropdown List", content))
+
+    def dynamic_content(self, request: Request) -> Response:
+        avatars = f"{request.base_url}img/avatars/Original-Facebook-Geek-Profile-Avatar"
+        rows = "\n".join(
+            f'<div class="row"><div class="large-2 columns">'
+            f'<img src="{avatars}-{random.randint(1, 7)}.jpg">'
+            f'</div><div class="large-10 columns">{" ".join(random.choices(_LOREM, k=random.randint(15, 40)))}'
+            f"</div></div>"
+            for _ in range(3)
+        )
+        body = _example(
+            "Dynamic Content",
+            "<p>This example demonstrates the ever-evolving nature of content by loading new text and images "
+            "on each page refresh.</p>",
+        )
+        return _page("Dynamic Content", f'{body}\n<div id="content" class="large-10 columns">{rows}</div>')
+
+    def dynamic_controls(self, request: Request) -> Response:
+        delay = self.loading_delay_ms
+        content = f"""
+<p>This example demonstrates when elements (e.g., checkbox, input field, etc.) are changed asynchronously.</p>
+<h4>Remove/add</h4>
+<form id="checkbox-example">
+  <div id="checkbox"><input type="checkbox" label="blah"> A checkbox</div>
+  <button type="button" onclick="swapCheckbox(this)">Remove</button>
+</form>
+<h4>Enable/disable</h4>
+<form id="input-example">
+  <input type="text" disabled>
+  <button type="button" onclick="swapInput(this)">Enable</button>
+</form>
+<script>
+  function busy(form, button, done) {{
+    var message = form.querySelector("#message");
+    if (message) message.remove();
+    var loading = document.createElement("div");
+    loading.id = "loading";
+    loading.textContent = "Wait for it...";
+    form.appendChild(loading);
+    button.disabled = true;
+    setTimeout(function () {{
+      loading.remove();
+      button.disabled = false;
+      var result = document.createElement("p");
+      result.id = "message";
+      result.textContent = done();
+      form.appendChild(result);
+    }}, {delay});
+  }}
+  function swapCheckbox(button) {{
+    var form = document.getElementById("checkbox-example");
+    busy(form, button, function () {{
+      var box = document.getElementById("checkbox");
+      if (box) {{
+        box.remove();
+        button.textContent = "Add";
+        return "It's gone!";
+      }}
+      box = document.createElement("div");
+      box.id = "checkbox";
+      box.innerHTML = '<input type="checkbox"> A checkbox';
+      form.insertBefore(box, button);
+      button.textContent = "Remove";
+      return "It's back!";
+    }});
+  }}
+  function swapInput(button) {{
+    var form = document.getElementById("input-example");
+    var input = form.querySelector("input[type=text]");
+    busy(form, button, function () {{
+      input.disabled = !input.disabled;
+      button.textContent = input.disabled ? "Enable" : "Disable";
+      return input.disabled ? "It's disabled!" : "It's enabled!";
+    }});
+  }}
+</script>"""
+        return _page("Dynamic Controls", _example("Dynamic Controls", content, tag="h4"))
+
+    def dynamic_loading(self, request: Request) -> Response:
+        content = """
+<p>It's common to see an action get triggered that returns a result dynamically.</p>
+<a href="/dynamic_loading/1">Example 1: Element on page that is hidden</a><br>
+<a href="/dynamic_loading/2">Example 2: Element rendered after the fact</a>"""
+        return _page("Dynamic Loading", _example("Dynamically Loaded Page Elements", content))
+
+    def dynamic_loading_example(self, request: Request) -> Response:
+        hidden = request.path.endswith("/1")
+        title = "Example 1: Element on page that is hidden" if hidden else "Example 2: Element rendered after the fact"
+        finish = '<div id="finish" style="display: none"><h4>Hello World!</h4></div>' if hidden else ""
+        content = f"""
+<div id="start"><button onclick="start()">Start</button></div>
+<div id="loading" style="display: none">Loading... </div>
+{finish}
+<script>
+  function start() {{
+    document.getElementById("start").style.display = "none";
+    var loading = document.getElementById("loading");
+    loading.style.display = "block";
+    setTimeout(function () {{
+      loading.style.display = "none";
+      var finish = document.getElementById("finish");
+      if (!finish) {{
+        finish = document.createElement("div");
+        finish.id = "finish";
+        finish.innerHTML = "<h4>Hello World!</h4>";
+        loading.parentNode.appendChild(finish);
+      }}
+      finish.style.display = "block";
+    }}, {self.loading_delay_ms});
+  }}
+</script>"""
+        return _page("Dynamic Loading", _example("Dynamically Loaded Page Elements", f"<h4>{title}</h4>{content}"))
+
+    def entry_ad(self, request: Request) -> Response:
+        content = f"""
+<p>Displays an ad on page load.</p>
+<p>If closed, it will not appear on subsequent page loads.</p>
+<p>To re-enable it, <a id="restart-ad" href="#" onclick="restartAd(); return false;">click here</a>.</p>
+{_MODAL}
+<script>
+  var modal = document.getElementById("modal");
+  function closeModal() {{
+    modal.style.display = "none";
+    localStorage.setItem("entry_ad_dismissed", "1");
+  }}
+  function restartAd() {{
+    localStorage.removeItem("entry_ad_dismissed");
+    window.location.reload();
+  }}
+  if (!localStorage.getItem("entry_ad_dismissed")) {{
+    setTimeout(function () {{ modal.style.display = "block"; }}, 200);
+  }}
+</script>"""
+        return _page("Entry Ad", _example("Entry Ad", content))
+
+    def exit_intent(self, request: Request) -> Response:
+        content = f"""
+<p>Mouse out of the viewport pane and see a modal window appear.</p>
+{_MODAL}
+<script>
+  var modal = document.getElementById("modal");
+  function closeModal() {{ modal.style.display = "none"; }}
+  document.documentElement.addEventListener("mouseleave", function (e) {{
+    if (e.clientY <= 0) {{ modal.style.display = "block"; }}
+  }});
+</script>"""
+        return _page("Exit Intent", _example("Exit Intent", content))
+
+    # ============================================================================
+    # FILES
+    # ============================================================================
+
+    def download(self, request: Request) -> Response:
+        names = [*_SEED_DOWNLOADS, *self.uploads]
+        links = "\n".join(f'<a href="download/{quote(name)}">{html.escape(name)}</a><br>' for name in names)
+        return _page("File Download", _example("File Downloader", links))
+
+    def download_file(self, name: str) -> Response:
+        name = unquote(name)
+        data = self.uploads.get(name, _SEED_DOWNLOADS.get(name))
+        if data is None:
+            return Response(status=404, body="<h1>Not Found</h1>")
+        return _attachment(name, data)
+
+    def upload(self, request: Request) -> Response:
+        if request.method == "POST":
+            name, data = _parse_upload(request)
+            if name is None:
+                return _page("File Upload", "<h1>Internal Server Error</h1>")
+            self.uploads[name] = data
+            content = f'<div id="uploaded-files" class="panel text-center">{html.escape(name)}</div>'
+            return _page("File Uploaded", _example("File Uploaded!", content))
+        content = """
+<p>Choose a file on your system and then click upload. Or, drag and drop a file into the area below.</p>
+<form method="POST" enctype="multipart/form-data" action="/upload">
+  <input id="file-upload" type="file" name="file">
+  <br>
+  <input id="file-submit" class="button" type="submit" value="Upload">
+</form>
+<div id="drag-drop-upload" class="panel text-center" style="height: 200px; border: 2px dashed #999"></div>"""
+        return _page("File Upload", _example("File Uploader", content))
+
+    # ============================================================================
+    # FORMS AND AUTHENTICATION
+    # ============================================================================
+
+    def floating_menu(self, request: Request) -> Response:
+        items = "".join(
+            f'<li><a href="#{item.lower()}">{item}</a></li>' for item in ["Home", "News", "Contact", "About"]
+        )
+        paragraphs = "\n".join(f"<p>{' '.join(_LOREM)}</p>" for _ in range(40))
+        content = f"""
+<div id="menu" style="position: fixed; top: 0; right: 20px; background: #fff"><ul>{items}</ul></div>
+<div class="scroll large-10 columns large-centered">{paragraphs}</div>"""
+        return _page("Floating Menu", _example("Floating Menu", content))
+
+    def login(self, request: Request) -> Response:
+        flash, cookies = _flash_html(request)
+        content = """
+<h4 class="subheader">This is where you can log into the secure area.</h4>
+<form name="login" id="login" action="/authenticate" method="post">
+  <div class="row"><label for="username">Username</label><input type="text" name="username" id="username"></div>
+  <div class="row"><label for="password">Password</label><input type="password" name="password" id="password"></div>
+  <button class="radius" type="submit"><i class="fa fa-2x fa-sign-in"> Login</i></button>
+</form>"""
+        response = _page("Login", flash + _example("Login Page", content, tag="h2"))
+        response.headers.extend(cookies)
+        return response
+
+    def authenticate(self, request: Request) -> Response:
+        form = request.form()
+        if form.get("username") != LOGIN_USERNAME:
+            return _with_flash("/login", "Your username is invalid!", "error")
+        if form.get("password") != LOGIN_PASSWORD:
+            return _with_flash("/login", "Your password is invalid!", "error")
+        response = _with_flash("/secure", "You logged into a secure area!", "success")
+        response.headers.append(("Set-Cookie", "replica_session=authenticated; Path=/"))
+        return response
+
+    def secure(self, request: Request) -> Response:
+        if request.cookies.get("replica_session") != "authenticated":
+            return _with_flash("/login", "You must login to view the secure area!", "error")
+        flash, cookies = _flash_html(request)
+        content = """
+<h4 class="subheader">Welcome to the Secure Area. When you are done click logout below.</h4>
+<a class="button secondary radius" href="/logout"><i class="icon-2x icon-signout"> Logout</i></a>"""
+        response = _page("Secure Area", flash + _example("Secure Area", content, tag="h2"))
+        response.headers.extend(cookies)
+        return response
+
+    def logout(self, request: Request) -> Response:
+        response = _with_flash("/login", "You logged out of the secure area!", "success")
+        response.headers.append(("Set-Cookie", "replica_session=; Path=/; Max-Age=0"))
+        return response
+
+    def basic_auth(self, request: Request) -> Response:
+        header = request.headers.get("authorization", "")
+        if header.startswith("Basic "):
+            try:
+                username, _, password = base64.b64decode(header[6:]).decode().partition(":")
+            except ValueError:
+                username = password = ""
+            if (username, password) == (AUTH_USERNAME, AUTH_PASSWORD):
+                return self._authorized("Basic Auth")
+        return Response(
+            status=401,
+            body="Not authorized\n",
+            content_type="text/plain; charset=utf-8",
+            headers=[("WWW-Authenticate", 'Basic realm="Restricted Area"')],
+        )
+
+    def digest_auth(self, request: Request) -> Response:
+        header = request.headers.get("authorization", "")
+        if header.startswith("Digest ") and self._digest_valid(request.method, _parse_digest(header[7:])):
+            return self._authorized("Digest Auth")
+        nonce = secrets.token_hex(16)
+        self._nonces.add(nonce)
+        challenge = f'Digest realm="{DIGEST_REALM}", qop="auth", nonce="{nonce}", opaque="{secrets.token_hex(8)}"'
+        return Response(
+            status=401,
+            body="Not authorized\n",
+            content_type="text/plain; charset=utf-8",
+            headers=[("WWW-Authenticate", challenge)],
+        )
+
+    def _digest_valid(self, method: str, params: dict[str, str]) -> bool:
+        if params.get("username") != AUTH_USERNAME or params.get("nonce") not in self._nonces:
+            return False
+
+        def md5(value: str) -> str:
+            return hashlib.md5(value.encode()).hexdigest()
+
+        ha1 = md5(f"{AUTH_USERNAME}:{params.get('realm', DIGEST_REALM)}:{AUTH_PASSWORD}")
+        ha2 = md5(f"{method}:{params.get('uri', '')}")
+        if params.get("qop"):
+            expected = md5(f"{ha1}:{params['nonce']}:{params.get('nc', '')}:{params.get('cnonce', '')}:auth:{ha2}")
+        else:
+            expected = md5(f"{ha1}:{params['nonce']}:{ha2}")
+        return secrets.compare_digest(expected, params.get("response", ""))
+
+    def _authorized(self, title: str) -> Response:
+        return _page(title, _example(title, "<p>Congratulations! You must have the proper credentials.</p>"))
+
+    # ============================================================================
+    # FRAMES
+    # ============================================================================
+
+    def frames(self, request: Request) -> Response:
+        content = '<ul><li><a href="/nested_frames">Nested Frames</a></li><li><a href="/iframe">iFrame</a></li></ul>'
+        return _page("Frames", _example("Frames", content))
+
+    def nested_frames(self, request: Request) -> Response:
+        return Response(
+            body="""<!DOCTYPE html>
+<html>
+<frameset frameborder="1" rows="50%,50%">
+  <frame src="/frame_top" scrolling="no" name="frame-top">
+  <frame src="/frame_bottom" scrolling="no" name="frame-bottom">
+</frameset>
+</html>
+"""
+        )
+
+    def frame_top(self, request: Request) -> Response:
+        return Response(
+            body="""<!DOCTYPE html>
+<html>
+<frameset frameborder="1" name="frameset-middle" cols="33%,33%,33%">
+  <frame src="/frame_left" scrolling="no" name="frame-left">
+  <frame src="/frame_middle" scrolling="no" name="frame-middle">
+  <frame src="/frame_right" scrolling="no" name="frame-right">
+</frameset>
+</html>
+"""
+        )
+
+    def frame_body(self, text: str) -> Response:
+        return Response(body=f"<!DOCTYPE html>\n<html>\n<head></head>\n<body>\n{text}\n</body>\n</html>\n")
+
+    def iframe(self, request: Request) -> Response:
+        editor = html.escape(
+            '<!DOCTYPE html><html><body id="tinymce" contenteditable="true">'
+            "<p>Your content goes here.</p></body></html>",
+            quote=True,
+        )
+        content = f"""
+<div class="tox tox-tinymce">
+  <iframe class="tox-edit-area__iframe" title="Rich Text Area" srcdoc="{editor}"></iframe>
+</div>"""
+        return _page("iFrame", _example("An iFrame containing the TinyMCE WYSIWYG Editor", content))
+
+    # ============================================================================
+    # INTERACTIONS
+    # ============================================================================
+
+    def geolocation(self, request: Request) -> Response:
+        content = """
+<p>Click the button to get your current latitude and longitude</p>
+<button onclick="getLocation()">Where am I?</button>
+<p id="demo"></p>
+<script>
+  function getLocation() {
+    navigator.geolocation.getCurrentPosition(function (position) {
+      document.getElementById("demo").innerHTML =
+        'Latitude: <div id="lat-value">' + position.coords.latitude + "</div>" +
+        'Longitude: <div id="long-value">' + position.coords.longitude + "</div>";
+    });
+  }
+</script>"""
+        return _page("Geolocation", _example("Geolocation", content))
+
+    def horizontal_slider(self, request: Request) -> Response:
+        content = """
+<h4 class="subheader">Set the focus on the slider (by clicking on it) and use the arrow keys to move it.</h4>
+<div class="sliderContainer">
+  <input type="range" min="0.0" max="5.0" step="0.5" value="2.5" style="width: 150px"
+         oninput="showValue(this.value)" onchange="showValue(this.value)">
+  <span id="range">2.5</span>
+</div>
+<script>function showValue(value) { document.getElementById("range").textContent = value; }</script>"""
+        return _page("Horizontal Slider", _example("Horizontal Slider", content))
+
+    def hovers(self, request: Request) -> Response:
+        figures = "\n".join(
+            f'<div class="figure"><img src="/img/avatar-blank.jpg" alt="User Avatar">'
+            f'<div class="figcaption"><h5>name: user{i}</h5><a href="/users/{i}">View profile</a></div></div>'
+            for i in range(1, 4)
+        )
+        style = """
+<style>
+  .figure { display: inline-block; position: relative; margin: 10px; }
+  .figure img { width: 150px; height: 150px; }
+  .figcaption { display: none; }
+  .figure:hover .figcaption { display: block; }
+</style>"""
+        return _page(
+            "Hovers", _example("Hovers", "<p>Hover over the image for additional information</p>" + figures), style
+        )
+
+    def infinite_scroll(self, request: Request) -> Response:
+        content = f"""
+<div class="jscroll"><div class="jscroll-inner"></div></div>
+<script>
+  var WORDS = "{" ".join(_LOREM)}".split(" ");
+  function addParagraph() {{
+    var added = document.createElement("div");
+    added.className = "jscroll-added";
+    var words = [];
+    for (var i = 0; i < 120; i++) {{ words.push(WORDS[Math.floor(Math.random() * WORDS.length)]); }}
+    added.innerHTML = "<br>" + words.join(" ");
+    document.querySelector(".jscroll-inner").appendChild(added);
+  }}
+  for (var i = 0; i < 3; i++) {{ addParagraph(); }}
+  window.addEventListener("scroll", function () {{
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 200) {{
+      setTimeout(addParagraph, 100);
+    }}
+  }});
+</script>"""
+        return _page("Infinite Scroll", _example("Infinite Scroll", content))
+
+    def inputs(self, request: Request) -> Response:
+        return _page("Inputs", _example("Inputs", '<p>Number</p><input type="number">'))
+
+    def jqueryui_menu(self, request: Request) -> Response:
+        content = """
+<ul id="menu">
+  <li class="ui-state-disabled"><a href="#">Disabled</a></li>
+  <li><a href="#">Enabled</a>
+    <ul>
+      <li><a href="#">Downloads</a>
+        <ul>
+          <li><a href="/jqueryui/menu/menu.pdf">PDF</a></li>
+          <li><a href="/jqueryui/menu/menu.csv">CSV</a></li>
+          <li><a href="/jqueryui/menu/menu.xls">Excel</a></li>
+        </ul>
+      </li>
+      <li><a href="/jqueryui">Back to JQuery UI</a></li>
+    </ul>
+  </li>
+</ul>
+<style>
+  #menu, #menu ul { list-style: none; padding: 0; width: 160px; }
+  #menu li { position: relative; }
+  #menu li ul { display: none; position: absolute; left: 160px; top: 0; background: #fff; }
+  #menu li:hover > ul { display: block; }
+</style>"""
+        return _page("JQuery UI Menus", _example("JQueryUI - Menu", content))
+
+    def javascript_alerts(self, request: Request) -> Response:
+        content = """
+<p>Here are some examples of different JavaScript alerts which can be troublesome for automation</p>
+<ul>
+  <li><button onclick="jsAlert()">Click for JS Alert</button></li>
+  <li><button onclick="jsConfirm()">Click for JS Confirm</button></li>
+  <li><button onclick="jsPrompt()">Click for JS Prompt</button></li>
+</ul>
+<h4>Result:</h4>
+<p id="result"></p>
+<script>
+  function log(text) { document.getElementById("result").textContent = text; }
+  function jsAlert() { alert("I am a JS Alert"); log("You successfully clicked an alert"); }
+  function jsConfirm() { log("You clicked: " + (confirm("I am a JS Confirm") ? "Ok" : "Cancel")); }
+  function jsPrompt() { log("You entered: " + prompt("I am a JS prompt")); }
+</script>"""
+        return _page("JavaScript Alerts", _example("JavaScript Alerts", content))
+
+    def javascript_error(self, request: Request) -> Response:
+        body = (
+            "<p>This page has a JavaScript error in the onload event. This is often a problem to using normal "
+            "Javascript injection techniques.</p>"
+        )
+        head = "<script>function loadError() { var object = undefined; object.xyz(); }</script>"
+        return _page("JavaScript onload event error", body, head, body_attrs=' onload="loadError()"')
+
+    def key_presses(self, request: Request) -> Response:
+        content = f"""
+<p>Key presses are often used to interact with a website. This page displays what key was pressed.</p>
+<form><input id="target" type="text"></form>
+<p id="result"></p>
+<script>
+  {_KEY_NAMES}
+  document.getElementById("target").addEventListener("keyup", function (e) {{
+    var name = KEY_NAMES[e.keyCode] || e.key.toUpperCase();
+    document.getElementById("result").textContent = "You entered: " + name;
+  }});
+</script>"""
+        return _page("Key Presses", _example("Key Presses", content))
+
+
+def _parse_upload(request: Request) -> tuple[str | None, bytes]:
+    """Return the filename and content of the `file` field of a multipart/form-data body."""
+    content_type = request.headers.get("content-type", "")
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + request.body
+    )
+    if not message.is_multipart():
+        return None, b""
+    for part in message.iter_parts():
+        if part.get_param("name", header="content-disposition") == "file" and part.get_filename():
+            payload = part.get_payload(decode=True)
+            return part.get_filename(), payload if isinstance(payload, bytes) else b""
+    return None, b""
+
+
+def _parse_digest(value: str) -> dict[str, str]:
+    params: dict[str, str] = {}
+    for item in value.split(","):
+        name, _, raw = item.strip().partition("=")
+        params[name.strip()] = raw.strip().strip('"')
+    return params
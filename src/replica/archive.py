@@ -0,0 +1,328 @@
+"""
+Compact on-disk archive of recorded HTTP exchanges, and the record/replay session using it.
+
+File layout (little-endian):
+
+    8 bytes   magic
+    8 bytes   length N of the index
+    N bytes   JSON index: {"entries": {key: [[status, headers, offset, length, compressed], ...]}}
+    ...       response bodies, zlib-compressed where that saves space, identical bodies stored once
+
+Readers memory-map the file, so the index is parsed once per process and bodies are
+sliced out of the page cache on demand; every xdist worker replaying the same archive
+shares those pages instead of holding its own copy.
+
+Requests are keyed by method, normalized URL (fragment dropped, query sorted), a digest
+of the normalized body (form fields sorted, JSON canonicalized, multipart boundary
+stripped) and a digest of the Authorization header, so that authenticated and anonymous
+requests to the same URL replay different responses. A key recorded several times (e.g.
+the login page after different failed logins) replays its responses in recorded order.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import structlog
+
+from src.config import settings
+from src.config.project_config import HttpArchiveModeEnum
+
+MAGIC = b"SBHAR\x00\x01\x00"
+_HEADER = struct.Struct("<8sQ")
+_MIN_COMPRESS_BYTES = 512
+
+# Hop-by-hop and encoding headers that would be wrong for a body replayed as stored
+_DROPPED_HEADERS = frozenset({"connection", "content-encoding", "content-length", "keep-alive", "transfer-encoding"})
+
+_MULTIPART_BOUNDARY = re.compile(rb"^--([^\r\n]+)")
+
+
+class _Slot(NamedTuple):
+    """Index entry for one recorded response; serialized as a JSON array."""
+
+    status: int
+    headers: list[tuple[str, str]]
+    offset: int
+    length: int
+    compressed: bool
+
+
+@dataclass(frozen=True)
+class ArchivedResponse:
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+    @property
+    def content_type(self) -> str:
+        for name, value in self.headers:
+            if name.lower() == "content-type":
+                return value
+        return "application/octet-stream"
+
+
+@dataclass
+class ArchiveStats:
+    recorded: int = 0
+    hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"recorded": self.recorded, "hits": self.hits, "misses": self.misses}
+
+
+def normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    netloc = parts.hostname or ""
+    if parts.port is not None:
+        netloc = f"{netloc}:{parts.port}"
+    return urlunsplit((parts.scheme.lower(), netloc.lower(), parts.path or "/", query, ""))
+
+
+def normalize_body(body: bytes | str | None) -> bytes:
+    """Reduce a request body to a form that is stable across runs of the same request."""
+    if not body:
+        return b""
+    raw = body.encode() if isinstance(body, str) else body
+    boundary = _MULTIPART_BOUNDARY.match(raw)
+    if boundary is not None:
+        return raw.replace(boundary.group(1), b"boundary")
+    try:
+        return json.dumps(json.loads(raw), sort_keys=True, separators=(",", ":")).encode()
+    except ValueError:
+        pass
+    try:
+        text = raw.decode("ascii")
+    except UnicodeDecodeError:
+        return raw
+    if "=" in text:
+        return urlencode(sorted(parse_qsl(text, keep_blank_values=True))).encode()
+    return raw
+
+
+def request_key(method: str, url: str, body: bytes | str | None = None, authorization: str | None = None) -> str:
+    body_digest = hashlib.sha1(normalize_body(body)).hexdigest()[:16] if body else "-"
+    auth_digest = hashlib.sha1(authorization.encode()).hexdigest()[:16] if authorization else "-"
+    return f"{method.upper()} {normalize_url(url)} {body_digest} {auth_digest}"
+
+
+def clean_headers(headers: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    return [(name, value) for name, value in headers if name.lower() not in _DROPPED_HEADERS]
+
+
+class ArchiveWriter:
+    """Accumulates recorded exchanges in memory and writes them as one archive file."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, list[_Slot]] = defaultdict(list)
+        self._blob = bytearray()
+        self._offsets: dict[bytes, tuple[int, int, bool]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.entries.values())
+
+    def add(self, key: str, response: ArchivedResponse) -> None:
+        digest = hashlib.sha1(response.body).digest()
+        stored = self._offsets.get(digest)
+        if stored is None:
+            payload, compressed = response.body, False
+            if len(response.body) >= _MIN_COMPRESS_BYTES:
+                packed = zlib.compress(response.body, 6)
+                if len(packed) < len(response.body):
+                    payload, compressed = packed, True
+            stored = self._offsets[digest] = (len(self._blob), len(payload), compressed)
+            self._blob += payload
+        offset, length, compressed = stored
+        self.entries[key].append(_Slot(response.status, clean_headers(response.headers), offset, length, compressed))
+
+    def extend(self, archive: HttpArchive) -> None:
+        for key in archive.keys():
+            for response in archive.responses(key):
+                self.add(key, response)
+
+    def save(self, path: str | os.PathLike[str]) -> Path:
+        """Write the archive atomically (readers never see a partially written file)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        index = json.dumps({"entries": self.entries}, separators=(",", ":")).encode()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(index)))
+            f.write(index)
+            f.write(self._blob)
+        os.replace(tmp_path, path)
+        return path
+
+
+class HttpArchive:
+    """Read-only, memory-mapped view of an archive file."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not an HTTP archive: {self.path}")
+        index_end = _HEADER.size + index_length
+        index = json.loads(self._mmap[_HEADER.size : index_end])
+        self._entries: dict[str, list[_Slot]] = {
+            key: [
+                _Slot(status, [(name, value) for name, value in headers], offset, length, compressed)
+                for status, headers, offset, length, compressed in responses
+            ]
+            for key, responses in index["entries"].items()
+        }
+        self._blob_start = index_end
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._entries.values())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def keys(self) -> list[str]:
+        return list(self._entries)
+
+    def count(self, key: str) -> int:
+        return len(self._entries.get(key, ()))
+
+    def response(self, key: str, occurrence: int = 0) -> ArchivedResponse | None:
+        """Return the `occurrence`-th response recorded for `key`, repeating the last one past the end."""
+        responses = self._entries.get(key)
+        if not responses:
+            return None
+        slot = responses[min(occurrence, len(responses) - 1)]
+        start = self._blob_start + slot.offset
+        body = self._mmap[start : start + slot.length]
+        return ArchivedResponse(
+            status=slot.status,
+            headers=list(slot.headers),
+            body=zlib.decompress(body) if slot.compressed else body,
+        )
+
+    def responses(self, key: str) -> list[ArchivedResponse]:
+        return [response for i in range(self.count(key)) if (response := self.response(key, i)) is not None]
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def merge_archives(paths: list[Path], destination: str | os.PathLike[str]) -> Path:
+    """Combine archives (e.g. one recorded per xdist worker) into `destination`."""
+    writer = ArchiveWriter()
+    for path in paths:
+        archive = HttpArchive(path)
+        try:
+            writer.extend(archive)
+        finally:
+            archive.close()
+    return writer.save(destination)
+
+
+class ArchiveSession:
+    """
+    Per-process record/replay state shared by the CDP interceptor and the local proxy.
+
+    In record mode exchanges are collected and saved at the end of the session; in replay
+    mode responses are served from the archive and cache misses are counted and logged.
+    """
+
+    def __init__(self, mode: HttpArchiveModeEnum, path: str | os.PathLike[str]) -> None:
+        self.mode = mode
+        self.path = Path(path)
+        self.stats = ArchiveStats()
+        self.missed: list[str] = []
+        self.logger = structlog.get_logger(self.__class__.__name__)
+
+        self._lock = threading.Lock()
+        self._writer = ArchiveWriter() if mode == HttpArchiveModeEnum.record else None
+        self._archive = HttpArchive(self.path) if mode == HttpArchiveModeEnum.replay else None
+        self._occurrences: dict[str, int] = defaultdict(int)
+
+    @property
+    def recording(self) -> bool:
+        return self._writer is not None
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        body: bytes | str | None,
+        authorization: str | None,
+        response: ArchivedResponse,
+    ) -> None:
+        if self._writer is None:
+            return
+        key = request_key(method, url, body, authorization)
+        with self._lock:
+            self._writer.add(key, response)
+            self.stats.recorded += 1
+
+    def replay(
+        self, method: str, url: str, body: bytes | str | None = None, authorization: str | None = None
+    ) -> ArchivedResponse | None:
+        if self._archive is None:
+            return None
+        key = request_key(method, url, body, authorization)
+        with self._lock:
+            occurrence = self._occurrences[key]
+            self._occurrences[key] += 1
+            response = self._archive.response(key, occurrence)
+            if response is None:
+                self.stats.misses += 1
+                self.missed.append(key)
+            else:
+                self.stats.hits += 1
+        if response is None:
+            self.logger.warning(f"HTTP archive miss: {key}")
+        return response
+
+    def close(self, save_to: str | os.PathLike[str] | None = None) -> ArchiveStats:
+        """Save recorded exchanges (to `save_to`, default the archive path) and release the archive."""
+        with self._lock:
+            if self._writer is not None and len(self._writer):
+                saved = self._writer.save(save_to or self.path)
+                self.logger.info(f"Recorded {len(self._writer)} HTTP exchanges to {saved}.")
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+        return self.stats
+
+
+_session: ArchiveSession | None = None
+_session_lock = threading.Lock()
+
+
+def get_archive_session() -> ArchiveSession | None:
+    """Return this process's record/replay session, or None when HTTP_ARCHIVE_MODE is off."""
+    global _session
+    if settings.HTTP_ARCHIVE_MODE == HttpArchiveModeEnum.off:
+        return None
+    with _session_lock:
+        if _session is None:
+            _session = ArchiveSession(settings.HTTP_ARCHIVE_MODE, settings.HTTP_ARCHIVE_PATH)
+        return _session
+
+
+def close_archive_session(save_to: str | os.PathLike[str] | None = None) -> ArchiveStats | None:
+    """Close this process's session, saving what it recorded; returns its stats if one was open."""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    return session.close(save_to) if session is not None else None
@@ -0,0 +1,148 @@
+"""
+Chrome DevTools `Fetch` interception that records to or replays from an ArchiveSession.
+
+The interceptor opens its own DevTools connection to the browser (next to chromedriver's),
+auto-attaches to every page target and enables `Fetch` for URLs under BASE_URL:
+
+- record: requests are paused at the response stage; the body is read with
+  `Fetch.getResponseBody`, stored, and the response is let through unchanged.
+- replay: requests are paused before they are sent and fulfilled from the archive with
+  `Fetch.fulfillRequest`; a miss fails the request instead of going to the network.
+
+`driver.execute_cdp_cmd` cannot receive events, which interception depends on, hence the
+separate DevToolsConnection. With `browser_context` set, only pages of that browser context are intercepted, so that
+workers sharing one Chrome process (SHARED_CHROME_CONTEXTS) leave each other's pages alone.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from src.replica.archive import ArchivedResponse, ArchiveSession
+from src.utils.devtools import DevToolsConnection
+
+if TYPE_CHECKING:
+    from src.utils.browser_contexts import BrowserContext
+
+
+class CdpFetchInterceptor:
+    """Intercepts requests matching `url_pattern` in every page of the browser at `debugger_address`."""
+
+    def __init__(
+        self,
+        debugger_address: str,
+        session: ArchiveSession,
+        url_pattern: str,
+        browser_context: BrowserContext | None = None,
+    ) -> None:
+        self.debugger_address = debugger_address
+        self.session = session
+        self.url_pattern = url_pattern
+        self.browser_context = browser_context
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        self._devtools = DevToolsConnection(
+            debugger_address, self._dispatch, events=("Target.attachedToTarget", "Fetch.requestPaused")
+        )
+
+    @classmethod
+    def for_driver(cls, driver: Any, session: ArchiveSession, url_pattern: str) -> CdpFetchInterceptor | None:
+        """Return a started interceptor for a Chrome driver, or None if it exposes no DevTools address."""
+        address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if not address:
+            return None
+        return cls(address, session, url_pattern, getattr(driver, "browser_context", None)).start()
+
+    def start(self) -> CdpFetchInterceptor:
+        self._devtools.connect()
+        # Attaches to existing pages too; new windows are paused until Fetch is enabled in them
+        self._call(
+            "Target.setAutoAttach",
+            {"autoAttach": True, "waitForDebuggerOnStart": True, "flatten": True},
+        )
+        return self
+
+    def stop(self) -> None:
+        self._devtools.close()
+
+    def _call(self, method: str, params: dict[str, Any] | None = None, session_id: str | None = None) -> Any:
+        return self._devtools.call(method, params, session_id)
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        params = message["params"]
+        try:
+            if message["method"] == "Target.attachedToTarget":
+                self._on_attached(params)
+            else:
+                self._on_request_paused(params, message["sessionId"])
+        except Exception as e:
+            self.logger.debug(f"Fetch interception handler failed: {e}")
+
+    # ============================================================================
+    # INTERCEPTION
+    # ============================================================================
+
+    def _on_attached(self, params: dict[str, Any]) -> None:
+        session_id = params["sessionId"]
+        target = params["targetInfo"]
+        if target["type"] == "page" and self._in_context(target):
+            stage = "Response" if self.session.recording else "Request"
+            self._call(
+                "Fetch.enable", {"patterns": [{"urlPattern": self.url_pattern, "requestStage": stage}]}, session_id
+            )
+        if params.get("waitingForDebugger"):
+            self._call("Runtime.runIfWaitingForDebugger", {}, session_id)
+
+    def _in_context(self, target: dict[str, Any]) -> bool:
+        # Compared on every attach: the context is replaced when a reused browser is reset
+        return self.browser_context is None or target.get("browserContextId") == self.browser_context.context_id
+
+    def _on_request_paused(self, params: dict[str, Any], session_id: str) -> None:
+        request = params["request"]
+        headers = {name.lower(): value for name, value in request.get("headers", {}).items()}
+        method, url, body = request["method"], request["url"], request.get("postData")
+        authorization = headers.get("authorization")
+        request_id = params["requestId"]
+
+        if self.session.recording:
+            if "responseStatusCode" in params:
+                self._record(params, method, url, body, authorization, session_id)
+            self._call("Fetch.continueRequest", {"requestId": request_id}, session_id)
+            return
+
+        response = self.session.replay(method, url, body, authorization)
+        if response is None:
+            self._call(
+                "Fetch.failRequest", {"requestId": request_id, "errorReason": "InternetDisconnected"}, session_id
+            )
+            return
+        self._call(
+            "Fetch.fulfillRequest",
+            {
+                "requestId": request_id,
+                "responseCode": response.status,
+                "responseHeaders": [{"name": name, "value": value} for name, value in response.headers],
+                "body": base64.b64encode(response.body).decode("ascii"),
+            },
+            session_id,
+        )
+
+    def _record(
+        self,
+        params: dict[str, Any],
+        method: str,
+        url: str,
+        body: str | None,
+        authorization: str | None,
+        session_id: str,
+    ) -> None:
+        status = int(params["responseStatusCode"])
+        payload = b""
+        if not 300 <= status < 400:  # Redirects have no body to read
+            result = self._call("Fetch.getResponseBody", {"requestId": params["requestId"]}, session_id)
+            data = result.get("body", "")
+            payload = base64.b64decode(data) if result.get("base64Encoded") else data.encode()
+        response_headers = [(header["name"], header["value"]) for header in params.get("responseHeaders", [])]
+        self.session.record(method, url, body, authorization, ArchivedResponse(status, response_headers, payload))
@@ -0,0 +1,75 @@
+"""
+Local reverse proxy in front of BASE_URL that records to or replays from an ArchiveSession.
+
+Used for browsers without DevTools `Fetch` (Firefox): the proxy is served by ReplicaServer
+and BASE_URL is pointed at it. Requests are keyed with the upstream URL they stand for,
+so an archive recorded through the proxy replays through CDP interception and vice versa.
+Absolute upstream URLs in redirects and text bodies are rewritten to the proxy's origin.
+"""
+
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+
+import requests
+import structlog
+
+from src.replica.archive import ArchivedResponse, ArchiveSession, clean_headers
+from src.replica.server import Request, Response
+
+# Request headers that describe the connection to the proxy, not the upstream request
+_SKIPPED_REQUEST_HEADERS = frozenset({"host", "connection", "keep-alive", "accept-encoding", "content-length"})
+
+
+class ArchiveProxy:
+    """ReplicaServer handler forwarding to `upstream_url` (record) or answering from the archive (replay)."""
+
+    def __init__(self, upstream_url: str, session: ArchiveSession) -> None:
+        parts = urlsplit(upstream_url)
+        self.upstream_origin = f"{parts.scheme}://{parts.netloc}"
+        self.session = session
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        self._http = requests.Session()
+
+    def __call__(self, request: Request) -> Response:
+        url = self.upstream_origin + request.target
+        authorization = request.headers.get("authorization")
+        if self.session.recording:
+            archived = self._forward(request, url)
+            self.session.record(request.method, url, request.body, authorization, archived)
+        else:
+            replayed = self.session.replay(request.method, url, request.body, authorization)
+            if replayed is None:
+                return Response(status=502, body=f"Not in HTTP archive: {request.method} {url}\n")
+            archived = replayed
+        return self._to_local(archived, request.base_url.rstrip("/"))
+
+    def _forward(self, request: Request, url: str) -> ArchivedResponse:
+        headers = {name: value for name, value in request.headers.items() if name not in _SKIPPED_REQUEST_HEADERS}
+        upstream = self._http.request(
+            request.method, url, headers=headers, data=request.body or None, allow_redirects=False, timeout=30
+        )
+        # requests joins repeated headers; Set-Cookie must stay one header per cookie
+        response_headers = [(name, value) for name, value in upstream.headers.items() if name.lower() != "set-cookie"]
+        response_headers += [("Set-Cookie", cookie) for cookie in _set_cookie_headers(upstream)]
+        return ArchivedResponse(upstream.status_code, response_headers, upstream.content)
+
+    def _to_local(self, archived: ArchivedResponse, local_origin: str) -> Response:
+        content_type = archived.content_type
+        body = archived.body
+        if content_type.startswith(("text/", "application/javascript", "application/json")):
+            body = body.replace(self.upstream_origin.encode(), local_origin.encode())
+        headers = [
+            (name, value.replace(self.upstream_origin, local_origin) if name.lower() == "location" else value)
+            for name, value in clean_headers(archived.headers)
+            if name.lower() not in ("content-type", "cache-control")
+        ]
+        return Response(status=archived.status, body=body, content_type=content_type, headers=headers)
+
+
+def _set_cookie_headers(response: requests.Response) -> list[str]:
+    raw = getattr(response.raw, "headers", None)
+    if raw is not None and hasattr(raw, "getlist"):
+        return list(raw.getlist("Set-Cookie"))
+    cookie = response.headers.get("Set-Cookie")
+    return [cookie] if cookie else []
@@ -0,0 +1,197 @@
+"""
+Minimal asyncio HTTP/1.1 server hosting the replica application.
+
+Only what browsers and `requests` need from the replica is implemented: keep-alive
+connections, Content-Length request bodies and HEAD requests. The event loop runs on a
+daemon thread so synchronous tests can start and stop the server around a session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qs, urlsplit
+
+import structlog
+
+_MAX_HEADER_BYTES = 64 * 1024
+_MAX_BODY_BYTES = 32 * 1024 * 1024
+_KEEP_ALIVE_TIMEOUT = 15
+
+
+@dataclass
+class Request:
+    method: str
+    target: str
+    headers: dict[str, str]
+    body: bytes = b""
+    base_url: str = ""
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.target).path
+
+    @property
+    def query(self) -> dict[str, list[str]]:
+        return parse_qs(urlsplit(self.target).query)
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        cookie = SimpleCookie()
+        cookie.load(self.headers.get("cookie", ""))
+        return {name: morsel.value for name, morsel in cookie.items()}
+
+    def form(self) -> dict[str, str]:
+        return {name: values[0] for name, values in parse_qs(self.body.decode(errors="replace")).items()}
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: bytes | str = b""
+    content_type: str = "text/html; charset=utf-8"
+    headers: list[tuple[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def redirect(cls, location: str, headers: list[tuple[str, str]] | None = None) -> Response:
+        return cls(status=302, headers=[("Location", location), *(headers or [])])
+
+    def encode(self, head_only: bool, keep_alive: bool) -> bytes:
+        body = self.body.encode() if isinstance(self.body, str) else self.body
+        reason = HTTPStatus(self.status).phrase
+        lines = [
+            f"HTTP/1.1 {self.status} {reason}",
+            f"Content-Type: {self.content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+            "Cache-Control: no-store",
+            *(f"{name}: {value}" for name, value in self.headers),
+        ]
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head if head_only else head + body
+
+
+Handler = Callable[[Request], Response]
+
+
+class ReplicaServer:
+    """Serve `handler` on `host:port` (port 0 picks a free port) from a background thread."""
+
+    def __init__(self, handler: Handler, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.logger = structlog.get_logger(self.__class__.__name__)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.base_events.Server | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._startup_error: BaseException | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self, timeout: float = 10) -> ReplicaServer:
+        self._thread = threading.Thread(target=self._run, name="replica-server", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError(f"Replica server did not start within {timeout}s")
+        if self._startup_error is not None:
+            raise RuntimeError(f"Replica server failed to start: {self._startup_error}")
+        self.logger.info("Replica server started.", base_url=self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self.logger.info("Replica server stopped.", base_url=self.base_url)
+
+    def __enter__(self) -> ReplicaServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(self._serve, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            self._startup_error = e
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(self._shutdown())
+            loop.close()
+
+    async def _shutdown(self) -> None:
+        """Stop accepting connections and close open keep-alive connections so their handlers finish."""
+        assert self._server is not None
+        self._server.close()
+        for writer in list(self._connections):
+            writer.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        if tasks:
+            await asyncio.wait(tasks, timeout=5)
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                request = await asyncio.wait_for(self._read_request(reader), _KEEP_ALIVE_TIMEOUT)
+                if request is None:
+                    break
+                try:
+                    response = self.handler(request)
+                except Exception as e:
+                    self.logger.error(f"Replica handler failed for {request.method} {request.target}: {e}")
+                    response = Response(status=500, body="Internal Server Error", content_type="text/plain")
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                writer.write(response.encode(head_only=request.method == "HEAD", keep_alive=keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Request | None:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None  # Client closed the keep-alive connection
+        if len(head) > _MAX_HEADER_BYTES:
+            raise ValueError("Request header too large")
+
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        method, target, _ = request_line.split(" ", 2)
+        headers: dict[str, str] = {}
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", "0"))
+        if length > _MAX_BODY_BYTES:
+            raise ValueError("Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method=method.upper(), target=target, headers=headers, body=body, base_url=self.base_url)
@@ -0,0 +1,170 @@
+"""
+Asyncio client for endpoint-level API checks against BASE_URL.
+
+Requests are coroutines. Each one waits for a free slot (at most `max_concurrency`
+requests in flight) and for the rate limiter, then runs on the client's thread pool
+through a keep-alive `requests.Session`. The session is shared by every test of a worker,
+so its connection pool carries over between tests. No async HTTP library is needed: the
+blocking I/O runs on threads, and scheduling, limits and gathering are asyncio's.
+
+Every response is recorded with its latency; `report` attaches the test's requests to
+Allure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Coroutine, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+from urllib.parse import urljoin
+
+import allure
+import requests
+import structlog
+
+from src.utils.http_client import DEFAULT_TIMEOUT
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    method: str
+    url: str
+    status_code: int
+    headers: Mapping[str, str]  # Case-insensitive
+    content: bytes
+    elapsed_ms: float
+    redirects: tuple[int, ...] = ()  # Status codes of the redirects that were followed to `url`
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncRateLimiter:
+    """Start requests at least 1 / `rate_per_second` seconds apart; a rate of 0 disables the limit."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        self.interval = 1 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        # Reserving the slot before sleeping keeps waiters in order without a lock (one event loop thread)
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class AsyncApiClient:
+    """Concurrent, rate-limited HTTP requests to paths under `base_url`."""
+
+    def __init__(
+        self,
+        base_url: str,
+        session: requests.Session,
+        max_concurrency: int = 16,
+        rate_per_second: float = 0.0,
+    ) -> None:
+        self.base_url = base_url
+        self.session = session
+        self.max_concurrency = max_concurrency
+        self.limiter = AsyncRateLimiter(rate_per_second)
+        self.records: list[ApiResponse] = []
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="api-client")
+        self._slots: asyncio.Semaphore | None = None
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine of this client's requests to completion from synchronous test code."""
+        self._slots = None  # Asyncio primitives belong to the loop they were first used in
+        return asyncio.run(coroutine)
+
+    def url(self, path: str) -> str:
+        return urljoin(self.base_url, path)
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> ApiResponse:
+        """Send a request once a slot and the rate limiter allow it; `kwargs` are passed to `requests`."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        async with self._slots:
+            await self.limiter.wait()
+            start = time.perf_counter()
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(self.session.request, method, self.url(path), **kwargs)
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        result = ApiResponse(
+            method=method,
+            url=response.url,
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response.content,
+            elapsed_ms=elapsed_ms,
+            redirects=tuple(redirect.status_code for redirect in response.history),
+        )
+        self.records.append(result)
+        return result
+
+    async def get(self, path: str, **kwargs: Any) -> ApiResponse:
+        return await self.request("GET", path, **kwargs)
+
+    async def head(self, path: str, **kwargs: Any) -> ApiResponse:
+        return await self.request("HEAD", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> ApiResponse:
+        return await self.request("POST", path, **kwargs)
+
+    async def gather(self, requests: Iterable[Awaitable[ApiResponse]]) -> list[ApiResponse]:
+        """Await the requests concurrently (within the client's limits); results are in input order."""
+        return list(await asyncio.gather(*requests))
+
+    def report(self) -> dict[str, Any]:
+        """Attach every recorded request with its latency to the Allure report and log a summary."""
+        latencies = [record.elapsed_ms for record in self.records]
+        summary = {
+            "requests": len(latencies),
+            "median_ms": round(statistics.median(latencies), 2) if latencies else 0.0,
+            "max_ms": round(max(latencies, default=0.0), 2),
+        }
+        if self.records:
+            allure.attach(_as_csv(self.records), name="API requests", attachment_type=allure.attachment_type.CSV)
+        self.logger.info("API request latency.", **summary)
+        return summary
+
+
+def _as_csv(records: list[ApiResponse]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["method", "url", "status_code", "redirects", "bytes", "elapsed_ms"])
+    for record in records:
+        writer.writerow(
+            [
+                record.method,
+                record.url,
+                record.status_code,
+                " ".join(map(str, record.redirects)),
+                len(record.content),
+                round(record.elapsed_ms, 2),
+            ]
+        )
+    return buffer.getvalue()
@@ -0,0 +1,241 @@
+"""
+Shared Chrome processes hosting one isolated browser context per test worker.
+
+With SHARED_CHROME_CONTEXTS = N, xdist workers gw0..gw(N-1) share one Chrome, the next N
+workers the next one, and so on. The first worker of a group launches the browser (under
+a file lock) and records its DevTools address; the others attach to it. Every driver then
+runs in its own browser context (`Target.createBrowserContext`): cookies, storage, cache,
+permissions and the download directory are separate, like an incognito window, while the
+browser, GPU and network processes are shared, so a concurrent test costs a renderer
+instead of a whole browser.
+
+Chromedriver attaches through `debuggerAddress` and quitting such a session leaves the
+browser running, so the shared Chromes are stopped by `shutdown_shared_chromes` at the end
+of the run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+from filelock import FileLock
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchWindowException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from seleniumbase.core.browser_launcher import LOCAL_CHROMEDRIVER
+from seleniumbase.core.detect_b_ver import get_binary_location
+
+from src.config import settings
+from src.utils.devtools import DevToolsConnection, DevToolsError
+
+# One state directory per checkout, so that concurrent runs of different checkouts don't share browsers
+_STATE_DIR = Path(tempfile.gettempdir()) / f"shared-chrome-{hashlib.sha1(os.getcwd().encode()).hexdigest()[:8]}"
+_LAUNCH_TIMEOUT = 30
+_SWITCH_TIMEOUT = 5
+
+
+@dataclass(frozen=True)
+class SharedChrome:
+    group: int
+    address: str
+    pid: int
+
+
+def chrome_group(worker_id: str, contexts_per_browser: int) -> int:
+    """Return the index of the shared Chrome an xdist worker ('gw5', or 'local') runs in."""
+    index = int(worker_id[2:]) if worker_id.startswith("gw") and worker_id[2:].isdigit() else 0
+    return index // contexts_per_browser
+
+
+def acquire_shared_chrome(group: int) -> SharedChrome:
+    """Return the group's running Chrome, launching it if this is the first worker to ask."""
+    _STATE_DIR.mkdir(parents=True, exist_ok=True)
+    state_file = _STATE_DIR / f"chrome-{group}.json"
+    with FileLock(str(_STATE_DIR / f"chrome-{group}.lock"), timeout=_LAUNCH_TIMEOUT * 2):
+        with suppress(OSError, ValueError, KeyError):
+            state = json.loads(state_file.read_text(encoding="utf-8"))
+            if _responds(state["address"]):
+                return SharedChrome(group, state["address"], state["pid"])
+        chrome = _launch(group)
+        state_file.write_text(json.dumps({"address": chrome.address, "pid": chrome.pid}), encoding="utf-8")
+        return chrome
+
+
+def shutdown_shared_chromes() -> int:
+    """Stop the shared Chromes of this checkout that still answer on their DevTools address; returns how many."""
+    stopped = 0
+    for state_file in _STATE_DIR.glob("chrome-*.json"):
+        with suppress(OSError, ValueError, KeyError):
+            state = json.loads(state_file.read_text(encoding="utf-8"))
+            # A state file left by a crashed run may name a pid that now belongs to another process
+            if _responds(state["address"]):
+                os.kill(state["pid"], signal.SIGTERM)
+                stopped += 1
+        state_file.unlink(missing_ok=True)
+    return stopped
+
+
+def _launch(group: int) -> SharedChrome:
+    profile_dir = _STATE_DIR / f"profile-{group}"
+    shutil.rmtree(profile_dir, ignore_errors=True)
+    command = [
+        get_binary_location("chrome"),
+        "--remote-debugging-port=0",  # Chrome picks a free port and writes it to DevToolsActivePort
+        f"--user-data-dir={profile_dir}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-search-engine-choice-screen",
+    ]
+    if settings.HEADLESS:
+        command.append("--headless=new")
+    if settings.MAXIMIZED:
+        command.append("--start-maximized")
+    # A session of its own, so the browser outlives the worker that happened to launch it
+    process = subprocess.Popen(
+        [*command, "about:blank"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+    )
+
+    port_file = profile_dir / "DevToolsActivePort"
+    deadline = time.monotonic() + _LAUNCH_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Shared Chrome {group} exited on startup with code {process.returncode}")
+        with suppress(OSError, ValueError, IndexError):
+            address = f"127.0.0.1:{int(port_file.read_text().splitlines()[0])}"
+            if _responds(address):
+                return SharedChrome(group, address, process.pid)
+        time.sleep(0.1)
+    process.kill()
+    raise TimeoutError(f"Shared Chrome {group} did not open its DevTools port within {_LAUNCH_TIMEOUT}s")
+
+
+def _responds(address: str) -> bool:
+    try:
+        return requests.get(f"http://{address}/json/version", timeout=2).ok
+    except requests.RequestException:
+        return False
+
+
+class BrowserContext:
+    """An isolated browser context and its pages, managed over a browser-level DevTools connection."""
+
+    def __init__(self, devtools: DevToolsConnection, downloads_dir: str) -> None:
+        self.devtools = devtools
+        self.downloads_dir = downloads_dir
+        self.context_id: str | None = None
+
+    def open(self) -> str:
+        """Create the context with one blank page; returns the page's target id, which is its window handle."""
+        # Disposed by Chrome if this process dies without closing it
+        result = self.devtools.call("Target.createBrowserContext", {"disposeOnDetach": True})
+        self.context_id = result["browserContextId"]
+        self.devtools.call(
+            "Browser.setDownloadBehavior",
+            {"behavior": "allow", "downloadPath": self.downloads_dir, "browserContextId": self.context_id},
+        )
+        target = self.devtools.call("Target.createTarget", {"url": "about:blank", "browserContextId": self.context_id})
+        return str(target["targetId"])
+
+    def target_ids(self) -> set[str]:
+        targets = self.devtools.call("Target.getTargets")["targetInfos"]
+        return {
+            target["targetId"]
+            for target in targets
+            if target["type"] == "page" and target.get("browserContextId") == self.context_id
+        }
+
+    def close(self) -> None:
+        """Dispose of the context, closing its pages."""
+        context_id, self.context_id = self.context_id, None
+        if context_id is not None:
+            with suppress(DevToolsError, ConnectionError):
+                self.devtools.call("Target.disposeBrowserContext", {"browserContextId": context_id})
+
+
+class ContextDriver(webdriver.Chrome):
+    """
+    Chromedriver session attached to a shared Chrome and confined to one browser context.
+
+    Chromedriver sees the pages of every context in the browser; `window_handles` is
+    narrowed to this context's pages so that window switching never lands in another
+    worker's test.
+    """
+
+    def __init__(self, browser_context: BrowserContext, options: ChromeOptions, service: ChromeService) -> None:
+        self.browser_context = browser_context
+        super().__init__(options=options, service=service)
+
+    @property
+    def window_handles(self) -> list[str]:
+        own_targets = self.browser_context.target_ids()
+        return [handle for handle in super().window_handles if handle in own_targets]
+
+    def switch_to_target(self, target_id: str) -> None:
+        # Chromedriver picks up targets created behind its back on its next target refresh
+        deadline = time.monotonic() + _SWITCH_TIMEOUT
+        while True:
+            try:
+                self.switch_to.window(target_id)
+                return
+            except NoSuchWindowException:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+
+    def reset_context(self) -> None:
+        """Replace the browser context with a fresh one, dropping all state the previous test left behind."""
+        self.browser_context.close()
+        self.switch_to_target(self.browser_context.open())
+
+    def quit(self) -> None:
+        self.browser_context.close()
+        super().quit()  # Ends the chromedriver session; an attached browser keeps running
+
+
+_connections: dict[str, DevToolsConnection] = {}
+_connections_lock = threading.Lock()
+
+
+def open_context_driver(worker_id: str, downloads_dir: str, contexts_per_browser: int) -> ContextDriver:
+    """Open a new browser context in the worker's shared Chrome and attach a chromedriver session to it."""
+    chrome = acquire_shared_chrome(chrome_group(worker_id, contexts_per_browser))
+    context = BrowserContext(_devtools(chrome.address), downloads_dir)
+    target_id = context.open()
+
+    options = ChromeOptions()
+    options.debugger_address = chrome.address
+    if LOCAL_CHROMEDRIVER and os.path.exists(LOCAL_CHROMEDRIVER):
+        service = ChromeService(executable_path=LOCAL_CHROMEDRIVER)
+    else:
+        service = ChromeService()  # Resolved by Selenium Manager
+    try:
+        driver = ContextDriver(context, options, service)
+        driver.switch_to_target(target_id)
+    except Exception:
+        context.close()
+        raise
+    return driver
+
+
+def _devtools(address: str) -> DevToolsConnection:
+    """Return this process's browser-level DevTools connection to `address`, reconnecting if it dropped."""
+    with _connections_lock:
+        connection = _connections.get(address)
+        if connection is None or not connection.connected:
+            connection = _connections[address] = DevToolsConnection(address).connect()
+        return connection
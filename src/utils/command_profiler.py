@@ -0,0 +1,261 @@
+"""
+Per-test WebDriver command profiler.
+
+`CommandProfiler.instrument(driver)` wraps the driver's remote connection `execute`, so
+every WebDriver command the test issues is recorded with its name, locator, duration and
+request/response payload sizes. Each command is also attributed to the innermost page
+object method that issued it (e.g. `BasePage.click_element`), which is what the summary
+aggregates on to show where a test's time goes.
+
+Element commands carry only an element id; the profiler remembers which locator each id
+was found with, so clicks and reads on found elements are reported with their locator.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+import allure
+import structlog
+
+_PAGES_DIR = str(Path(__file__).resolve().parent.parent / "pages")
+_ELEMENT_KEYS = ("element-6066-11e4-a52e-4f735466cecf", "ELEMENT")
+_FIND_COMMANDS = {"findElement", "findElements", "findChildElement", "findChildElements"}
+
+
+@dataclass(frozen=True)
+class CommandRecord:
+    command: str
+    duration_ms: float
+    request_bytes: int
+    response_bytes: int
+    locator: str | None = None
+    page_method: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class CommandStats:
+    """Aggregated timings for one group of commands (a command name or a page method)."""
+
+    name: str
+    count: int
+    total_ms: float
+    max_ms: float
+    request_bytes: int
+    response_bytes: int
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.mean_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+        }
+
+
+def _payload_size(payload: Any) -> int:
+    if payload is None:
+        return 0
+    try:
+        return len(json.dumps(payload, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _element_id(value: Any) -> str | None:
+    if isinstance(value, dict):
+        for key in _ELEMENT_KEYS:
+            if key in value:
+                return str(value[key])
+    return None
+
+
+def _calling_page_method() -> str | None:
+    """Return `Class.method` of the innermost page object frame on the current stack."""
+    frame: FrameType | None = sys._getframe(2)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(_PAGES_DIR):
+            qualname: str | None = getattr(code, "co_qualname", None)  # Python 3.11+
+            if qualname is None:
+                owner = frame.f_locals.get("self")
+                qualname = f"{type(owner).__name__}.{code.co_name}" if owner is not None else code.co_name
+            return qualname
+        frame = frame.f_back
+    return None
+
+
+def aggregate(records: Iterable[CommandRecord], key: Callable[[CommandRecord], str | None]) -> list[CommandStats]:
+    """Group records by `key` and return the groups sorted by total time, slowest first."""
+    groups: dict[str, list[CommandRecord]] = defaultdict(list)
+    for record in records:
+        groups[key(record) or "<test body>"].append(record)
+    stats = [
+        CommandStats(
+            name=name,
+            count=len(group),
+            total_ms=sum(r.duration_ms for r in group),
+            max_ms=max(r.duration_ms for r in group),
+            request_bytes=sum(r.request_bytes for r in group),
+            response_bytes=sum(r.response_bytes for r in group),
+        )
+        for name, group in groups.items()
+    ]
+    return sorted(stats, key=lambda s: s.total_ms, reverse=True)
+
+
+class CommandProfiler:
+    """Records WebDriver commands issued through the drivers it instruments."""
+
+    def __init__(self) -> None:
+        self.records: list[CommandRecord] = []
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        self._locators_by_element: dict[str, str] = {}
+        self._instrumented: list[Any] = []
+        self._lock = threading.Lock()
+
+    # ============================================================================
+    # INSTRUMENTATION
+    # ============================================================================
+
+    def instrument(self, driver: Any) -> None:
+        """Wrap `driver.command_executor.execute`; instrumenting the same driver twice is a no-op."""
+        executor = driver.command_executor
+        if executor in self._instrumented:
+            return
+        original_execute = executor.execute
+
+        def execute(command: str, params: dict[str, Any] | None = None) -> Any:
+            locator = self._describe_locator(command, params)
+            request_bytes = _payload_size(params)
+            page_method = _calling_page_method()
+            start = time.perf_counter()
+            try:
+                response = original_execute(command, params)
+            except Exception as e:
+                self._record(command, start, request_bytes, 0, locator, page_method, type(e).__name__)
+                raise
+            value = response.get("value") if isinstance(response, dict) else None
+            self._record(command, start, request_bytes, _payload_size(value), locator, page_method, None)
+            if command in _FIND_COMMANDS and locator is not None:
+                self._remember_elements(value, locator)
+            return response
+
+        executor.execute = execute
+        self._instrumented.append(executor)
+
+    def uninstrument(self) -> None:
+        """Restore the original `execute` on every instrumented driver."""
+        for executor in self._instrumented:
+            executor.__dict__.pop("execute", None)
+        self._instrumented.clear()
+
+    def _record(
+        self,
+        command: str,
+        start: float,
+        request_bytes: int,
+        response_bytes: int,
+        locator: str | None,
+        page_method: str | None,
+        error: str | None,
+    ) -> None:
+        record = CommandRecord(
+            command=command,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            request_bytes=request_bytes,
+            response_bytes=response_bytes,
+            locator=locator,
+            page_method=page_method,
+            error=error,
+        )
+        with self._lock:
+            self.records.append(record)
+        self.logger.debug("WebDriver command.", **asdict(record))
+
+    def _describe_locator(self, command: str, params: dict[str, Any] | None) -> str | None:
+        if not params:
+            return None
+        if command in _FIND_COMMANDS and "using" in params:
+            return f"{params['using']}={params.get('value')}"
+        element_id = params.get("id") or params.get("elementId")
+        if element_id is not None:
+            return self._locators_by_element.get(str(element_id))
+        return None
+
+    def _remember_elements(self, value: Any, locator: str) -> None:
+        elements = value if isinstance(value, list) else [value]
+        for element in elements:
+            element_id = _element_id(element)
+            if element_id is not None:
+                self._locators_by_element[element_id] = locator
+
+    # ============================================================================
+    # REPORTING
+    # ============================================================================
+
+    def summary(self) -> dict[str, Any]:
+        total_ms = sum(record.duration_ms for record in self.records)
+        return {
+            **structlog.contextvars.get_contextvars(),
+            "commands": len(self.records),
+            "total_ms": round(total_ms, 2),
+            "by_command": [s.as_row() for s in aggregate(self.records, lambda r: r.command)],
+            "by_page_method": [s.as_row() for s in aggregate(self.records, lambda r: r.page_method)],
+            "by_locator": [s.as_row() for s in aggregate(self.records, lambda r: r.locator) if s.name != "<test body>"],
+        }
+
+    def report(self, jsonl_path: str | os.PathLike[str] | None = None) -> dict[str, Any]:
+        """
+        Attach the summary to the Allure report and append it as one JSONL record.
+
+        Returns:
+            dict: The summary that was reported
+        """
+        summary = self.summary()
+        allure.attach(
+            _as_csv(summary["by_page_method"]),
+            name="WebDriver commands by page method",
+            attachment_type=allure.attachment_type.CSV,
+        )
+        allure.attach(
+            _as_csv(summary["by_command"]),
+            name="WebDriver commands by command",
+            attachment_type=allure.attachment_type.CSV,
+        )
+        if jsonl_path is not None:
+            path = Path(jsonl_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(summary, default=str) + "\n")
+        self.logger.info("WebDriver command profile.", commands=summary["commands"], total_ms=summary["total_ms"])
+        return summary
+
+
+def _as_csv(rows: list[dict[str, Any]]) -> str:
+    buffer = io.StringIO()
+    fieldnames = ["name", "count", "total_ms", "mean_ms", "max_ms", "request_bytes", "response_bytes"]
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
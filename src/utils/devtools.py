@@ -0,0 +1,106 @@
+"""
+Minimal Chrome DevTools Protocol client over the browser's websocket endpoint.
+
+`driver.execute_cdp_cmd` only reaches the page chromedriver is attached to and cannot
+receive events; this client talks to the browser target directly, can address any page
+through flattened `sessionId`s and delivers subscribed events to a handler. Handlers run
+on a small thread pool so they can wait for the replies to their own commands while the
+reader thread keeps dispatching.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+from collections.abc import Callable, Collection
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import requests
+import websocket
+
+_COMMAND_TIMEOUT = 30
+
+EventHandler = Callable[[dict[str, Any]], None]
+
+
+class DevToolsError(RuntimeError):
+    pass
+
+
+class DevToolsConnection:
+    """Browser-level DevTools connection to the Chrome listening at `debugger_address` (host:port)."""
+
+    def __init__(
+        self,
+        debugger_address: str,
+        on_event: EventHandler | None = None,
+        events: Collection[str] = (),
+    ) -> None:
+        self.debugger_address = debugger_address
+        self.on_event = on_event
+        self.events = frozenset(events)
+
+        self._ws: websocket.WebSocket | None = None
+        self._reader: threading.Thread | None = None
+        self._handlers = ThreadPoolExecutor(max_workers=4, thread_name_prefix="devtools-events")
+        self._ids = itertools.count(1)
+        self._pending: dict[int, Future[dict[str, Any]]] = {}
+        self._send_lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and self._ws.connected
+
+    def connect(self) -> DevToolsConnection:
+        version = requests.get(f"http://{self.debugger_address}/json/version", timeout=5).json()
+        self._ws = websocket.create_connection(version["webSocketDebuggerUrl"], suppress_origin=True)
+        self._reader = threading.Thread(target=self._read_loop, name="devtools-reader", daemon=True)
+        self._reader.start()
+        return self
+
+    def close(self) -> None:
+        if self._ws is not None:
+            self._ws.close()
+            self._ws = None
+        self._handlers.shutdown(wait=False, cancel_futures=True)
+
+    def call(self, method: str, params: dict[str, Any] | None = None, session_id: str | None = None) -> Any:
+        """
+        Send a command and wait for its result.
+
+        Raises:
+            DevToolsError: If the browser answers with an error
+            ConnectionError: If the connection is (or gets) closed
+        """
+        if self._ws is None:
+            raise ConnectionError("DevTools connection is closed")
+        message: dict[str, Any] = {"id": next(self._ids), "method": method, "params": params or {}}
+        if session_id is not None:
+            message["sessionId"] = session_id
+        future: Future[dict[str, Any]] = Future()
+        self._pending[message["id"]] = future
+        with self._send_lock:
+            self._ws.send(json.dumps(message))
+        reply = future.result(timeout=_COMMAND_TIMEOUT)
+        if "error" in reply:
+            raise DevToolsError(f"{method} failed: {reply['error'].get('message')}")
+        return reply.get("result", {})
+
+    def _read_loop(self) -> None:
+        ws = self._ws
+        while ws is not None and ws.connected:
+            try:
+                message = json.loads(ws.recv())
+            except (websocket.WebSocketException, OSError, ValueError):
+                break  # Browser quit or close() was called
+            if "id" in message:
+                future = self._pending.pop(message["id"], None)
+                if future is not None:
+                    future.set_result(message)
+            elif self.on_event is not None and message.get("method") in self.events:
+                self._handlers.submit(self.on_event, message)
+        for future in self._pending.values():
+            future.set_exception(ConnectionError("DevTools connection closed"))
+        self._pending.clear()
@@ -0,0 +1,258 @@
+"""
+Download completion watcher for a per-worker downloads directory.
+
+On Linux the watcher listens to inotify events, so a download counts as finished on the
+final rename (`IN_MOVED_TO`) or close-after-write (`IN_CLOSE_WRITE`) of its final name.
+Elsewhere, or if inotify cannot be initialised, it falls back to scanning the directory.
+In both modes, browser temp files (`.crdownload`, `.part`, ...) never count as finished.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import structlog
+
+TEMP_SUFFIXES: tuple[str, ...] = (".crdownload", ".part", ".tmp", ".download")
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+_POLL_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    name: str
+    path: str
+    size_bytes: int
+    started_at: float
+    completed_at: float
+
+    @property
+    def elapsed_s(self) -> float:
+        return max(self.completed_at - self.started_at, 0.0)
+
+    @property
+    def throughput_bps(self) -> float | None:
+        """Bytes per second between the first sign of the download and its completion."""
+        if self.elapsed_s == 0:
+            return None
+        return self.size_bytes / self.elapsed_s
+
+
+def _signature(entry: os.DirEntry[str]) -> tuple[int, int]:
+    stat = entry.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _strip_temp_suffix(name: str) -> str | None:
+    """Return the final file name for a browser temp file, or None for non-temp names."""
+    for suffix in TEMP_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return None
+
+
+class DownloadWatcher:
+    """
+    Track downloads landing in `directory` from the moment the watcher is created.
+
+    Events are consumed on a daemon thread so start/finish times are taken when they
+    happen, not when a test gets around to waiting for them.
+    """
+
+    def __init__(self, directory: str, use_inotify: bool = True) -> None:
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.logger = structlog.get_logger(self.__class__.__name__).bind(directory=self.directory)
+
+        self._condition = threading.Condition()
+        self._started: dict[str, float] = {}
+        self._completed: dict[str, DownloadResult] = {}
+        # Finished files already on disk when watching (re)started, by (size, mtime); not downloads
+        self._baseline: dict[str, tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._inotify_fd: int | None = self._init_inotify() if use_inotify else None
+        self.backend = "inotify" if self._inotify_fd is not None else "polling"
+
+        self._scan_existing()
+        target = self._inotify_loop if self._inotify_fd is not None else self._polling_loop
+        self._thread = threading.Thread(target=target, name=f"download-watcher-{id(self):x}", daemon=True)
+        self._thread.start()
+        self.logger.debug("Download watcher started.", backend=self.backend)
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def wait_for_files(self, names: Iterable[str], timeout: float) -> dict[str, DownloadResult]:
+        """
+        Wait until every file in `names` has finished downloading, or until timeout.
+
+        Returns:
+            dict: Results for the files that completed; missing names did not finish in time
+        """
+        wanted = set(names)
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while not wanted.issubset(self._completed):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            return {name: self._completed[name] for name in wanted if name in self._completed}
+
+    def completed(self) -> list[DownloadResult]:
+        with self._condition:
+            return sorted(self._completed.values(), key=lambda result: result.completed_at)
+
+    def reset(self) -> None:
+        """Forget everything seen so far; files already on disk only count once written again."""
+        with self._condition:
+            self._started.clear()
+            self._completed.clear()
+        self._scan_existing()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=1)
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+    # ============================================================================
+    # EVENT HANDLING
+    # ============================================================================
+
+    def _on_started(self, name: str) -> None:
+        with self._condition:
+            self._started.setdefault(name, time.monotonic())
+
+    def _on_finished(self, name: str) -> None:
+        path = os.path.join(self.directory, name)
+        if _strip_temp_suffix(name) is not None or self._has_temp_sibling(name):
+            return
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        now = time.monotonic()
+        with self._condition:
+            self._baseline.pop(name, None)
+            started_at = self._started.pop(name, now)
+            result = DownloadResult(name=name, path=path, size_bytes=size, started_at=started_at, completed_at=now)
+            self._completed[name] = result
+            self._condition.notify_all()
+        self.logger.debug(
+            "Download completed.",
+            file=name,
+            size_bytes=size,
+            elapsed_s=round(result.elapsed_s, 3),
+            throughput_bps=result.throughput_bps,
+        )
+
+    def _has_temp_sibling(self, name: str) -> bool:
+        return any(os.path.exists(os.path.join(self.directory, name + suffix)) for suffix in TEMP_SUFFIXES)
+
+    def _scan_existing(self) -> None:
+        """Record the files already in the directory: temp files as started, finished ones as the baseline."""
+        baseline: dict[str, tuple[int, int]] = {}
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            final_name = _strip_temp_suffix(entry.name)
+            if final_name is not None:
+                self._on_started(final_name)
+            elif not entry.name.endswith(".lock"):
+                baseline[entry.name] = _signature(entry)
+        with self._condition:
+            self._baseline = baseline
+
+    def _is_baseline(self, entry: os.DirEntry[str]) -> bool:
+        with self._condition:
+            return self._baseline.get(entry.name) == _signature(entry)
+
+    # ============================================================================
+    # BACKENDS
+    # ============================================================================
+
+    def _init_inotify(self) -> int | None:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = _IN_CREATE | _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO
+            if libc.inotify_add_watch(fd, self.directory.encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return int(fd)
+        except (OSError, AttributeError) as e:
+            self.logger.debug("inotify unavailable, falling back to polling.", error=str(e))
+            return None
+
+    def _inotify_loop(self) -> None:
+        fd = self._inotify_fd
+        while not self._stop.is_set() and fd is not None:
+            readable, _, _ = select.select([fd], [], [], _POLL_INTERVAL)
+            if not readable:
+                continue
+            try:
+                buffer = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buffer):
+                _, mask, _, name_len = _EVENT_HEADER.unpack_from(buffer, offset)
+                start = offset + _EVENT_HEADER.size
+                name = buffer[start : start + name_len].rstrip(b"\0").decode(errors="replace")
+                offset = start + name_len
+                if name:
+                    self._dispatch_inotify_event(name, mask)
+
+    def _dispatch_inotify_event(self, name: str, mask: int) -> None:
+        final_name = _strip_temp_suffix(name)
+        if final_name is not None:
+            self._on_started(final_name)
+        elif mask & (_IN_MOVED_TO | _IN_CLOSE_WRITE):
+            self._on_finished(name)
+        elif mask & (_IN_CREATE | _IN_MODIFY):
+            self._on_started(name)
+
+    def _polling_loop(self) -> None:
+        sizes: dict[str, int] = {}
+        while not self._stop.wait(_POLL_INTERVAL):
+            try:
+                entries = [entry for entry in os.scandir(self.directory) if entry.is_file()]
+            except OSError:
+                continue
+            for entry in entries:
+                final_name = _strip_temp_suffix(entry.name)
+                if final_name is not None:
+                    self._on_started(final_name)
+                    continue
+                if entry.name in self._completed or entry.name.endswith(".lock") or self._is_baseline(entry):
+                    continue
+                self._on_started(entry.name)
+                size = entry.stat().st_size
+                # A file counts as finished once its size is stable across two scans.
+                if sizes.get(entry.name) == size:
+                    self._on_finished(entry.name)
+                sizes[entry.name] = size
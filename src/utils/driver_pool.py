@@ -0,0 +1,188 @@
+"""
+Pool of pre-warmed WebDriver sessions for one test worker.
+
+Spare browsers are started on background threads while the current test runs, so the
+next test's `get_new_driver` can check out a ready session instead of paying browser
+startup. Idle sessions are health-checked on checkout and evicted once they exceed the
+maximum idle time. Pools are kept per process (i.e. per xdist worker) and keyed by the
+driver options, so a session is only handed to a test that asked for the same browser.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+_SPAWN_TIMEOUT = 60
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    spawned: int = 0
+    spawn_failures: int = 0
+    evicted: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "spawned": self.spawned,
+            "spawn_failures": self.spawn_failures,
+            "evicted": self.evicted,
+        }
+
+
+@dataclass
+class _IdleDriver:
+    driver: Any
+    ready_at: float = field(default_factory=time.monotonic)
+
+
+def is_driver_healthy(driver: Any) -> bool:
+    """Cheap liveness check: the driver service is running and the browser answers a command."""
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is not None and process.poll() is not None:
+        return False
+    try:
+        return bool(driver.window_handles)
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """Keeps up to `size` spare drivers created by `factory` ready for checkout."""
+
+    def __init__(self, factory: Callable[[], Any], size: int, max_idle_s: float) -> None:
+        self.factory = factory
+        self.size = size
+        self.max_idle_s = max_idle_s
+        self.stats = PoolStats()
+        self.logger = structlog.get_logger(self.__class__.__name__)
+
+        self._idle: deque[_IdleDriver] = deque()
+        self._pending = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def checkout(self) -> Any | None:
+        """
+        Return a healthy spare driver, or None if the pool has none to give.
+
+        If a spare is still starting up, waits for it: it was started earlier, so it is
+        ready sooner than a driver created from scratch now would be.
+        """
+        deadline = time.monotonic() + _SPAWN_TIMEOUT
+        while True:
+            with self._condition:
+                while not self._idle:
+                    remaining = deadline - time.monotonic()
+                    if self._pending == 0 or self._closed or remaining <= 0:
+                        self.stats.misses += 1
+                        return None
+                    self._condition.wait(remaining)
+                entry = self._idle.popleft()
+            # The health check is a round trip to the browser; other checkouts and the spawn
+            # threads must not wait on the lock for it
+            if self._is_usable(entry):
+                with self._condition:
+                    self.stats.hits += 1
+                return entry.driver
+
+    def replenish(self) -> None:
+        """Start background spawns until idle plus starting drivers reach the pool size."""
+        with self._condition:
+            missing = self.size - len(self._idle) - self._pending
+            if self._closed or missing <= 0:
+                return
+            self._pending += missing
+        for _ in range(missing):
+            threading.Thread(target=self._spawn, name="driver-pool-spawn", daemon=True).start()
+
+    def shutdown(self) -> PoolStats:
+        """Quit every idle driver and stop accepting new ones."""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+        for entry in idle:
+            self._quit(entry.driver)
+        self.logger.info("Driver pool closed.", **self.stats.as_dict())
+        return self.stats
+
+    def _is_usable(self, entry: _IdleDriver) -> bool:
+        """Return True if the checked-out spare can be used, otherwise evict it in the background."""
+        idle_s = time.monotonic() - entry.ready_at
+        if idle_s <= self.max_idle_s and is_driver_healthy(entry.driver):
+            return True
+        with self._condition:
+            self.stats.evicted += 1
+        self.logger.debug("Evicting pooled driver.", idle_s=round(idle_s))
+        threading.Thread(target=self._quit, args=(entry.driver,), daemon=True).start()
+        return False
+
+    def _spawn(self) -> None:
+        start_time = time.monotonic()
+        try:
+            driver = self.factory()
+        except Exception as e:
+            self.logger.warning("Failed to start pooled driver.", error=str(e))
+            with self._condition:
+                self._pending -= 1
+                self.stats.spawn_failures += 1
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            self._pending -= 1
+            self.stats.spawned += 1
+            if not self._closed:
+                self._idle.append(_IdleDriver(driver))
+                self._condition.notify_all()
+                driver = None
+        if driver is not None:  # Pool closed while the browser was starting
+            self._quit(driver)
+        else:
+            self.logger.debug("Pooled driver ready.", startup_s=round(time.monotonic() - start_time, 2))
+
+    @staticmethod
+    def _quit(driver: Any) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+_pools: dict[str, DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: str, factory: Callable[[], Any], size: int, max_idle_s: float) -> DriverPool:
+    """Return this process's pool for `key`, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = DriverPool(factory, size, max_idle_s)
+        return pool
+
+
+def shutdown_pools() -> dict[str, int]:
+    """Close every pool in this process and return the combined stats."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    totals = PoolStats()
+    for pool in pools:
+        stats = pool.shutdown()
+        for name, value in stats.as_dict().items():
+            setattr(totals, name, getattr(totals, name) + value)
+    return totals.as_dict()
@@ -0,0 +1,222 @@
+"""
+Historical-duration-aware xdist scheduling (pytest plugin).
+
+With `--duration-scheduling`, tests are grouped into work units (by default one per test
+class, so tests sharing class state stay on one worker) and units are queued longest first,
+using each test's duration from previous runs. A worker is given a unit only when it is
+down to its last queued test (xdist workers need the next unit before they start that
+test). It gets the largest waiting unit if it will be free no later than the other
+workers, and the smallest otherwise, so large units are not queued behind a long test on a
+busy worker while another one idles. This approximates longest-processing-time-first
+scheduling, whose makespan approaches the total time divided by the number of workers.
+
+Durations (setup + call + teardown, reruns included) are collected on the controller
+from the reports workers send back and stored per browser in a JSON timing store. Tests
+without history are costed at the median known duration.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+import structlog
+from xdist.remote import Producer
+from xdist.scheduler import LoadScopeScheduling
+from xdist.workermanage import WorkerController
+
+DEFAULT_STORE = ".pytest_durations.json"
+DEFAULT_DURATION_S = 1.0
+# Weight of the latest run when updating a stored duration
+_SMOOTHING = 0.7
+
+_SCOPES = ("test", "class", "file")
+
+
+class DurationStore:
+    """Per-browser map of test node id to its smoothed duration in seconds."""
+
+    def __init__(self, path: str | Path, browser: str) -> None:
+        self.path = Path(path)
+        self.browser = browser
+        self._all: dict[str, dict[str, float]] = {}
+        if self.path.exists():
+            try:
+                self._all = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._all = {}
+        self.durations: dict[str, float] = self._all.setdefault(browser, {})
+
+    def estimate(self, nodeid: str, default: float) -> float:
+        return self.durations.get(nodeid, default)
+
+    def default_duration(self) -> float:
+        return statistics.median(self.durations.values()) if self.durations else DEFAULT_DURATION_S
+
+    def update(self, measured: dict[str, float]) -> None:
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else _SMOOTHING * seconds + (1 - _SMOOTHING) * previous
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._all, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def split_scope(nodeid: str, scope: str) -> str:
+    """Return the work unit a test belongs to: the test itself, its class or its file."""
+    path, _, rest = nodeid.partition("::")
+    if scope == "file" or not rest:
+        return path
+    if scope == "class":
+        parts = rest.split("::")
+        return f"{path}::{parts[0]}" if len(parts) > 1 else nodeid
+    return nodeid
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """LoadScopeScheduling with work units ordered by their historical duration, longest first."""
+
+    def __init__(self, config: pytest.Config, log: Producer | None = None) -> None:
+        super().__init__(config, log)
+        # The work queue is ordered by cost below; the default reorder by test count is not needed
+        config.option.loadscopereorder = False
+        self.scope: str = config.getoption("duration_scope")
+        self._ordered = False
+        self._estimates: dict[str, float] = {}  # Node id -> estimated seconds, set when the queue is ordered
+        self.store = DurationStore(config.getoption("duration_store"), _browser(config))
+        self.logger = structlog.get_logger(self.__class__.__name__)
+
+    def _split_scope(self, nodeid: str) -> str:
+        return split_scope(nodeid, self.scope)
+
+    def _assign_work_unit(self, node: WorkerController) -> None:
+        # The first assignment happens inside schedule(), right after it built the work queue
+        # in collection order. Reordering the queue, not the collection, matters: workers look
+        # up the test indexes they are sent in their own, collection-ordered items.
+        if not self._ordered:
+            self._order_by_cost()
+            self._ordered = True
+        super()._assign_work_unit(node)
+
+    def _reschedule(self, node: WorkerController) -> None:
+        """
+        Give `node` its next unit once it is down to its last queued test.
+
+        An xdist worker only starts its last queued test after it is sent more work (or shut
+        down), so that is the moment it needs a unit; LoadScopeScheduling hands one out while
+        two are still queued. The largest waiting unit goes to `node` if it will be free no
+        later than every other worker. Otherwise `node` still has a long test ahead of it and
+        gets the smallest unit, leaving the large ones for workers that free up sooner.
+        """
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+        if self._pending_of(self.assigned_work[node]) > 1:
+            return
+
+        load = self._remaining_load(node)
+        other_loads = [self._remaining_load(other) for other in self.assigned_work if other is not node]
+        if other_loads and load > min(other_loads):
+            smallest = next(reversed(self.workqueue))
+            self.workqueue.move_to_end(smallest, last=False)
+        self._assign_work_unit(node)
+
+    def _remaining_load(self, node: WorkerController) -> float:
+        """Estimated seconds of the tests assigned to `node` that have not completed."""
+        return sum(
+            self._estimates.get(nodeid, 0.0)
+            for work_unit in self.assigned_work[node].values()
+            for nodeid, completed in work_unit.items()
+            if not completed
+        )
+
+    def _order_by_cost(self) -> None:
+        default = self.store.default_duration()
+        self._estimates = {
+            nodeid: self.store.estimate(nodeid, default)
+            for work_unit in self.workqueue.values()
+            for nodeid in work_unit
+        }
+        costs = {
+            scope: sum(self._estimates[nodeid] for nodeid in work_unit) for scope, work_unit in self.workqueue.items()
+        }
+        # sorted() is stable, so units of equal cost keep their collection order
+        for scope in sorted(costs, key=lambda scope: -costs[scope]):
+            self.workqueue.move_to_end(scope)
+
+        if costs:
+            workers = max(self.numnodes, 1)
+            total = sum(costs.values())
+            self.logger.info(
+                "Duration-aware schedule.",
+                units=len(costs),
+                estimated_total_s=round(total, 1),
+                longest_unit_s=round(max(costs.values()), 1),
+                makespan_lower_bound_s=round(max(total / workers, max(costs.values())), 1),
+            )
+
+
+def _browser(config: pytest.Config) -> str:
+    return str(getattr(config.option, "browser", None) or "default")
+
+
+# ============================================================================
+# PLUGIN HOOKS
+# ============================================================================
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("duration-scheduling", "historical-duration-aware xdist scheduling")
+    group.addoption(
+        "--duration-scheduling",
+        action="store_true",
+        default=False,
+        help="With -n, hand out work units longest first using durations from previous runs",
+    )
+    group.addoption(
+        "--duration-scope",
+        choices=_SCOPES,
+        default="class",
+        help="Work unit kept on one worker: test, class (default) or file",
+    )
+    group.addoption(
+        "--duration-store",
+        default=DEFAULT_STORE,
+        help=f"JSON timing store read at scheduling and updated after the run (default: {DEFAULT_STORE})",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Durations are collected on the controller, from the reports the workers send back
+    if config.getoption("duration_scheduling") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(config), "duration-recorder")
+
+
+def pytest_xdist_make_scheduler(config: pytest.Config, log: Producer) -> DurationScheduling | None:
+    if not config.getoption("duration_scheduling"):
+        return None
+    return DurationScheduling(config, log)
+
+
+class DurationRecorder:
+    """Sums each test's phase durations from its reports and merges them into the store at the end."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.config = config
+        self.measured: dict[str, float] = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self.measured[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if not self.measured or self.config.getoption("collectonly"):
+            return
+        store = DurationStore(self.config.getoption("duration_store"), _browser(self.config))
+        store.update(self.measured)
+        store.save()
@@ -0,0 +1,191 @@
+"""
+HTTP-level checks of the app's authentication pages, without a browser.
+
+`check_basic_auth` sends each credential pair in the URL, which requests turns into a
+Basic Authorization header. DigestAuthClient answers the server's digest challenge itself (RFC 7616, MD5 or SHA-256
+with qop=auth). It fetches the nonce once and reuses it for every credential case, so
+after the first challenge each case costs one request instead of the usual
+challenge/response pair. A nonce is only refreshed when the server flags it as stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from requests.utils import parse_dict_header
+
+from src.utils.http_client import DEFAULT_TIMEOUT, get_http_session, map_concurrently
+
+# lxml parses several times faster than the stdlib parser; it is used when installed
+_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+_PARAGRAPHS = SoupStrainer("p")
+
+_HASHES = {"MD5": hashlib.md5, "SHA-256": hashlib.sha256}
+
+
+@dataclass(frozen=True)
+class AuthScenarioResult:
+    username: str
+    password: str
+    status_code: int
+    message: str
+
+
+@lru_cache(maxsize=32)
+def first_paragraph_text(html: str) -> str:
+    """Return the text of the first <p> in `html`; only <p> elements are built, and each body is parsed once."""
+    message_tag = BeautifulSoup(html, _PARSER, parse_only=_PARAGRAPHS).find("p")
+    return message_tag.get_text(strip=True) if message_tag else ""
+
+
+def basic_auth_url(url: str, username: str, password: str) -> str:
+    """Return `url` with the credentials in its netloc; with neither, `url` is returned unchanged."""
+    if username == "" and password == "":
+        return url
+    parts = urlsplit(url)
+    return parts._replace(netloc=f"{username}:{password}@{parts.netloc}").geturl()
+
+
+def _scenario_result(username: str, password: str, response: requests.Response) -> AuthScenarioResult:
+    message = first_paragraph_text(response.text) if response.status_code == 200 else response.text
+    return AuthScenarioResult(username, password, response.status_code, message)
+
+
+def check_basic_auth(url: str, credentials: Iterable[tuple[str, str]]) -> list[AuthScenarioResult]:
+    """Request the basic-auth protected `url` with every (username, password) pair concurrently, in input order."""
+
+    def check(pair: tuple[str, str]) -> AuthScenarioResult:
+        response = get_http_session().get(basic_auth_url(url, *pair), timeout=DEFAULT_TIMEOUT)
+        return _scenario_result(*pair, response)
+
+    return map_concurrently(check, list(credentials))
+
+
+@dataclass(frozen=True)
+class DigestChallenge:
+    realm: str
+    nonce: str
+    opaque: str | None
+    qop: str | None
+    algorithm: str
+
+    @classmethod
+    def parse(cls, header: str) -> DigestChallenge:
+        """
+        Parse a `WWW-Authenticate: Digest ...` header.
+
+        Raises:
+            ValueError: If the header is not a digest challenge this client can answer
+        """
+        scheme, _, params = header.partition(" ")
+        if scheme.lower() != "digest":
+            raise ValueError(f"Not a digest challenge: {header!r}")
+        values = parse_dict_header(params)
+        nonce = values.get("nonce")
+        if not nonce:
+            raise ValueError(f"Digest challenge without a nonce: {header!r}")
+        algorithm = (values.get("algorithm") or "MD5").upper()
+        if algorithm not in _HASHES:
+            raise ValueError(f"Unsupported digest algorithm: {algorithm}")
+        qop_options = [option.strip() for option in (values.get("qop") or "").split(",") if option.strip()]
+        if qop_options and "auth" not in qop_options:
+            raise ValueError(f"Unsupported digest qop: {values['qop']}")
+        return cls(
+            realm=values.get("realm") or "",
+            nonce=nonce,
+            opaque=values.get("opaque"),
+            qop="auth" if qop_options else None,
+            algorithm=algorithm,
+        )
+
+
+class DigestAuthClient:
+    """Check credentials against the digest-protected `url` over the worker's shared HTTP session."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.uri = urlsplit(url)._replace(scheme="", netloc="").geturl() or "/"
+        self.challenges_fetched = 0
+        self._challenge: DigestChallenge | None = None
+        self._challenge_lock = threading.Lock()
+        self._nonce_counts = itertools.count(1)
+
+    def challenge(self, stale: DigestChallenge | None = None) -> DigestChallenge:
+        """
+        Return the cached challenge, asking the server for one if there is none yet.
+
+        Passing the challenge a request was rejected as stale with replaces it, once, however
+        many threads report it.
+        """
+        with self._challenge_lock:
+            if self._challenge is None or self._challenge == stale:
+                response = get_http_session().get(self.url, timeout=DEFAULT_TIMEOUT)
+                self._challenge = DigestChallenge.parse(response.headers.get("WWW-Authenticate", ""))
+                self.challenges_fetched += 1
+            return self._challenge
+
+    def authorization(self, username: str, password: str, challenge: DigestChallenge, method: str = "GET") -> str:
+        """Return the Authorization header answering `challenge`."""
+
+        def digest(value: str) -> str:
+            return _HASHES[challenge.algorithm](value.encode()).hexdigest()
+
+        ha1 = digest(f"{username}:{challenge.realm}:{password}")
+        ha2 = digest(f"{method}:{self.uri}")
+        fields = {
+            "username": username,
+            "realm": challenge.realm,
+            "nonce": challenge.nonce,
+            "uri": self.uri,
+            "algorithm": challenge.algorithm,
+        }
+        if challenge.qop is None:
+            fields["response"] = digest(f"{ha1}:{challenge.nonce}:{ha2}")
+        else:
+            nonce_count, cnonce = f"{next(self._nonce_counts):08x}", os.urandom(8).hex()
+            fields["response"] = digest(f"{ha1}:{challenge.nonce}:{nonce_count}:{cnonce}:{challenge.qop}:{ha2}")
+            fields.update(qop=challenge.qop, nc=nonce_count, cnonce=cnonce)
+        if challenge.opaque is not None:
+            fields["opaque"] = challenge.opaque
+        # qop, nc and algorithm are tokens and sent unquoted
+        unquoted = {"qop", "nc", "algorithm"}
+        return "Digest " + ", ".join(
+            f"{name}={value}" if name in unquoted else f'{name}="{value}"' for name, value in fields.items()
+        )
+
+    def check(self, username: str, password: str) -> AuthScenarioResult:
+        challenge = self.challenge()
+        response = self._request(username, password, challenge)
+        if response.status_code == 401 and _is_stale(response.headers.get("WWW-Authenticate", "")):
+            response = self._request(username, password, self.challenge(stale=challenge))
+        return _scenario_result(username, password, response)
+
+    def _request(self, username: str, password: str, challenge: DigestChallenge) -> requests.Response:
+        headers = {"Authorization": self.authorization(username, password, challenge)}
+        return get_http_session().get(self.url, headers=headers, timeout=DEFAULT_TIMEOUT)
+
+    def check_all(self, credentials: Iterable[tuple[str, str]]) -> list[AuthScenarioResult]:
+        """Check every (username, password) pair concurrently; results are in input order."""
+        self.challenge()  # Fetched once up front rather than raced for by the first requests
+        return map_concurrently(lambda pair: self.check(*pair), list(credentials))
+
+
+def _is_stale(header: str) -> bool:
+    _, _, params = header.partition(" ")
+    return (parse_dict_header(params).get("stale") or "").lower() == "true"
+
+
+@cache
+def get_digest_client(url: str) -> DigestAuthClient:
+    """Return this process's client for `url`, so its nonce is reused across tests."""
+    return DigestAuthClient(url)
@@ -0,0 +1,46 @@
+"""
+HTTP client for the checks page objects make outside the browser.
+
+`get_http_session` returns one keep-alive `requests.Session` per process. Its connection
+pool is large enough for `map_concurrently`'s threads, so repeated requests to the app
+under test skip the TCP and TLS handshakes. The shared session must not be given
+headers, cookies or auth of its own. Code that needs those creates its own with
+`pooled_session`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = (5, 30)  # Connect, read
+MAX_CONCURRENCY = 16
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def pooled_session(pool_size: int = MAX_CONCURRENCY) -> requests.Session:
+    """Return a new session that keeps up to `pool_size` connections per host alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@cache
+def get_http_session() -> requests.Session:
+    """Return this process's shared keep-alive session."""
+    return pooled_session()
+
+
+def map_concurrently(fn: Callable[[_T], _R], items: Iterable[_T], max_workers: int = MAX_CONCURRENCY) -> list[_R]:
+    """Call `fn` on every item from a thread pool; results are in input order and the first error is raised."""
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http-client") as executor:
+        return list(executor.map(fn, items))
@@ -0,0 +1,160 @@
+"""
+Concurrent file downloads over HTTP, outside the browser.
+
+All files are fetched through one `requests.Session` whose connection pool matches the
+number of worker threads, so connections are kept alive and reused between files. Each
+response is streamed in chunks to a `<name>.<random>.part` file of its own and renamed
+when complete, so links with the same file name never share a partial file; the
+DownloadWatcher never counts `.part` files as finished. While streaming, the size is
+checked against Content-Length and a SHA-256 is computed, which can be checked against
+expected checksums. The session can take the browser's cookies and user agent, so the
+server sees the same client as it would for a click on the link.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+import requests
+
+from src.utils.http_client import pooled_session
+
+_CHUNK_SIZE = 64 * 1024
+_TIMEOUT = (5, 30)  # Connect, read
+
+
+class DownloadVerificationError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class HttpDownload:
+    url: str
+    path: str
+    size_bytes: int
+    sha256: str
+    elapsed_s: float
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    @property
+    def throughput_bps(self) -> float | None:
+        if self.elapsed_s == 0:
+            return None
+        return self.size_bytes / self.elapsed_s
+
+
+@dataclass
+class HttpDownloadReport:
+    downloads: list[HttpDownload] = field(default_factory=list)
+    failures: dict[str, str] = field(default_factory=dict)  # URL -> error
+    elapsed_s: float = 0.0
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(download.size_bytes for download in self.downloads)
+
+    @property
+    def throughput_bps(self) -> float | None:
+        """Aggregate bytes per second over the wall time of the whole batch."""
+        if self.elapsed_s == 0:
+            return None
+        return self.total_bytes / self.elapsed_s
+
+
+def file_name_from_url(url: str) -> str:
+    return unquote(urlsplit(url).path.rsplit("/", 1)[-1])
+
+
+class HttpDownloader:
+    """Download files concurrently, with at most `max_workers` requests in flight."""
+
+    def __init__(self, max_workers: int = 8) -> None:
+        self.max_workers = max_workers
+        self.session = pooled_session(max_workers)  # Its own: it carries the browser's cookies
+
+    def __enter__(self) -> HttpDownloader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def use_browser_identity(self, driver: Any) -> None:
+        """Send the cookies and user agent of a WebDriver session with every request."""
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/")
+            )
+        self.session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+
+    def download_all(
+        self,
+        urls: Iterable[str],
+        dest_folder: str | Path,
+        expected_sha256: Mapping[str, str] | None = None,
+    ) -> HttpDownloadReport:
+        """
+        Download every URL into `dest_folder`, named after the last path segment.
+
+        A file whose size or checksum (`expected_sha256`, by file name) does not match is
+        deleted and reported as a failure, as are HTTP and connection errors; one file
+        failing does not stop the others.
+        """
+        os.makedirs(dest_folder, exist_ok=True)
+        expected_sha256 = expected_sha256 or {}
+        report = HttpDownloadReport()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="http-download") as executor:
+            futures = {
+                url: executor.submit(
+                    self._download, url, Path(dest_folder), expected_sha256.get(file_name_from_url(url))
+                )
+                for url in dict.fromkeys(urls)
+            }
+            for url, future in futures.items():
+                try:
+                    report.downloads.append(future.result())
+                except (requests.RequestException, OSError, DownloadVerificationError) as e:
+                    report.failures[url] = str(e)
+        report.elapsed_s = time.perf_counter() - start
+        return report
+
+    def _download(self, url: str, dest_folder: Path, expected_sha256: str | None) -> HttpDownload:
+        path = dest_folder / file_name_from_url(url)
+        part_path = path.with_name(f"{path.name}.{os.urandom(4).hex()}.part")
+        start = time.perf_counter()
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with self.session.get(url, stream=True, timeout=_TIMEOUT) as response:
+                response.raise_for_status()
+                with open(part_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                # Content-Length counts encoded bytes; iter_content yields decoded ones
+                expected_size = response.headers.get("Content-Length")
+                if expected_size is not None and "Content-Encoding" not in response.headers:
+                    if size != int(expected_size):
+                        raise DownloadVerificationError(f"Got {size} of {expected_size} bytes")
+            sha256 = digest.hexdigest()
+            if expected_sha256 is not None and sha256 != expected_sha256.lower():
+                raise DownloadVerificationError(f"SHA-256 {sha256} does not match {expected_sha256}")
+            os.replace(part_path, path)
+        finally:
+            part_path.unlink(missing_ok=True)
+        return HttpDownload(url, str(path), size, sha256, time.perf_counter() - start)
@@ -0,0 +1,188 @@
+"""
+Blocking of page resources that tests never look at.
+
+A profile (RESOURCE_PROFILE, or `@pytest.mark.resources("<profile>")` on a test) names
+the kinds of resources the browser does not load:
+
+- Chrome: a ResourceBlocker auto-attaches to every page over its own DevTools connection.
+  Images, fonts and media are blocked by URL with `Network.setBlockedURLs`. Scripts from
+  other origins than BASE_URL are paused with `Fetch` and failed. The rules can change
+  at any time: the next request in every page uses them.
+- Firefox: the matching preferences are set when the driver is launched, see
+  `firefox_prefs`. They cannot change while the browser runs, and Firefox has no
+  preference for third-party scripts.
+
+Page objects that need a blocked kind declare it in `BasePage.required_resources`.
+MainPage unblocks it, through UiBaseCase, for the rest of the test before navigating to
+the page.
+"""
+
+from __future__ import annotations
+
+import threading
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import structlog
+
+from src.config.project_config import ResourceProfileEnum
+from src.utils.devtools import DevToolsConnection
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.utils.browser_contexts import BrowserContext
+
+
+class ResourceKind(str, Enum):
+    image = "image"
+    font = "font"
+    media = "media"
+    third_party_script = "third_party_script"
+
+
+PROFILES: dict[ResourceProfileEnum, frozenset[ResourceKind]] = {
+    ResourceProfileEnum.full: frozenset(),
+    ResourceProfileEnum.no_media: frozenset({ResourceKind.image, ResourceKind.font, ResourceKind.media}),
+    ResourceProfileEnum.lean: frozenset(ResourceKind),
+}
+
+_URL_PATTERNS: dict[ResourceKind, tuple[str, ...]] = {
+    ResourceKind.image: ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp"),
+    ResourceKind.font: ("woff", "woff2", "ttf", "otf", "eot"),
+    ResourceKind.media: ("mp4", "webm", "ogg", "mp3", "wav", "m4a"),
+}
+
+_FIREFOX_PREFS: dict[ResourceKind, str] = {
+    ResourceKind.image: "permissions.default.image:2",
+    ResourceKind.font: "gfx.downloadable_fonts.enabled:false",
+    ResourceKind.media: "media.autoplay.default:5",  # No autoplay, so media is only fetched when played
+}
+
+
+def blocked_url_patterns(blocked: Iterable[ResourceKind]) -> list[str]:
+    """Return `Network.setBlockedURLs` patterns for the blocked kinds, with and without a query string."""
+    return [
+        pattern
+        for kind in blocked
+        for extension in _URL_PATTERNS.get(kind, ())
+        for pattern in (f"*.{extension}", f"*.{extension}?*")
+    ]
+
+
+def firefox_prefs(blocked: Iterable[ResourceKind]) -> str:
+    """Return the blocked kinds as a SeleniumBase `firefox_pref` string ("pref:value,...")."""
+    return ",".join(_FIREFOX_PREFS[kind] for kind in sorted(blocked) if kind in _FIREFOX_PREFS)
+
+
+class ResourceBlocker:
+    """Applies resource blocking rules to every page of the Chrome at `debugger_address`."""
+
+    def __init__(
+        self,
+        debugger_address: str,
+        first_party_origin: str | None,
+        browser_context: BrowserContext | None = None,
+    ) -> None:
+        self.debugger_address = debugger_address
+        self.first_party_origin = first_party_origin
+        self.browser_context = browser_context
+        self.blocked: frozenset[ResourceKind] = frozenset()
+        self.logger = structlog.get_logger(self.__class__.__name__)
+        self._sessions: set[str] = set()
+        self._sessions_lock = threading.Lock()
+        self._devtools = DevToolsConnection(
+            debugger_address,
+            self._dispatch,
+            events=("Target.attachedToTarget", "Target.detachedFromTarget", "Fetch.requestPaused"),
+        )
+
+    @classmethod
+    def for_driver(cls, driver: Any, first_party_origin: str | None) -> ResourceBlocker | None:
+        """Return a started blocker for a Chrome driver, or None if it exposes no DevTools address."""
+        address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if not address:
+            return None
+        return cls(address, first_party_origin, getattr(driver, "browser_context", None)).start()
+
+    def start(self) -> ResourceBlocker:
+        self._devtools.connect()
+        # Attaches to existing pages too; new windows are paused until their rules are applied
+        self._devtools.call(
+            "Target.setAutoAttach",
+            {"autoAttach": True, "waitForDebuggerOnStart": True, "flatten": True},
+        )
+        return self
+
+    def stop(self) -> None:
+        self._devtools.close()
+
+    def block(self, blocked: Iterable[ResourceKind]) -> None:
+        """Replace the blocked kinds in every attached page; unchanged rules cost nothing."""
+        blocked = frozenset(blocked)
+        if blocked == self.blocked:
+            return
+        self.blocked = blocked
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session_id in sessions:
+            self._apply(session_id)
+
+    # ============================================================================
+    # DEVTOOLS EVENTS
+    # ============================================================================
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        params = message["params"]
+        try:
+            if message["method"] == "Target.attachedToTarget":
+                self._on_attached(params)
+            elif message["method"] == "Target.detachedFromTarget":
+                with self._sessions_lock:
+                    self._sessions.discard(params["sessionId"])
+            else:
+                self._on_script_paused(params, message["sessionId"])
+        except Exception as e:
+            self.logger.debug("Resource blocking handler failed.", error=str(e))
+
+    def _on_attached(self, params: dict[str, Any]) -> None:
+        session_id = params["sessionId"]
+        target = params["targetInfo"]
+        if target["type"] == "page" and self._in_context(target):
+            self._devtools.call("Network.enable", {}, session_id)
+            with self._sessions_lock:
+                self._sessions.add(session_id)
+            self._apply(session_id)
+        if params.get("waitingForDebugger"):
+            self._devtools.call("Runtime.runIfWaitingForDebugger", {}, session_id)
+
+    def _in_context(self, target: dict[str, Any]) -> bool:
+        # Compared on every attach: the context is replaced when a reused browser is reset
+        return self.browser_context is None or target.get("browserContextId") == self.browser_context.context_id
+
+    def _apply(self, session_id: str) -> None:
+        blocked = self.blocked
+        self._devtools.call("Network.setBlockedURLs", {"urls": blocked_url_patterns(blocked)}, session_id)
+        if ResourceKind.third_party_script in blocked and self.first_party_origin is not None:
+            self._devtools.call(
+                "Fetch.enable",
+                {"patterns": [{"urlPattern": "*", "resourceType": "Script", "requestStage": "Request"}]},
+                session_id,
+            )
+        else:
+            self._devtools.call("Fetch.disable", {}, session_id)
+
+    def _on_script_paused(self, params: dict[str, Any], session_id: str) -> None:
+        request_id = params["requestId"]
+        parts = urlsplit(params["request"]["url"])
+        if (
+            ResourceKind.third_party_script in self.blocked
+            and parts.scheme in ("http", "https")
+            and f"{parts.scheme}://{parts.netloc}" != self.first_party_origin
+        ):
+            self._devtools.call(
+                "Fetch.failRequest", {"requestId": request_id, "errorReason": "BlockedByClient"}, session_id
+            )
+        else:
+            self._devtools.call("Fetch.continueRequest", {"requestId": request_id}, session_id)
@@ -0,0 +1,28 @@
+"""Fixtures for the API test suite: one keep-alive session per worker and an async client per test."""
+
+from collections.abc import Iterator
+
+import pytest
+import requests
+
+from src.config import settings
+from src.utils.async_http import AsyncApiClient
+from src.utils.http_client import pooled_session
+
+
+@pytest.fixture(scope="session")
+def api_session() -> Iterator[requests.Session]:
+    """Keep-alive session whose connection pool is shared by every API test of the worker."""
+    session = pooled_session(settings.API_CONCURRENCY)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def api(api_session: requests.Session) -> Iterator[AsyncApiClient]:
+    """Async client for BASE_URL; the test's requests and their latency are attached to Allure at teardown."""
+    api_session.cookies.clear()  # Logins from earlier tests must not leak into this one
+    client = AsyncApiClient(str(settings.BASE_URL), api_session, settings.API_CONCURRENCY, settings.API_RATE_LIMIT)
+    yield client
+    client.report()
+    client.close()
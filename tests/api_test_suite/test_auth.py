@@ -0,0 +1,103 @@
+from urllib.parse import urljoin
+
+import allure
+import pytest
+from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+
+from src.config import settings
+from src.utils.async_http import AsyncApiClient
+from src.utils.http_auth import check_basic_auth, get_digest_client
+
+AUTHORIZED_MESSAGE = "Congratulations! You must have the proper credentials."
+
+
+@allure.parent_suite("API Test Suite")
+@allure.suite("Authentication")
+@allure.sub_suite("Verify basic and digest authentication")
+class TestAuth:
+    """Tests basic and digest authentication at the HTTP level"""
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_basic_auth(self, api: AsyncApiClient) -> None:
+        valid, invalid, anonymous = api.run(
+            api.gather(
+                [
+                    api.get("basic_auth", auth=HTTPBasicAuth("admin", "admin")),
+                    api.get("basic_auth", auth=HTTPBasicAuth("admin", "wrong")),
+                    api.get("basic_auth"),
+                ]
+            )
+        )
+
+        assert valid.status_code == 200, f"Expected 200 with valid credentials, got {valid.status_code}"
+        assert AUTHORIZED_MESSAGE in valid.text
+        for response in (invalid, anonymous):
+            assert response.status_code == 401, f"Expected 401, got {response.status_code}"
+            assert response.headers.get("WWW-Authenticate", "").startswith("Basic")
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_basic_auth_credentials_matrix(self) -> None:
+        expected = {
+            ("admin", "admin"): 200,
+            ("admin", "wrong"): 401,
+            ("wrong", "admin"): 401,
+            ("wrong", "wrong"): 401,
+            ("admin", ""): 401,
+            ("", "admin"): 401,
+            ("ADMIN", "ADMIN"): 401,
+            ("", ""): 401,
+        }
+
+        results = check_basic_auth(urljoin(str(settings.BASE_URL), "basic_auth"), expected)
+
+        for result in results:
+            credentials = (result.username, result.password)
+            assert result.status_code == expected[credentials], f"Unexpected status code for credentials {credentials}"
+            if result.status_code == 200:
+                assert AUTHORIZED_MESSAGE in result.message
+            else:
+                assert "Not authorized" in result.message
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_digest_auth(self, api: AsyncApiClient) -> None:
+        valid, invalid = api.run(
+            api.gather(
+                [
+                    api.get("digest_auth", auth=HTTPDigestAuth("admin", "admin")),
+                    api.get("digest_auth", auth=HTTPDigestAuth("admin", "wrong")),
+                ]
+            )
+        )
+
+        assert valid.status_code == 200, f"Expected 200 with valid credentials, got {valid.status_code}"
+        assert AUTHORIZED_MESSAGE in valid.text
+        assert invalid.status_code == 401, f"Expected 401 with invalid credentials, got {invalid.status_code}"
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_digest_auth_credentials_matrix(self) -> None:
+        expected = {
+            ("admin", "admin"): 200,
+            ("wrong", "admin"): 401,
+            ("admin", "wrong"): 401,
+            ("wrong", "wrong"): 401,
+            ("admin", ""): 401,
+            ("", "admin"): 401,
+            ("ADMIN", "admin"): 401,
+            ("admin", "ADMIN"): 401,
+        }
+
+        results = get_digest_client(urljoin(str(settings.BASE_URL), "digest_auth")).check_all(expected)
+
+        for result in results:
+            credentials = (result.username, result.password)
+            assert result.status_code == expected[credentials], f"Unexpected status code for credentials {credentials}"
+            if result.status_code == 200:
+                assert AUTHORIZED_MESSAGE in result.message
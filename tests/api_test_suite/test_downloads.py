@@ -0,0 +1,32 @@
+import re
+
+import allure
+import pytest
+
+from src.utils.async_http import AsyncApiClient
+
+
+@allure.parent_suite("API Test Suite")
+@allure.suite("Files Download")
+@allure.sub_suite("Verify every listed file downloads completely")
+class TestDownloads:
+    """Tests the files listed on the File Download page"""
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_listed_files_download_completely(self, api: AsyncApiClient) -> None:
+        listing = api.run(api.get("download"))
+        assert listing.status_code == 200, f"GET /download returned {listing.status_code}"
+        links = sorted(set(re.findall(r'href="(download/[^"]+)"', listing.text)))
+        assert links, "Expected the File Download page to list files"
+
+        responses = api.run(api.gather(api.get(link) for link in links))
+
+        for link, response in zip(links, responses):
+            assert response.status_code == 200, f"GET /{link} returned {response.status_code}"
+            expected_size = response.headers.get("Content-Length")
+            if expected_size is not None and "Content-Encoding" not in response.headers:
+                assert len(response.content) == int(expected_size), (
+                    f"GET /{link} returned {len(response.content)} of {expected_size} bytes"
+                )
@@ -0,0 +1,43 @@
+from urllib.parse import urlsplit
+
+import allure
+import pytest
+
+from src.utils.async_http import AsyncApiClient
+
+
+@allure.parent_suite("API Test Suite")
+@allure.suite("Redirects")
+@allure.sub_suite("Verify the redirects of the form authentication flow")
+class TestRedirects:
+    """Tests the redirects of the form authentication flow"""
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_secure_area_redirects_anonymous_users_to_login(self, api: AsyncApiClient) -> None:
+        response = api.run(api.get("secure"))
+
+        assert response.redirects, "Expected /secure to redirect without a login"
+        assert all(300 <= status < 400 for status in response.redirects)
+        assert urlsplit(response.url).path == "/login", f"Expected to end on /login, got {response.url}"
+        assert "You must login to view the secure area!" in response.text
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_login_redirects_to_secure_area(self, api: AsyncApiClient) -> None:
+        response = api.run(api.post("authenticate", data={"username": "tomsmith", "password": "SuperSecretPassword!"}))
+
+        assert response.redirects, "Expected /authenticate to redirect"
+        assert urlsplit(response.url).path == "/secure", f"Expected to end on /secure, got {response.url}"
+        assert "You logged into a secure area!" in response.text
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_invalid_login_redirects_back_to_login(self, api: AsyncApiClient) -> None:
+        response = api.run(api.post("authenticate", data={"username": "wrong", "password": "wrong"}))
+
+        assert urlsplit(response.url).path == "/login", f"Expected to end on /login, got {response.url}"
+        assert "Your username is invalid!" in response.text
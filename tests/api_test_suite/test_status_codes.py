@@ -0,0 +1,34 @@
+import allure
+import pytest
+
+from src.pages.common.main_page.locators import MAIN_PAGE_LINK_PATHS
+from src.utils.async_http import AsyncApiClient
+
+
+@allure.parent_suite("API Test Suite")
+@allure.suite("Status Codes")
+@allure.sub_suite("Verify status codes and headers of the application pages")
+class TestStatusCodes:
+    """Tests status codes and headers of the application pages"""
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_feature_pages_respond_ok(self, api: AsyncApiClient) -> None:
+        paths = ["", *MAIN_PAGE_LINK_PATHS.values()]
+
+        responses = api.run(api.gather(api.get(path) for path in paths))
+
+        for path, response in zip(paths, responses):
+            assert response.status_code == 200, f"GET /{path} returned {response.status_code}"
+            assert response.headers.get("Content-Type", "").startswith("text/html"), (
+                f"GET /{path} returned Content-Type {response.headers.get('Content-Type')!r}"
+            )
+
+    @pytest.mark.api
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_unknown_page_is_not_found(self, api: AsyncApiClient) -> None:
+        response = api.run(api.get("this_page_does_not_exist"))
+
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
@@ -23,25 +23,15 @@ class TestCheckboxes(UiBaseCase):
         page = main_page.click_checkboxes_link()
 
         self.logger.info("Check checkboxes initial state.")
-        self.assert_false(
-            page.is_checkbox_checked(self.CHECKBOX_INDEX_0),
-            f"Expected checkbox {self.CHECKBOX_INDEX_0} to be unchecked",
-        )
-        self.assert_true(
-            page.is_checkbox_checked(self.CHECKBOX_INDEX_1),
-            f"Expected checkbox {self.CHECKBOX_INDEX_1} to be checked",
-        )
+        checkbox_0, checkbox_1 = page.get_checkboxes_checked([self.CHECKBOX_INDEX_0, self.CHECKBOX_INDEX_1])
+        self.assert_false(checkbox_0, f"Expected checkbox {self.CHECKBOX_INDEX_0} to be unchecked")
+        self.assert_true(checkbox_1, f"Expected checkbox {self.CHECKBOX_INDEX_1} to be checked")
 
         self.logger.info("Set checkboxes new state.")
         page.set_checkbox(self.CHECKBOX_INDEX_0, True)
         page.set_checkbox(self.CHECKBOX_INDEX_1, False)
 
         self.logger.info("Check checkboxes new state.")
-        self.assert_true(
-            page.is_checkbox_checked(self.CHECKBOX_INDEX_0),
-            f"Expected checkbox {self.CHECKBOX_INDEX_0} to be checked",
-        )
-        self.assert_false(
-            page.is_checkbox_checked(self.CHECKBOX_INDEX_1),
-            f"Expected checkbox {self.CHECKBOX_INDEX_1} to be unchecked",
-        )
+        checkbox_0, checkbox_1 = page.get_checkboxes_checked([self.CHECKBOX_INDEX_0, self.CHECKBOX_INDEX_1])
+        self.assert_true(checkbox_0, f"Expected checkbox {self.CHECKBOX_INDEX_0} to be checked")
+        self.assert_false(checkbox_1, f"Expected checkbox {self.CHECKBOX_INDEX_1} to be unchecked")
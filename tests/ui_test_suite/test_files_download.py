@@ -1,5 +1,3 @@
-import os
-
 import allure
 import pytest
 
@@ -17,10 +15,6 @@ class TestFilesDownload(UiBaseCase):
     @pytest.mark.regression
     @pytest.mark.ui
     @allure.severity(allure.severity_level.NORMAL)
-    @pytest.mark.skipif(
-        os.getenv("BROWSER") == "firefox",
-        reason="Skipping file download test for Firefox due to slow downloading process",
-    )
     def test_files_download_functionality(self) -> None:
         self.logger.info("Tests Files Download.")
 
@@ -1,3 +1,5 @@
+from itertools import islice
+
 import allure
 import pytest
 
@@ -19,18 +21,19 @@ class TestInfiniteScroll(UiBaseCase):
         main_page = MainPage(self)
         page = main_page.click_infinite_scroll_link()
 
-        for _ in range(5):
-            self.logger.info("Getting old page height.")
-            old_height = page.get_page_height()
+        self.logger.info("Getting old page height.")
+        old_height = page.get_page_height()
 
-            self.logger.info("Scrolling to bottom of page.")
-            page.scroll_to_bottom_of_page()
+        self.logger.info("Scrolling until five chunks of paragraphs have loaded.")
+        chunks = list(islice(page.iter_loaded_paragraphs(), 5))
 
-            self.logger.info("Getting new page height.")
-            new_height = page.get_page_height()
+        self.assert_equal(5, len(chunks), f"Expected 5 chunks of paragraphs to load, but got {len(chunks)}")
+        for chunk in chunks:
+            self.assert_true(all(chunk), f"Expected every loaded paragraph to have text, but got {chunk}")
 
-            self.logger.info("Verifying new page height is bigger than old page height.")
-            self.assert_true(
-                old_height < new_height,
-                f"Expected 'old height < new height', but got 'old height: {old_height}, new height: {new_height}'",
-            )
+        self.logger.info("Verifying new page height is bigger than old page height.")
+        new_height = page.get_page_height()
+        self.assert_true(
+            old_height < new_height,
+            f"Expected 'old height < new height', but got 'old height: {old_height}, new height: {new_height}'",
+        )
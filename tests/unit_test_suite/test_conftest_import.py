@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Runs in a fresh interpreter: this process has built the settings already
+CHECK_IMPORT = """
+import conftest
+from src.config.project_config import get_settings, page_settings
+
+print(get_settings.cache_info().currsize, page_settings.cache_info().currsize)
+"""
+
+
+@allure.parent_suite("Unit Test Suite")
+@allure.suite("Settings")
+@allure.sub_suite("Verify settings are built lazily")
+class TestConftestImport:
+    """Tests that importing the root conftest does no settings work"""
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_importing_conftest_does_not_build_settings(self) -> None:
+        result = subprocess.run(
+            [sys.executable, "-c", CHECK_IMPORT],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["0", "0"], f"Expected no settings to be built, but got {result.stdout!r}"
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import allure
+import pytest
+
+from src.utils.download_watcher import DownloadWatcher
+
+
+@allure.parent_suite("Unit Test Suite")
+@allure.suite("Download Watcher")
+@allure.sub_suite("Verify only downloads made while watching count")
+class TestDownloadWatcher:
+    """Tests which files the download watcher reports as finished downloads"""
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("use_inotify", [True, False], ids=["inotify", "polling"])
+    def test_files_present_before_watching_are_not_downloads(self, tmp_path: Path, use_inotify: bool) -> None:
+        (tmp_path / "earlier.txt").write_text("from an earlier test")
+        watcher = DownloadWatcher(str(tmp_path), use_inotify=use_inotify)
+        try:
+            assert watcher.wait_for_files(["earlier.txt"], timeout=0.5) == {}
+
+            (tmp_path / "new.txt.part").write_text("new")
+            (tmp_path / "new.txt.part").rename(tmp_path / "new.txt")
+            (tmp_path / "earlier.txt").write_text("downloaded again")
+            assert set(watcher.wait_for_files(["new.txt", "earlier.txt"], timeout=5)) == {"new.txt", "earlier.txt"}
+
+            watcher.reset()
+            assert watcher.wait_for_files(["new.txt", "earlier.txt"], timeout=0.5) == {}
+        finally:
+            watcher.close()
@@ -0,0 +1,129 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import allure
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Each test sleeps for its stored duration. Collection order is not cost order, so only the
+# duration history can put TestLong first.
+SCRATCH_TESTS = """
+import os
+import time
+
+import pytest
+
+DURATIONS = {durations!r}
+
+
+def run(request):
+    with open(os.environ["RUN_LOG"], "a", encoding="utf-8") as log:
+        log.write(f"{{os.environ['PYTEST_XDIST_WORKER']}} {{request.node.nodeid}}\\n")
+    time.sleep(DURATIONS[request.node.nodeid])
+
+
+class TestMediumA:
+    @pytest.mark.parametrize("n", [1, 2])
+    def test_medium_a(self, request, n):
+        run(request)
+
+
+class TestShort:
+    def test_short(self, request):
+        run(request)
+
+
+class TestMediumB:
+    @pytest.mark.parametrize("n", [1, 2])
+    def test_medium_b(self, request, n):
+        run(request)
+
+
+class TestLong:
+    def test_long(self, request):
+        run(request)
+"""
+
+# Units of 2.5 s, 0.5 s, 0.5 s and 0.05 s: the best split on two workers is the long unit
+# (plus the short one) on one worker and both medium units on the other
+DURATIONS = {
+    "test_units.py::TestMediumA::test_medium_a[1]": 0.25,
+    "test_units.py::TestMediumA::test_medium_a[2]": 0.25,
+    "test_units.py::TestShort::test_short": 0.05,
+    "test_units.py::TestMediumB::test_medium_b[1]": 0.25,
+    "test_units.py::TestMediumB::test_medium_b[2]": 0.25,
+    "test_units.py::TestLong::test_long": 2.5,
+}
+
+
+def unit_of(nodeid: str) -> str:
+    return nodeid.rsplit("::", 1)[0]
+
+
+@allure.parent_suite("Unit Test Suite")
+@allure.suite("Duration Scheduling")
+@allure.sub_suite("Verify work units are scheduled whole and longest first")
+class TestDurationScheduling:
+    """Tests the duration-aware xdist scheduler in a scratch project"""
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_workers_run_whole_units_balanced_by_duration(self, tmp_path: Path) -> None:
+        (tmp_path / "test_units.py").write_text(SCRATCH_TESTS.format(durations=DURATIONS), encoding="utf-8")
+        store = tmp_path / "durations.json"
+        store.write_text(json.dumps({"chrome": DURATIONS}), encoding="utf-8")
+        run_log = tmp_path / "run.log"
+        env = {key: value for key, value in os.environ.items() if not key.startswith("PYTEST_")}
+        env.update(PYTHONPATH=str(PROJECT_ROOT), RUN_LOG=str(run_log))
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "-q",
+                "-p",
+                "no:cacheprovider",
+                "-p",
+                "src.utils.duration_scheduler",
+                "-n",
+                "2",
+                "--duration-scheduling",
+                f"--duration-store={store}",
+                "--browser=chrome",
+            ],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+
+        ran_by_worker: dict[str, list[str]] = defaultdict(list)
+        for line in run_log.read_text(encoding="utf-8").splitlines():
+            worker, nodeid = line.split(" ", 1)
+            ran_by_worker[worker].append(nodeid)
+
+        ran = sorted(nodeid for nodeids in ran_by_worker.values() for nodeid in nodeids)
+        assert ran == sorted(DURATIONS), f"Expected every test to run exactly once, but got {ran}"
+        for unit in {unit_of(nodeid) for nodeid in DURATIONS}:
+            workers = {worker for worker, nodeids in ran_by_worker.items() if unit in map(unit_of, nodeids)}
+            assert len(workers) == 1, f"Expected {unit} to run on one worker, but it ran on {sorted(workers)}"
+
+        units_by_worker = sorted(sorted(dict.fromkeys(map(unit_of, nodeids))) for nodeids in ran_by_worker.values())
+        assert units_by_worker == [
+            ["test_units.py::TestLong", "test_units.py::TestShort"],
+            ["test_units.py::TestMediumA", "test_units.py::TestMediumB"],
+        ], f"Expected the long unit to share a worker only with the short one, but got {units_by_worker}"
+
+        longest = "test_units.py::TestLong::test_long"
+        worker_nodeids = next(nodeids for nodeids in ran_by_worker.values() if longest in nodeids)
+        assert worker_nodeids[0] == longest, (
+            f"Expected the longest unit to run first, but its worker ran {worker_nodeids}"
+        )
@@ -0,0 +1,39 @@
+import hashlib
+from pathlib import Path
+from urllib.parse import urljoin
+
+import allure
+import pytest
+
+from src.replica import ReplicaApp, create_server
+from src.utils.http_downloads import HttpDownloader
+
+
+@allure.parent_suite("Unit Test Suite")
+@allure.suite("HTTP Downloads")
+@allure.sub_suite("Verify concurrent downloads into one folder")
+class TestHttpDownloads:
+    """Tests concurrent HTTP downloads against the offline replica"""
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_links_with_the_same_file_name_download_concurrently(self, tmp_path: Path) -> None:
+        data = bytes(range(256)) * 16 * 1024  # 4 MiB, so the streams overlap
+        server = create_server()
+        assert isinstance(server.handler, ReplicaApp)
+        server.handler.uploads["big.bin"] = data
+        server.start()
+        # Distinct URLs, one destination file name
+        urls = [urljoin(server.base_url, f"download/big.bin?copy={copy}") for copy in range(8)]
+        try:
+            with HttpDownloader(max_workers=8) as downloader:
+                report = downloader.download_all(
+                    urls, tmp_path, expected_sha256={"big.bin": hashlib.sha256(data).hexdigest()}
+                )
+        finally:
+            server.stop()
+
+        assert report.failures == {}, f"Expected no failed downloads, but got {report.failures}"
+        assert len(report.downloads) == len(urls)
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["big.bin"]
+        assert (tmp_path / "big.bin").read_bytes() == data
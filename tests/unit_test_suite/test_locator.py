@@ -0,0 +1,21 @@
+import allure
+import pytest
+
+from src.pages.base.locator import Locator
+
+
+@allure.parent_suite("Unit Test Suite")
+@allure.suite("Locator")
+@allure.sub_suite("Verify formatted locators match str.format")
+class TestLocatorFormat:
+    """Tests formatting of locator selector templates"""
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("value", [1, 1.0, True, "1"])
+    def test_equal_values_of_different_types_are_not_shared(self, value: object) -> None:
+        template = "a:nth-of-type({i})"
+        for other in (1, 1.0, True, "1"):  # Fill the interning cache with every equal-valued variant
+            Locator(template).format(i=other)
+
+        assert Locator(template).format(i=value).selector == template.format(i=value)
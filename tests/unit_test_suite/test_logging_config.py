@@ -0,0 +1,73 @@
+import json
+import logging
+from pathlib import Path
+
+import allure
+import pytest
+
+from src.config.logging_config import BatchedRotatingFileHandler, merge_worker_logs
+
+
+def write_records(path: Path, created: list[float]) -> None:
+    path.write_text("".join(json.dumps({"created": c, "message": f"{path.name} {c}"}) + "\n" for c in created))
+
+
+def handler(path: Path, max_bytes: int) -> BatchedRotatingFileHandler:
+    file_handler = BatchedRotatingFileHandler(path, max_bytes=max_bytes, backup_count=3)
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    return file_handler
+
+
+@allure.parent_suite("Unit Test Suite")
+@allure.suite("Logging")
+@allure.sub_suite("Verify batched worker log files and their merge")
+class TestLoggingConfig:
+    """Tests the per-worker log file handler and the merge of the workers' files"""
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_records_stay_buffered_until_flushed(self, tmp_path: Path) -> None:
+        path = tmp_path / "test_logs.gw0.jsonl"
+        file_handler = handler(path, max_bytes=10 * 1024 * 1024)
+
+        for i in range(20):
+            file_handler.emit(logging.makeLogRecord({"msg": f"record {i}"}))
+        assert path.stat().st_size == 0, "Expected records to stay in the write buffer until flushed"
+
+        file_handler.close()
+        assert len(path.read_text().splitlines()) == 20
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_files_rotate_at_max_bytes(self, tmp_path: Path) -> None:
+        path = tmp_path / "test_logs.gw0.jsonl"
+        file_handler = handler(path, max_bytes=100)
+
+        for i in range(12):
+            file_handler.emit(logging.makeLogRecord({"msg": f"record {i:02d} " + "x" * 20}))
+        file_handler.close()
+
+        files = sorted(tmp_path.iterdir())
+        assert [f.name for f in files] == [path.name, f"{path.name}.1", f"{path.name}.2", f"{path.name}.3"]
+        assert all(f.stat().st_size <= 100 for f in files), {f.name: f.stat().st_size for f in files}
+        # The newest records are in the current file, the oldest kept ones in the last backup
+        assert path.read_text().splitlines()[-1].startswith("record 11")
+        assert (tmp_path / f"{path.name}.3").read_text().splitlines()[0].startswith("record 00")
+
+    @pytest.mark.regression
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_merge_orders_records_across_workers_and_backups(self, tmp_path: Path) -> None:
+        # Higher backup numbers hold older records
+        write_records(tmp_path / "test_logs.gw0.jsonl.2", [1.0, 4.0])
+        write_records(tmp_path / "test_logs.gw0.jsonl.1", [5.0, 8.0])
+        write_records(tmp_path / "test_logs.gw0.jsonl", [9.0, 12.0])
+        write_records(tmp_path / "test_logs.gw1.jsonl.1", [2.0, 6.0])
+        write_records(tmp_path / "test_logs.gw1.jsonl", [7.0, 11.0])
+        write_records(tmp_path / "test_logs.gw2.jsonl", [3.0, 10.0])
+        destination = tmp_path / "merged.jsonl"
+
+        written = merge_worker_logs(tmp_path, destination)
+
+        created = [json.loads(line)["created"] for line in destination.read_text().splitlines()]
+        assert written == 12
+        assert created == [float(n) for n in range(1, 13)], f"Expected records in time order, but got {created}"